@@ -0,0 +1,191 @@
+import asyncio
+import concurrent.futures
+import threading
+
+from engine import STOPPED, TypingEngine
+
+
+class LoopHost:
+    # The one asyncio event loop of the process, running on one daemon
+    # thread. Every AsyncTypingEngine schedules its runs here, so the waits
+    # between sends cost no OS threads and starting a run never creates one.
+    # The sends themselves block on the backend and run on the engine's
+    # injector thread, never on the loop.
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="typing-loop", daemon=True)
+        self.thread.start()
+
+    @classmethod
+    def get(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def submit(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call(self, callback, *args):
+        self.loop.call_soon_threadsafe(callback, *args)
+
+
+class RunHandle:
+    # One run of an engine. `started` resolves once the previous run of the
+    # same engine has fully ended and this one owns the engine; `finished`
+    # resolves with FINISHED, STOPPED or FAILED when it ends, or with the
+    # exception if it failed with no on_error set. Both are
+    # concurrent.futures.Future, so they can be waited on from any thread,
+    # and the handle itself can be awaited from any event loop.
+    def __init__(self, engine, mode, count):
+        self.engine = engine
+        self.mode = mode
+        self.count = count
+        self.started = concurrent.futures.Future()
+        self.finished = None
+        self.task = None
+        self.stopping = False
+
+    def stop(self):
+        # Returns `finished`; the run is over only once it resolves
+        self.engine.host.call(self._cancel)
+        return self.finished
+
+    def _cancel(self):
+        # Once only: a second cancel would cut short the wait for a send
+        # that is still running
+        if self.stopping:
+            return
+        self.stopping = True
+        if self.task is not None:
+            self.task.cancel()
+
+    def done(self):
+        return self.finished.done()
+
+    def wait(self, timeout=None):
+        return self.finished.result(timeout)
+
+    def __await__(self):
+        return asyncio.wrap_future(self.finished).__await__()
+
+
+class AsyncTypingEngine(TypingEngine):
+    # TypingEngine whose runs are tasks on the shared LoopHost instead of a
+    # new thread per Start. The send loop itself is TypingEngine.typing_steps,
+    # so scheduling, limiting and injection behave exactly the same; only
+    # the waiting is done with asyncio.sleep, which a Stop cancels at once.
+    # Each step of the generator (the send, and with it the inject_lock a
+    # JobRunner may be holding) runs on one injector thread per engine,
+    # created with the first run, so a long send never stalls the other
+    # runs on the loop and cProfile keeps seeing the same thread.
+    def __init__(self, *args, host=None, **options):
+        super().__init__(*args, **options)
+        self.host = host
+        self.handle = None
+        self.injector = None
+
+    def is_running(self):
+        handle = self.handle
+        return handle is not None and not handle.done()
+
+    def start(self, mode="infinite", count=None):
+        self.prepare()
+        if self.host is None:
+            self.host = LoopHost.get()
+        previous = self.handle
+        if self.is_running():
+            self.stop()
+        handle = RunHandle(self, mode, count)
+        handle.finished = self.host.submit(self.run_async(handle, previous))
+        # Published only once complete: the control server's thread reads
+        # it through is_running() and stop()
+        self.handle = handle
+        return handle
+
+    def stop(self):
+        if not self.stop_event.is_set():
+            self.stop_requested_ns = self.clock()
+        self.stop_event.set()
+        if self.handle is not None:
+            self.handle.stop()
+
+    async def run_async(self, handle, previous):
+        handle.task = asyncio.current_task()
+        try:
+            if previous is not None:
+                # Start never overlaps the run it replaces. How that run
+                # ended is reported through its own handle.
+                try:
+                    await asyncio.wrap_future(previous.finished)
+                except Exception:
+                    pass
+            if handle.stopping:
+                raise asyncio.CancelledError
+            self.current_count = 0
+            self.lateness.reset()
+            self.stop_requested_ns = None
+            self.stop_event.clear()
+            handle.started.set_result(None)
+            return await self.drive(handle)
+        except asyncio.CancelledError:
+            handle.started.cancel()
+            if not handle.stopping:
+                raise
+            return STOPPED
+
+    async def drive(self, handle):
+        loop = asyncio.get_running_loop()
+        if self.injector is None:
+            self.injector = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix="typing-inject")
+        injector = self.injector
+        steps = self.typing_steps(handle.mode, handle.count)
+        step = None
+        try:
+            while True:
+                step = injector.submit(_advance, steps)
+                finished, value = await asyncio.wrap_future(step)
+                if finished:
+                    return value
+                await asyncio.sleep(value)
+        finally:
+            if step is not None and not step.done():
+                # Stopped mid-send: cancelling cannot interrupt the thread,
+                # stop_event ends the send at its next chunk, and the
+                # generator cannot be closed before that
+                await asyncio.wait({asyncio.wrap_future(step)})
+            await loop.run_in_executor(injector, self.close_steps, steps)
+            if self.stop_requested_ns is not None:
+                last = self.last_emit_ns or 0
+                self.stop_latency.record(last - self.stop_requested_ns)
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.stop()
+            try:
+                self.handle.wait()
+            except Exception:
+                pass
+        if self.injector is not None:
+            self.injector.shutdown()
+            self.injector = None
+        self.template.close()
+        if self.playlist is not None:
+            self.playlist.close()
+
+    def close_steps(self, steps):
+        # On the injector thread, where cProfile was switched on
+        steps.close()
+        if self.instrumentation is not None:
+            self.instrumentation.release()
+
+
+def _advance(steps):
+    # One step of typing_steps: (False, seconds to wait) or (True, result)
+    try:
+        return False, next(steps)
+    except StopIteration as end:
+        return True, end.value
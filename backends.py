@@ -0,0 +1,739 @@
+import os
+import re
+import sys
+import threading
+import time
+from collections import namedtuple
+
+# Cost model of a backend. per_send_s is the fixed cost of one text+Enter
+# send regardless of length, per_key_s the marginal cost of each character,
+# batched tells whether a whole send reaches the display server in one flush.
+ThroughputProfile = namedtuple(
+    "ThroughputProfile",
+    ["per_send_s", "per_key_s", "batched", "platforms"],
+)
+
+
+class Backend:
+    name = "base"
+    profile = ThroughputProfile(0.0, 0.0, False, ())
+
+    @classmethod
+    def available(cls):
+        return sys.platform.startswith(cls.profile.platforms)
+
+    def type_text(self, text):
+        raise NotImplementedError
+
+    def press_enter(self):
+        raise NotImplementedError
+
+    def hotkey(self, *keys):
+        # Press keys in order and release them in reverse, e.g. ("ctrl", "v")
+        raise NotImplementedError
+
+    def send(self, text):
+        self.type_text(text)
+        self.press_enter()
+
+    # A text is translated to keys once by compile() and the result replayed
+    # by send_compiled() and, in slices, type_compiled(). The base form is
+    # the text itself; backends that resolve characters to keycodes return a
+    # list with one entry per character instead. A compiled text stays valid
+    # while layout_version() returns the same value.
+    def compile(self, text):
+        return text
+
+    def type_compiled(self, keys):
+        self.type_text(keys)
+
+    def send_compiled(self, keys):
+        self.send(keys)
+
+    def send_many(self, sends, stop_event):
+        # Compiled sends back to back, stopping between two of them once
+        # stop_event is set; returns how many went out. Backends that batch
+        # override this to flush once for the lot.
+        for sent, keys in enumerate(sends):
+            if stop_event.is_set():
+                return sent
+            self.send_compiled(keys)
+        return len(sends)
+
+    def layout_version(self):
+        return 0
+
+    def can_type(self, text):
+        # False when some character would be dropped, so the engine pastes
+        # the text instead
+        return True
+
+    def estimated_send_time(self, text):
+        return self.profile.per_send_s + self.profile.per_key_s * (len(text) + 1)
+
+    def close(self):
+        pass
+
+
+class PyAutoGUIBackend(Backend):
+    name = "pyautogui"
+    # One PAUSE sleep after Enter at pyautogui's default of 0.1 s; text chunks
+    # skip the pause so chunked typing does not pay it per chunk
+    profile = ThroughputProfile(0.1, 0.002, False, ("win32", "darwin", "linux"))
+
+    def __init__(self, pause=None):
+        import pyautogui
+        self.pyautogui = pyautogui
+        if pause is not None:
+            pyautogui.PAUSE = pause
+        self.profile = self.profile._replace(per_send_s=pyautogui.PAUSE)
+
+    @classmethod
+    def available(cls):
+        try:
+            import pyautogui  # noqa: F401
+        except Exception:
+            return False
+        return True
+
+    def type_text(self, text):
+        self.pyautogui.typewrite(text, _pause=False)
+
+    def press_enter(self):
+        self.pyautogui.press("enter")
+
+    def hotkey(self, *keys):
+        self.pyautogui.hotkey(*keys)
+
+    def send_many(self, sends, stop_event):
+        # Enter typed as "\n" within typewrite skips the PAUSE sleep that
+        # press("enter") takes after every send
+        for sent, text in enumerate(sends):
+            if stop_event.is_set():
+                return sent
+            self.pyautogui.typewrite(text + "\n", _pause=False)
+        return len(sends)
+
+    def can_type(self, text):
+        # typewrite skips anything missing from the platform's key table
+        is_valid = self.pyautogui.isValidKey
+        return all(is_valid(char) for char in set(text))
+
+
+# Keysyms for pyautogui-style modifier names (XK_Control_L and friends)
+_X11_MODIFIERS = {
+    "ctrl": 0xFFE3, "shift": 0xFFE1, "alt": 0xFFE9, "command": 0xFFEB, "enter": 0xFF0D,
+}
+# Characters whose keysym is not their code point (XK_Return, XK_Tab)
+_X11_CONTROL_KEYSYMS = {"\n": 0xFF0D, "\t": 0xFF09}
+# Shift levels read from the keyboard mapping, and the modifiers reaching
+# the third and fifth columns (XK_Mode_switch, XK_ISO_Level3_Shift)
+_X11_LEVELS = 6
+_XK_MODE_SWITCH = 0xFF7E
+_XK_ISO_LEVEL3_SHIFT = 0xFE03
+
+
+def _x11_char(keysym):
+    # The character a keysym types. Latin-1 and the currency signs equal
+    # their code point and the rest of Unicode has its own keysym range;
+    # other legacy keysyms are left to remapping.
+    if 0x20 <= keysym <= 0xFF and keysym != 0x7F or 0x20A0 <= keysym <= 0x20AC:
+        return chr(keysym)
+    if keysym & 0xFF000000 == 0x01000000:
+        return chr(keysym & 0xFFFFFF)
+    return None
+
+
+class XTestBackend(Backend):
+    name = "xtest"
+    profile = ThroughputProfile(0.0005, 0.00002, True, ("linux",))
+
+    def __init__(self, display_name=None):
+        from Xlib import X, XK, display
+        from Xlib.ext import xtest
+        self.X = X
+        self.XK = XK
+        self.xtest = xtest
+        self.display = display.Display(display_name)
+        # Spare keycodes bound to keysyms the layout lacks, oldest first
+        self.remapped = {}
+        self.generation = 0
+        self.load_layout()
+
+    @classmethod
+    def available(cls):
+        if not sys.platform.startswith("linux") or not os.environ.get("DISPLAY"):
+            return False
+        try:
+            import Xlib.ext.xtest  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def load_layout(self):
+        # Reads the whole keyboard mapping in one request: every keysym the
+        # active layout produces, with its keycode and the modifier keys to
+        # hold, plus the keycodes that produce nothing
+        info = self.display.display.info
+        first = info.min_keycode
+        mapping = self.display.get_keyboard_mapping(first, info.max_keycode - first + 1)
+        # A layout switch wipes our bindings along with everything else
+        self.remapped = {
+            keycode: keysym for keycode, keysym in self.remapped.items()
+            if list(mapping[keycode - first][:1]) == [keysym]
+        }
+        columns = {}
+        self.spare = []
+        for offset, keysyms in enumerate(mapping):
+            keycode = first + offset
+            if not any(keysyms):
+                self.spare.append(keycode)
+            for column, keysym in enumerate(keysyms[:_X11_LEVELS]):
+                if keysym and (keysym not in columns or column < columns[keysym][1]):
+                    columns[keysym] = (keycode, column)
+        plain = {keysym: keycode for keysym, (keycode, column) in columns.items() if column == 0}
+        shift = plain.get(self.XK.XK_Shift_L)
+        mode_switch = plain.get(_XK_MODE_SWITCH)
+        level3 = plain.get(_XK_ISO_LEVEL3_SHIFT)
+        # Column 1 is Shift, 2-3 the Mode_switch group, 4-5 AltGr
+        levels = ((), (shift,), (mode_switch,), (mode_switch, shift), (level3,), (level3, shift))
+        self.layout = {}
+        self.chars = {}
+        for keysym, (keycode, column) in sorted(columns.items(), key=lambda item: item[1][1]):
+            modifiers = levels[column]
+            if None not in modifiers:
+                key = self.layout[keysym] = (keycode, modifiers)
+                char = _x11_char(keysym)
+                if char is not None:
+                    self.chars.setdefault(char, key)
+        for char, keysym in _X11_CONTROL_KEYSYMS.items():
+            if keysym in self.layout:
+                self.chars[char] = self.layout[keysym]
+        self.keys = {}
+        self.return_events = self.events_for(self.layout[self.XK.XK_Return])
+
+    def layout_version(self):
+        # A layout switch arrives as MappingNotify; the notifications for our
+        # own single-keycode bindings are not one
+        display = self.display
+        X = self.X
+        changed = False
+        while display.pending_events():
+            event = display.next_event()
+            if event.type != X.MappingNotify:
+                continue
+            display.refresh_keyboard_mapping(event)
+            if event.request == X.MappingKeyboard and not (
+                    event.count == 1 and event.first_keycode in self.remapped):
+                changed = True
+        if changed:
+            self.load_layout()
+            self.generation += 1
+        return self.generation
+
+    def keysym_for(self, char):
+        keysym = _X11_CONTROL_KEYSYMS.get(char) or self.XK.string_to_keysym(char)
+        if keysym:
+            return keysym
+        # Latin-1 keysyms equal their code point, everything else lives in
+        # the Unicode keysym range
+        code = ord(char)
+        return code if code < 0x100 else 0x01000000 | code
+
+    def events_for(self, key):
+        keycode, modifiers = key
+        X = self.X
+        return (
+            tuple((X.KeyPress, modifier) for modifier in modifiers)
+            + ((X.KeyPress, keycode), (X.KeyRelease, keycode))
+            + tuple((X.KeyRelease, modifier) for modifier in reversed(modifiers))
+        )
+
+    def remap(self, keysym, pinned):
+        # Binds a keysym the layout lacks to a spare keycode until close().
+        # With none left the oldest binding not used by the text being
+        # compiled is taken over, which makes earlier compiled texts stale.
+        if self.spare:
+            keycode = self.spare.pop()
+        else:
+            keycode = next((code for code in self.remapped if code not in pinned), None)
+            if keycode is None:
+                raise RuntimeError("Text has more unmapped characters than the keyboard has spare keycodes")
+            self.layout.pop(self.remapped.pop(keycode), None)
+            self.keys = {char: events for char, events in self.keys.items() if events[0][1] != keycode}
+            self.generation += 1
+        self.display.change_keyboard_mapping(keycode, [(keysym, keysym)])
+        self.remapped[keycode] = keysym
+        self.layout[keysym] = (keycode, ())
+        return keycode
+
+    def can_type(self, text):
+        # Anything can be remapped, up to one spare keycode per character
+        missing = {char for char in set(text) if char not in self.keys and char not in self.chars}
+        return len(missing) <= len(self.spare) + len(self.remapped)
+
+    def compile(self, text):
+        # One tuple of (event type, keycode) per character, ready for
+        # fake_input. Each character is looked up once per layout.
+        keys = self.keys
+        compiled = []
+        pinned = set()
+        remapped = False
+        for char in text:
+            events = keys.get(char)
+            if events is None:
+                key = self.chars.get(char)
+                if key is None:
+                    key = (self.remap(self.keysym_for(char), pinned), ())
+                    remapped = True
+                    keys = self.keys
+                events = keys[char] = self.events_for(key)
+            # The keycode itself, after any modifier presses
+            pinned.add(events[len(events) // 2 - 1][1])
+            compiled.append(events)
+        if remapped:
+            # Let clients see the new bindings before any key uses them
+            self.display.sync()
+        return compiled
+
+    def queue_compiled(self, keys):
+        display = self.display
+        fake_input = self.xtest.fake_input
+        for events in keys:
+            for event_type, keycode in events:
+                fake_input(display, event_type, keycode)
+
+    def type_compiled(self, keys):
+        self.queue_compiled(keys)
+        self.display.sync()
+
+    def send_compiled(self, keys):
+        self.queue_compiled(keys)
+        self.queue_compiled((self.return_events,))
+        self.display.sync()
+
+    def send_many(self, sends, stop_event):
+        # Queued in the client until the one sync at the end
+        queued = 0
+        for keys in sends:
+            if stop_event.is_set():
+                break
+            self.queue_compiled(keys)
+            self.queue_compiled((self.return_events,))
+            queued += 1
+        self.display.sync()
+        return queued
+
+    def type_text(self, text):
+        self.type_compiled(self.compile(text))
+
+    def press_enter(self):
+        self.type_compiled((self.return_events,))
+
+    def send(self, text):
+        self.send_compiled(self.compile(text))
+
+    def hotkey(self, *keys):
+        X, fake_input = self.X, self.xtest.fake_input
+        keycodes = []
+        for key in keys:
+            keysym = _X11_MODIFIERS.get(key) or self.keysym_for(key)
+            entry = self.layout.get(keysym)
+            keycodes.append(entry[0] if entry else self.display.keysym_to_keycode(keysym))
+        for keycode in keycodes:
+            fake_input(self.display, X.KeyPress, keycode)
+        for keycode in reversed(keycodes):
+            fake_input(self.display, X.KeyRelease, keycode)
+        self.display.sync()
+
+    def close(self):
+        # Give the borrowed keycodes back their empty mapping
+        for keycode in self.remapped:
+            self.display.change_keyboard_mapping(keycode, [(0, 0)])
+        self.remapped = {}
+        self.display.sync()
+        self.display.close()
+
+
+def client_windows(display):
+    # Top-level application windows: the window manager's client list when
+    # there is one, otherwise every window carrying WM_STATE, otherwise (no
+    # window manager at all) the named children of the root
+    from Xlib import X
+    root = display.screen().root
+    clients = root.get_full_property(display.intern_atom("_NET_CLIENT_LIST"), X.AnyPropertyType)
+    if clients is not None:
+        return [display.create_resource_object("window", window_id) for window_id in clients.value]
+    wm_state = display.intern_atom("WM_STATE")
+    found, stack = [], [root]
+    while stack:
+        for child in stack.pop().query_tree().children:
+            if child.get_full_property(wm_state, X.AnyPropertyType) is not None:
+                found.append(child)
+            else:
+                stack.append(child)
+    if found:
+        return found
+    return [child for child in root.query_tree().children if window_name(display, child)]
+
+
+def window_name(display, window):
+    name = window.get_full_text_property(display.intern_atom("_NET_WM_NAME"))
+    return name or window.get_wm_name() or ""
+
+
+def find_windows(display, spec):
+    # spec is a comma separated list of window ids (0x2a00007 or decimal)
+    # and title patterns (case-insensitive regular expressions)
+    windows = []
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            windows.append(display.create_resource_object("window", int(part, 0)))
+            continue
+        except ValueError:
+            pass
+        pattern = re.compile(part, re.IGNORECASE)
+        matches = [window for window in client_windows(display) if pattern.search(window_name(display, window))]
+        if not matches:
+            raise ValueError(f"No window title matches {part!r}")
+        windows.extend(matches)
+    if not windows:
+        raise ValueError("No target window given")
+    return windows
+
+
+def pick_window(display):
+    # Waits for a click anywhere on the screen, like xwininfo, and returns
+    # the application window under it
+    from Xlib import X, Xcursorfont
+    root = display.screen().root
+    font = display.open_font("cursor")
+    cursor = font.create_glyph_cursor(
+        font, Xcursorfont.crosshair, Xcursorfont.crosshair + 1, (65535, 65535, 65535), (0, 0, 0)
+    )
+    grabbed = root.grab_pointer(
+        False, X.ButtonPressMask, X.GrabModeAsync, X.GrabModeAsync, X.NONE, cursor, X.CurrentTime
+    )
+    if grabbed != X.GrabSuccess:
+        raise RuntimeError("Cannot grab the pointer to pick a window")
+    try:
+        while True:
+            event = display.next_event()
+            if event.type == X.ButtonPress:
+                break
+    finally:
+        display.ungrab_pointer(X.CurrentTime)
+        display.flush()
+    if not getattr(event.child, "id", event.child):
+        return root
+    # The click lands on the window manager's frame; the client is inside
+    wm_state = display.intern_atom("WM_STATE")
+    stack = [event.child]
+    while stack:
+        window = stack.pop(0)
+        if window.get_full_property(wm_state, X.AnyPropertyType) is not None:
+            return window
+        stack.extend(window.query_tree().children)
+    return event.child
+
+
+class XWindowBackend(XTestBackend):
+    # Delivers keys to chosen windows rather than to whatever has focus, so
+    # the desktop stays usable while typing and one engine can feed several
+    # windows. The "send" strategy uses XSendEvent and never touches focus;
+    # some programs ignore such synthetic events (xterm unless
+    # allowSendEvents is on), and for those "focus" gives the window focus
+    # for the length of one send, types through XTest and puts focus back.
+    #
+    # Windows come from window= or TEXTTYPER_WINDOW (see find_windows); with
+    # neither, the first window clicked is picked. They are resolved once.
+    name = "xwindow"
+    profile = ThroughputProfile(0.0005, 0.00003, True, ("linux",))
+    strategies = ("send", "focus")
+
+    def __init__(self, display_name=None, window=None, strategy=None):
+        super().__init__(display_name)
+        try:
+            from Xlib.protocol import event
+            self.event = event
+            self.strategy = strategy or os.environ.get("TEXTTYPER_WINDOW_STRATEGY", "send")
+            if self.strategy not in self.strategies:
+                raise ValueError(
+                    f"Unknown window strategy {self.strategy!r}, expected one of {', '.join(self.strategies)}"
+                )
+            self.root = self.display.screen().root
+            spec = window or os.environ.get("TEXTTYPER_WINDOW")
+            self.windows = find_windows(self.display, spec) if spec else [pick_window(self.display)]
+        except BaseException:
+            self.display.close()
+            raise
+
+    def load_layout(self):
+        super().load_layout()
+        # Synthetic events carry modifiers as a state mask instead of presses
+        self.masks = {
+            keycode: 1 << index
+            for index, keycodes in enumerate(self.display.get_modifier_mapping())
+            for keycode in keycodes if keycode
+        }
+
+    def send_events(self, window, keys):
+        X = self.X
+        press, release = self.event.KeyPress, self.event.KeyRelease
+        masks = self.masks
+        state = 0
+        for events in keys:
+            for event_type, keycode in events:
+                mask = masks.get(keycode)
+                if mask:
+                    state = state | mask if event_type == X.KeyPress else state & ~mask
+                    continue
+                if event_type == X.KeyPress:
+                    event_class, event_mask = press, X.KeyPressMask
+                else:
+                    event_class, event_mask = release, X.KeyReleaseMask
+                window.send_event(event_class(
+                    time=X.CurrentTime, root=self.root, window=window, child=X.NONE,
+                    root_x=0, root_y=0, event_x=0, event_y=0,
+                    state=state, detail=keycode, same_screen=1,
+                ), event_mask=event_mask, propagate=True)
+
+    def focus_and_type(self, window, keys):
+        # The server handles requests in order, so the XTest keys go to the
+        # window and focus is back before any other client can act on it
+        display = self.display
+        previous = display.get_input_focus()
+        display.set_input_focus(window, self.X.RevertToParent, self.X.CurrentTime)
+        self.queue_compiled(keys)
+        display.set_input_focus(previous.focus, previous.revert_to, self.X.CurrentTime)
+
+    def deliver(self, keys):
+        deliver = self.focus_and_type if self.strategy == "focus" else self.send_events
+        for window in self.windows:
+            deliver(window, keys)
+        self.display.sync()
+
+    # One delivery per send; queue_compiled would bypass the target windows
+    send_many = Backend.send_many
+
+    def type_compiled(self, keys):
+        self.deliver(keys)
+
+    def send_compiled(self, keys):
+        self.deliver(list(keys) + [self.return_events])
+
+    def hotkey(self, *keys):
+        X = self.X
+        keycodes = []
+        for key in keys:
+            keysym = _X11_MODIFIERS.get(key) or self.keysym_for(key)
+            entry = self.layout.get(keysym)
+            keycodes.append(entry[0] if entry else self.display.keysym_to_keycode(keysym))
+        events = tuple((X.KeyPress, keycode) for keycode in keycodes)
+        events += tuple((X.KeyRelease, keycode) for keycode in reversed(keycodes))
+        self.deliver([events])
+
+
+# Linux input-event codes for a US layout, used by the uinput backend since
+# the kernel only knows about physical keys
+_UINPUT_KEYS = {
+    **{c: ("KEY_" + c.upper(), False) for c in "abcdefghijklmnopqrstuvwxyz"},
+    **{c: ("KEY_" + c, False) for c in "0123456789"},
+    " ": ("KEY_SPACE", False), "\t": ("KEY_TAB", False), "\n": ("KEY_ENTER", False),
+    "-": ("KEY_MINUS", False), "=": ("KEY_EQUAL", False), "[": ("KEY_LEFTBRACE", False),
+    "]": ("KEY_RIGHTBRACE", False), "\\": ("KEY_BACKSLASH", False), ";": ("KEY_SEMICOLON", False),
+    "'": ("KEY_APOSTROPHE", False), "`": ("KEY_GRAVE", False), ",": ("KEY_COMMA", False),
+    ".": ("KEY_DOT", False), "/": ("KEY_SLASH", False),
+    "!": ("KEY_1", True), "@": ("KEY_2", True), "#": ("KEY_3", True), "$": ("KEY_4", True),
+    "%": ("KEY_5", True), "^": ("KEY_6", True), "&": ("KEY_7", True), "*": ("KEY_8", True),
+    "(": ("KEY_9", True), ")": ("KEY_0", True), "_": ("KEY_MINUS", True), "+": ("KEY_EQUAL", True),
+    "{": ("KEY_LEFTBRACE", True), "}": ("KEY_RIGHTBRACE", True), "|": ("KEY_BACKSLASH", True),
+    ":": ("KEY_SEMICOLON", True), '"': ("KEY_APOSTROPHE", True), "~": ("KEY_GRAVE", True),
+    "<": ("KEY_COMMA", True), ">": ("KEY_DOT", True), "?": ("KEY_SLASH", True),
+}
+for _c in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
+    _UINPUT_KEYS[_c] = ("KEY_" + _c, True)
+
+
+class UinputBackend(Backend):
+    name = "uinput"
+    profile = ThroughputProfile(0.0002, 0.00001, True, ("linux",))
+
+    def __init__(self):
+        from evdev import UInput, ecodes
+        self.ecodes = ecodes
+        self.keys = {
+            char: (getattr(ecodes, key), shifted)
+            for char, (key, shifted) in _UINPUT_KEYS.items()
+        }
+        self.shift = ecodes.KEY_LEFTSHIFT
+        self.enter = ecodes.KEY_ENTER
+        self.modifiers = {
+            "ctrl": ecodes.KEY_LEFTCTRL, "shift": ecodes.KEY_LEFTSHIFT,
+            "alt": ecodes.KEY_LEFTALT, "command": ecodes.KEY_LEFTMETA,
+            "enter": ecodes.KEY_ENTER,
+        }
+        codes = {code for code, _ in self.keys.values()} | set(self.modifiers.values())
+        self.device = UInput({ecodes.EV_KEY: sorted(codes)}, name="texttyper")
+
+    @classmethod
+    def available(cls):
+        if not sys.platform.startswith("linux") or not os.access("/dev/uinput", os.W_OK):
+            return False
+        try:
+            import evdev  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def queue_key(self, code, shifted=False):
+        write = self.device.write
+        ev_key = self.ecodes.EV_KEY
+        if shifted:
+            write(ev_key, self.shift, 1)
+        write(ev_key, code, 1)
+        write(ev_key, code, 0)
+        if shifted:
+            write(ev_key, self.shift, 0)
+
+    def compile(self, text):
+        # The kernel only knows physical keys, so characters off the US
+        # layout cannot be typed at all (see can_type)
+        keys = self.keys
+        return [keys[char] for char in text if char in keys]
+
+    def queue_compiled(self, keys):
+        for entry in keys:
+            self.queue_key(*entry)
+
+    def can_type(self, text):
+        keys = self.keys
+        return all(char in keys for char in set(text))
+
+    def type_compiled(self, keys):
+        self.queue_compiled(keys)
+        self.device.syn()
+
+    def send_compiled(self, keys):
+        self.queue_compiled(keys)
+        self.queue_key(self.enter)
+        self.device.syn()
+
+    def send_many(self, sends, stop_event):
+        queued = 0
+        for keys in sends:
+            if stop_event.is_set():
+                break
+            self.queue_compiled(keys)
+            self.queue_key(self.enter)
+            queued += 1
+        self.device.syn()
+        return queued
+
+    def type_text(self, text):
+        self.type_compiled(self.compile(text))
+
+    def press_enter(self):
+        self.queue_key(self.enter)
+        self.device.syn()
+
+    def send(self, text):
+        self.send_compiled(self.compile(text))
+
+    def hotkey(self, *keys):
+        write = self.device.write
+        ev_key = self.ecodes.EV_KEY
+        codes = [self.modifiers.get(key) or self.keys[key][0] for key in keys]
+        for code in codes:
+            write(ev_key, code, 1)
+        for code in reversed(codes):
+            write(ev_key, code, 0)
+        self.device.syn()
+
+    def close(self):
+        self.device.close()
+
+
+class RecordingBackend(Backend):
+    name = "recording"
+    profile = ThroughputProfile(0.0, 0.0, True, ("",))
+
+    def __init__(self, clock=time.monotonic_ns):
+        self.clock = clock
+        self.events = []
+        self.lock = threading.Lock()
+
+    def type_text(self, text):
+        with self.lock:
+            self.events.append((self.clock(), "text", text))
+
+    def press_enter(self):
+        with self.lock:
+            self.events.append((self.clock(), "key", "enter"))
+
+    def hotkey(self, *keys):
+        with self.lock:
+            self.events.append((self.clock(), "hotkey", "+".join(keys)))
+
+    def sent_lines(self):
+        return [line for _, line in self.timeline()]
+
+    def timeline(self):
+        # (clock time of the Enter, line) for every completed send
+        sends, current = [], []
+        with self.lock:
+            for ns, kind, value in self.events:
+                if kind == "text":
+                    current.append(value)
+                elif kind == "key" and value == "enter":
+                    sends.append((ns, "".join(current)))
+                    current = []
+        return sends
+
+    def clear(self):
+        with self.lock:
+            self.events.clear()
+
+
+class NullBackend(Backend):
+    # Discards everything, so benchmarks measure the engine alone
+    name = "null"
+    profile = ThroughputProfile(0.0, 0.0, True, ("",))
+
+    def __init__(self):
+        self.keys = 0
+
+    def type_text(self, text):
+        self.keys += len(text)
+
+    def press_enter(self):
+        self.keys += 1
+
+    def hotkey(self, *keys):
+        self.keys += len(keys)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (PyAutoGUIBackend, XTestBackend, XWindowBackend, UinputBackend, RecordingBackend,
+                    NullBackend)
+}
+
+# Order tried by "auto", fastest first. The recording and null backends are
+# never picked automatically since they do not reach the screen, nor is
+# xwindow, which needs a target.
+AUTO_ORDER = ("xtest", "uinput", "pyautogui")
+
+
+def get_backend(name=None, **options):
+    name = name or os.environ.get("TEXTTYPER_BACKEND", "auto")
+    if name == "auto":
+        for candidate in AUTO_ORDER:
+            if BACKENDS[candidate].available():
+                return BACKENDS[candidate](**options)
+        raise RuntimeError("No keystroke backend is available on this system")
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {', '.join(BACKENDS)}")
+    return backend_class(**options)
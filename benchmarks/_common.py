@@ -0,0 +1,68 @@
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+
+# Helpers shared by the benchmark scripts, so every one of them loads the
+# GUI, counts widgets, reads RSS and reports the same way. Importing this
+# puts the repository root on sys.path. Kept free of heavy imports: bench_startup
+# loads it in the child it times.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def print_report(report):
+    # Every benchmark's result, as JSON on stdout
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+def load_app(name="text_typer_GUI.py"):
+    # A GUI script (relative to the repository root or absolute) as a module,
+    # without running its __main__ block
+    spec = importlib.util.spec_from_file_location("gui", os.path.join(ROOT, name))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def rss_bytes():
+    # Current resident set size, or the peak where /proc is missing (which
+    # still only grows with a leak); None when neither can be read
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def start_xvfb(number):
+    # A private Xvfb on :number, or None when it is not installed or does
+    # not come up; the caller terminates it
+    if not shutil.which("Xvfb"):
+        return None
+    server = subprocess.Popen(
+        ["Xvfb", f":{number}", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+        if server.poll() is not None or time.monotonic() > deadline:
+            server.kill()
+            return None
+        time.sleep(0.05)
+    return server
@@ -0,0 +1,73 @@
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+
+from _common import print_report
+from backends import NullBackend
+from control import ControlServer
+from engine import TypingEngine
+
+# Round trip of control.ControlServer requests over its Unix socket: a
+# status query and a settings batch applied under the command lock. Needs
+# AF_UNIX.
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def measure(stream, request, runs):
+    line = (json.dumps(request) + "\n").encode()
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter_ns()
+        stream.write(line)
+        stream.flush()
+        reply = json.loads(stream.readline())
+        samples.append((time.perf_counter_ns() - started) / 1000)
+        if not reply["ok"]:
+            sys.exit(f"request failed: {reply['error']}")
+    return {
+        "median_us": percentile(samples, 0.5),
+        "p99_us": percentile(samples, 0.99),
+        "max_us": max(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Control socket round trip, printed as JSON")
+    parser.add_argument("--runs", type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = TypingEngine(backend=NullBackend(), command="owo hunt", delay=12, paste_threshold=None)
+    path = os.path.join(tempfile.mkdtemp(), "control.sock")
+    server = ControlServer(engine, path)
+    server.start()
+    try:
+        with socket.socket(socket.AF_UNIX) as client:
+            client.connect(path)
+            stream = client.makefile("rwb")
+            batch = [
+                {"op": "set_command", "command": "owo hunt"},
+                {"op": "set_delay", "delay": 12},
+                {"op": "set_policy", "policy": "skip"},
+            ]
+            report = {
+                "runs": args.runs,
+                "status": measure(stream, {"op": "status"}, args.runs),
+                "batch": measure(stream, batch, args.runs),
+            }
+    finally:
+        server.close()
+        engine.close()
+        os.rmdir(os.path.dirname(path))
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import time
+
+from _common import rss_bytes
+from backends import Backend, NullBackend, get_backend
+from engine import TypingEngine
+
+# Engine benchmarks. Everything runs against the null backend by default so
+# the numbers describe the engine itself; --backend adds a second throughput
+# and start-latency run against a real backend, e.g.
+#
+#   xvfb-run python benchmarks/bench_engine.py --backend xtest --output run.json
+
+
+class MeasuredBackend(Backend):
+    # Wraps a backend, optionally charging a simulated cost per key and per
+    # send, and records emit times and the worker thread's CPU time
+    def __init__(self, inner, key_cost_s=0.0, send_cost_s=0.0):
+        self.inner = inner
+        self.name = inner.name
+        self.profile = inner.profile
+        self.key_cost_s = key_cost_s
+        self.send_cost_s = send_cost_s
+        self.keys = 0
+        self.first_emit_ns = None
+        self.last_emit_ns = None
+        self.cpu_start = None
+        self.cpu_s = 0.0
+
+    def emitted(self, keys, sends=0):
+        cost = self.key_cost_s * keys + self.send_cost_s * sends
+        if cost:
+            time.sleep(cost)
+        now = time.monotonic_ns()
+        if self.first_emit_ns is None:
+            self.first_emit_ns = now
+            self.cpu_start = time.thread_time()
+        self.last_emit_ns = now
+        self.cpu_s = time.thread_time() - self.cpu_start
+        self.keys += keys
+
+    def type_text(self, text):
+        self.inner.type_text(text)
+        self.emitted(len(text))
+
+    def press_enter(self):
+        self.inner.press_enter()
+        self.emitted(1, sends=1)
+
+    def send(self, text):
+        self.inner.send(text)
+        self.emitted(len(text) + 1, sends=1)
+
+    def hotkey(self, *keys):
+        self.inner.hotkey(*keys)
+        self.emitted(len(keys))
+
+
+def make_engine(backend, command, delay=0, **options):
+    return TypingEngine(
+        backend=backend, command=command, delay=delay,
+        start_immediately=True, paste_threshold=None, **options
+    )
+
+
+def run_to_completion(engine, count):
+    engine.start("count", count)
+    engine.thread.join()
+
+
+def percentiles(samples_ns):
+    samples = sorted(samples_ns)
+    return {
+        "samples": len(samples),
+        "median_ms": statistics.median(samples) / 1e6,
+        "p99_ms": samples[min(len(samples) - 1, int(len(samples) * 0.99))] / 1e6,
+        "max_ms": samples[-1] / 1e6,
+    }
+
+
+def bench_throughput(inner, command, sends):
+    backend = MeasuredBackend(inner)
+    engine = make_engine(backend, command)
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+    run_to_completion(engine, sends)
+    elapsed = time.perf_counter() - started
+    rss_after = rss_bytes()
+    return {
+        "backend": inner.name,
+        "sends": sends,
+        "seconds": elapsed,
+        "sends_per_s": sends / elapsed,
+        "keys_per_s": backend.keys / elapsed,
+        "worker_cpu_s": backend.cpu_s,
+        "worker_cpu_us_per_send": backend.cpu_s / sends * 1e6,
+        "rss_before": rss_before,
+        "rss_after": rss_after,
+    }
+
+
+def bench_start_latency(make_inner, command, repeats):
+    samples = []
+    for _ in range(repeats):
+        backend = MeasuredBackend(make_inner())
+        engine = make_engine(backend, command)
+        started = time.monotonic_ns()
+        run_to_completion(engine, 1)
+        samples.append(backend.first_emit_ns - started)
+    return percentiles(samples)
+
+
+def bench_stop_latency(command_length, repeats, key_cost_s, hard_abort):
+    # A slow backend and a long command, stopped at a random point mid-send
+    engine = make_engine(
+        MeasuredBackend(NullBackend(), key_cost_s=key_cost_s),
+        "x" * command_length, delay=0.001, hard_abort=hard_abort,
+    )
+    rng = random.Random(0)
+    for _ in range(repeats):
+        engine.start()
+        time.sleep(rng.uniform(0.005, 0.03))
+        engine.stop()
+        engine.thread.join()
+    return engine.stop_latency.summary()
+
+
+def bench_drift(delays, sends, send_cost_s):
+    # Each send costs send_cost_s; on a drift-free grid the span from first
+    # to last send is still exactly (sends - 1) periods
+    results = []
+    for delay in delays:
+        engine = make_engine(MeasuredBackend(NullBackend(), send_cost_s=send_cost_s), "owo hunt", delay=delay)
+        run_to_completion(engine, sends)
+        scheduler = engine.scheduler
+        span_ns = scheduler.last_fired_at - scheduler.first_fired_at
+        results.append({
+            "delay_s": delay,
+            "sends": sends,
+            "send_cost_s": send_cost_s,
+            "drift_ms": (span_ns - (sends - 1) * scheduler.period_ns) / 1e6,
+            "lateness": engine.lateness.summary(),
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Typing engine benchmarks, printed as JSON")
+    parser.add_argument("--backend", help="also measure this real backend (e.g. xtest under Xvfb)")
+    parser.add_argument("--command", default="owo hunt")
+    parser.add_argument("--sends", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--key-cost", type=float, default=0.0005, help="simulated seconds per key for stop latency")
+    parser.add_argument("--drift-delays", default="1,12,60",
+                        help="comma separated delays in seconds; each runs (drift-sends - 1) periods of real time")
+    parser.add_argument("--drift-sends", type=int, default=3)
+    parser.add_argument("--send-cost", type=float, default=0.05, help="simulated seconds per send for drift")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    report = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "throughput": [bench_throughput(NullBackend(), args.command, args.sends)],
+        "start_latency": {"null": bench_start_latency(NullBackend, args.command, args.repeats)},
+        "stop_latency": {
+            "chunked": bench_stop_latency(500, args.repeats, args.key_cost, hard_abort=False),
+            "hard_abort": bench_stop_latency(500, args.repeats, args.key_cost, hard_abort=True),
+        },
+        "drift": bench_drift(
+            [float(delay) for delay in args.drift_delays.split(",")], args.drift_sends, args.send_cost
+        ),
+    }
+    if args.backend:
+        real = get_backend(args.backend)
+        report["throughput"].append(bench_throughput(real, args.command, min(args.sends, 200)))
+        report["start_latency"][real.name] = bench_start_latency(
+            lambda: real, args.command, min(args.repeats, 20)
+        )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import json
+import time
+
+from _common import load_app
+
+# Cost of the inactivity handlers that run on every <Motion>, <KeyPress> and
+# <ButtonPress> in text_typer_GUI.py, against the previous implementation
+# that re-armed a 120 s after() timer on each event. Needs a display.
+
+
+class LegacyIdle:
+    def __init__(self, master):
+        self.master = master
+        self.transparent = False
+        self.inactivity_timer = master.after(120000, lambda: None)
+
+    def reset_inactivity_timer(self, event=None):
+        if self.inactivity_timer:
+            self.master.after_cancel(self.inactivity_timer)
+        if self.transparent:
+            self.transparent = False
+            self.master.attributes("-alpha", 1.0)
+        self.inactivity_timer = self.master.after(120000, lambda: None)
+
+
+def per_call_us(handler, events):
+    started = time.perf_counter()
+    for _ in range(events):
+        handler()
+    return (time.perf_counter() - started) / events * 1e6
+
+
+def per_event_us(root, events):
+    # Full Tk dispatch of synthetic motion events through the root bindings
+    started = time.perf_counter()
+    for i in range(events):
+        root.event_generate("<Motion>", x=i % 50, y=i % 50, when="now")
+    return (time.perf_counter() - started) / events * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inactivity handler cost per input event (needs a display)")
+    parser.add_argument("--events", type=int, default=20000)
+    args = parser.parse_args()
+
+    module = load_app()
+    root = module.tk.Tk()
+    app = module.AutoTyperApp(root)
+    root.update()
+
+    current_handler = per_call_us(app.reset_inactivity_timer, args.events)
+    current_dispatch = per_event_us(root, args.events)
+    pending_current = len(root.tk.call("after", "info"))
+
+    legacy = LegacyIdle(root)
+    root.bind("<Motion>", legacy.reset_inactivity_timer)
+    legacy_handler = per_call_us(legacy.reset_inactivity_timer, args.events)
+    legacy_dispatch = per_event_us(root, args.events)
+
+    root.destroy()
+    print(json.dumps({
+        "events": args.events,
+        "handler_us": {"current": current_handler, "legacy": legacy_handler},
+        "motion_dispatch_us": {"current": current_dispatch, "legacy": legacy_dispatch},
+        "pending_after_timers": pending_current,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import argparse
+import time
+
+from _common import print_report
+from backends import NullBackend
+from engine import TypingEngine
+from profiling import Instrumentation
+
+# Cost of profiling.Instrumentation per send on the null backend: not
+# attached at all, attached but "off", and each mode that records. The
+# first two must be indistinguishable.
+
+
+def run(sends, mode):
+    engine = TypingEngine(backend=NullBackend(), command="owo hunt", delay=0,
+                          start_immediately=True, paste_threshold=None)
+    instrumentation = None
+    if mode is not None:
+        instrumentation = engine.instrumentation = Instrumentation()
+        instrumentation.set_mode(mode)
+    started = time.perf_counter()
+    engine.start("count", sends)
+    engine.thread.join()
+    elapsed = time.perf_counter() - started
+    if instrumentation is not None:
+        instrumentation.set_mode("off")
+    return {"us_per_send": elapsed / sends * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Instrumentation overhead per send, printed as JSON")
+    parser.add_argument("--sends", type=int, default=20000)
+    args = parser.parse_args()
+
+    report = {"sends": args.sends, "detached": run(args.sends, None)}
+    for mode in ("off", "stages", "cprofile", "tracemalloc"):
+        report[mode] = run(args.sends, mode)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
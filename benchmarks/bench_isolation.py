@@ -0,0 +1,78 @@
+import argparse
+import re
+import threading
+
+from _common import print_report
+from backends import NullBackend
+from engine import TypingEngine
+from isolated import IsolatedEngine
+
+# Send lateness while the parent process is busy, for the in-process engine
+# against isolated.IsolatedEngine. The load is a thread spinning in pure
+# Python, standing in for Tk redraws, dialogs and theme switches competing
+# for the GIL. Both engines are measured through their timing_report(), the
+# lateness the user sees in Timing Stats.
+
+LATENESS = re.compile(r"Lateness over \d+ sends: .*p99 ([\d.]+) ms, max ([\d.]+) ms")
+
+
+def busy(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def lateness(report):
+    p99, worst = LATENESS.search(report).groups()
+    return {"p99_ms": float(p99), "max_ms": float(worst)}
+
+
+def run(engine, sends, load):
+    stop = threading.Event()
+    done = threading.Event()
+    engine.on_finished = done.set
+    threads = [threading.Thread(target=busy, args=(stop,)) for _ in range(load)]
+    for thread in threads:
+        thread.start()
+    try:
+        engine.start("count", sends)
+        done.wait()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+
+def in_process(delay, sends, load):
+    engine = TypingEngine(backend=NullBackend(), delay=delay, start_immediately=True, paste_threshold=None)
+    run(engine, sends, load)
+    return lateness(engine.timing_report())
+
+
+def isolated(delay, sends, load):
+    engine = IsolatedEngine(backend="null", delay=delay, start_immediately=True)
+    try:
+        engine.prepare()
+        run(engine, sends, load)
+        return lateness(engine.timing_report())
+    finally:
+        engine.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send lateness under GUI-process load, printed as JSON")
+    parser.add_argument("--delay", type=float, default=0.02)
+    parser.add_argument("--sends", type=int, default=200)
+    parser.add_argument("--load", type=int, default=2, help="busy threads in the parent process")
+    args = parser.parse_args()
+
+    report = {"delay_s": args.delay, "sends": args.sends, "load_threads": args.load}
+    for name, bench in (("in_process", in_process), ("isolated", isolated)):
+        report[name] = {
+            "idle": bench(args.delay, args.sends, 0),
+            "loaded": bench(args.delay, args.sends, args.load),
+        }
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
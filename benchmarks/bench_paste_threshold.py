@@ -0,0 +1,42 @@
+import argparse
+import sys
+
+from _common import print_report
+from backends import get_backend
+from paste import MemoryClipboard, SystemClipboard, calibrate_threshold
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find the text length above which pasting beats typing. "
+                    "Focus a scratch text field before running with a real backend."
+    )
+    parser.add_argument("--backend", default=None, help="backend name (default: auto)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--settle", type=float, default=0.05, help="clipboard settle time in seconds")
+    parser.add_argument("--max-length", type=int, default=1024)
+    args = parser.parse_args()
+
+    backend = get_backend(args.backend)
+    clipboard = SystemClipboard() if SystemClipboard.available() else MemoryClipboard()
+    lengths = []
+    length = 8
+    while length <= args.max_length:
+        lengths.append(length)
+        length *= 2
+
+    threshold, results = calibrate_threshold(
+        backend, clipboard, lengths=lengths, repeats=args.repeats, settle_s=args.settle
+    )
+    print_report({
+        "backend": backend.name,
+        "clipboard": type(clipboard).__name__,
+        "threshold": threshold,
+        "results": results,
+    })
+    if threshold is not None:
+        print(f"export TEXTTYPER_PASTE_THRESHOLD={threshold}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
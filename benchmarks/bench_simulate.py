@@ -0,0 +1,80 @@
+import argparse
+import time
+
+from _common import print_report
+from backends import RecordingBackend
+from engine import TypingEngine
+from ratelimit import RateLimiter
+from scheduler import VirtualClock
+
+# Long schedules on a virtual clock: how long a simulated day takes, and how
+# far the sends drift from the ideal grid start + k * delay over it (zero
+# unless the scheduler itself accumulates error). Then the same short
+# schedule run for real and simulated, to show the simulated timeline is
+# the one a real run produces up to wakeup jitter.
+
+
+def simulated(delay, hours, limits=None):
+    clock = VirtualClock()
+    backend = RecordingBackend(clock=clock)
+    engine = TypingEngine(backend=backend, command="owo hunt", delay=delay, paste_threshold=None, clock=clock)
+    if limits is not None:
+        engine.set_limiter(RateLimiter(clock=clock, **limits))
+    started = time.perf_counter()
+    engine.simulate("infinite", until_s=hours * 3600)
+    elapsed = time.perf_counter() - started
+    timeline = [ns for ns, _ in backend.timeline()]
+    period_ns = int(delay * 1e9)
+    drift = [ns - (k + 1) * period_ns for k, ns in enumerate(timeline)]
+    return {
+        "delay_s": delay,
+        "hours": hours,
+        "sends": len(timeline),
+        "wall_ms": elapsed * 1000,
+        "max_drift_ns": max(map(abs, drift)) if limits is None and drift else None,
+        "last_send_h": timeline[-1] / 3.6e12 if timeline else None,
+    }
+
+
+def fidelity(delay, sends):
+    real = RecordingBackend()
+    engine = TypingEngine(backend=real, command="owo hunt", delay=delay, paste_threshold=None)
+    engine.start("count", sends)
+    engine.thread.join()
+
+    clock = VirtualClock()
+    virtual = RecordingBackend(clock=clock)
+    TypingEngine(backend=virtual, command="owo hunt", delay=delay, paste_threshold=None,
+                 clock=clock).simulate("count", sends)
+
+    real_ns = [ns for ns, _ in real.timeline()]
+    virtual_ns = [ns for ns, _ in virtual.timeline()]
+    # Real times are relative to the first send, which already includes the
+    # first delay
+    offsets = [
+        abs((r - real_ns[0]) - (v - virtual_ns[0])) / 1e6
+        for r, v in zip(real_ns, virtual_ns)
+    ]
+    return {
+        "delay_s": delay,
+        "sends": [len(real_ns), len(virtual_ns)],
+        "max_deviation_ms": max(offsets) if offsets else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Virtual-clock simulation speed and fidelity, printed as JSON")
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--sends", type=int, default=20, help="sends in the real-time fidelity run")
+    args = parser.parse_args()
+
+    report = {
+        "horizon": [simulated(delay, args.hours) for delay in (1, 12, 60)],
+        "rate_limited": simulated(1, args.hours, dict(rate=0.5, burst=5, per_hour=1000)),
+        "fidelity": fidelity(0.05, args.sends),
+    }
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
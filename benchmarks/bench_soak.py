@@ -0,0 +1,222 @@
+import argparse
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+from _common import count_widgets, load_app, print_report, rss_bytes, start_xvfb
+from async_engine import AsyncTypingEngine
+from backends import NullBackend
+
+# Endurance run: the engine, then the V1 window, typing on the null backend
+# at a zero delay for a large number of sends. Samples of traced memory,
+# RSS, thread count and, for the window, Tk widget count and UIPump queue
+# depth are taken every --interval seconds; after the warmup the first
+# sample is the baseline and the run fails when any of them grows past its
+# threshold. The engine is stopped and restarted along the way, since runs
+# come and go in the GUI too. The report gives
+# every metric's growth and slope per million sends, plus the allocation
+# sites that grew most since the baseline.
+#
+# The window phase needs a display; without DISPLAY it starts a private
+# Xvfb, and it is skipped when there is none.
+
+class Sampler:
+    def __init__(self, warmup_sends, trace):
+        self.warmup_sends = warmup_sends
+        self.trace = trace
+        self.samples = []
+        self.baseline = None
+        self.baseline_snapshot = None
+        self.last_snapshot = None
+        self.started = time.perf_counter()
+
+    def snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+
+    def sample(self, sends, **extra):
+        sample = {
+            "sends": sends,
+            "elapsed_s": time.perf_counter() - self.started,
+            "threads": threading.active_count(),
+        }
+        rss = rss_bytes()
+        if rss is not None:
+            sample["rss_mb"] = rss / 2 ** 20
+        sample.update(extra)
+        if self.trace:
+            sample["traced_mb"] = tracemalloc.get_traced_memory()[0] / 2 ** 20
+        self.samples.append(sample)
+        if self.baseline is None and sends >= self.warmup_sends:
+            self.baseline = sample
+            if self.trace:
+                self.baseline_snapshot = self.snapshot()
+        elif self.baseline is not None and self.trace:
+            self.last_snapshot = self.snapshot()
+
+    def report(self, thresholds):
+        samples = [sample for sample in self.samples if self.baseline is not None
+                   and sample["sends"] >= self.baseline["sends"]]
+        report = {"samples": len(self.samples), "sends": self.samples[-1]["sends"] if self.samples else 0}
+        failures = []
+        for metric, limit in thresholds.items():
+            if len(samples) < 2 or metric not in samples[0]:
+                continue
+            growth = samples[-1][metric] - samples[0][metric]
+            report[metric] = {
+                "baseline": samples[0][metric],
+                "last": samples[-1][metric],
+                "growth": growth,
+                "slope_per_million_sends": slope(samples, metric) * 1e6,
+                "limit": limit,
+            }
+            if growth > limit:
+                failures.append(f"{metric} grew by {growth:g} (limit {limit:g})")
+        if self.baseline_snapshot is not None and self.last_snapshot is not None:
+            report["growing_sites"] = [
+                str(stat) for stat in self.last_snapshot.compare_to(self.baseline_snapshot, "lineno")[:10]
+                if stat.size_diff > 0
+            ]
+        report["trend"] = samples
+        report["failures"] = failures
+        return report
+
+
+def slope(samples, metric):
+    # Least squares of metric against sends
+    n = len(samples)
+    xs = [sample["sends"] for sample in samples]
+    ys = [sample[metric] for sample in samples]
+    mean_x, mean_y = sum(xs) / n, sum(ys) / n
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if not spread:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def soak_engine(args, thresholds):
+    sampler = Sampler(args.sends * args.warmup, args.tracemalloc)
+    engine = AsyncTypingEngine(backend=NullBackend(), command="owo hunt {n}", delay=0,
+                               start_immediately=True, paste_threshold=None)
+    total = 0
+    handle = engine.start("infinite")
+    next_sample = time.perf_counter()
+    restarted_at = 0
+    while True:
+        sends = total + engine.current_count
+        if sends >= args.sends:
+            break
+        if args.restart_every and sends - restarted_at >= args.restart_every:
+            # Runs come and go in the GUI; each must leave nothing behind
+            handle.stop()
+            handle.wait()
+            total += engine.current_count
+            restarted_at = total
+            handle = engine.start("infinite")
+            handle.started.result()
+        if time.perf_counter() >= next_sample:
+            sampler.sample(sends)
+            next_sample = time.perf_counter() + args.interval
+        time.sleep(0.01)
+    handle.stop()
+    handle.wait()
+    sampler.sample(total + engine.current_count)
+    engine.close()
+    return sampler.report(thresholds)
+
+
+def soak_window(args, thresholds):
+    module = load_app()
+    root = module.tk.Tk()
+    app = module.AutoTyperApp(root)
+    app.engine.backend = NullBackend()
+    app.engine.paste_threshold = None
+    app.engine.start_immediately = True
+    app.engine.set_delay(0)
+    sampler = Sampler(args.gui_sends * args.warmup, args.tracemalloc)
+    app.start_typing()
+    next_sample = time.perf_counter()
+    rounds = 0
+    try:
+        while app.engine.current_count < args.gui_sends:
+            root.update()
+            rounds += 1
+            if rounds % 100 == 0:
+                # Dialogs are reused; reopening them must not add widgets
+                app.set_timer()
+                root.update()
+                app.hide_timer_dialog()
+                app.open_jobs()
+                root.update()
+                app.jobs_dialog.withdraw()
+            if time.perf_counter() >= next_sample:
+                sampler.sample(app.engine.current_count, widgets=count_widgets(root),
+                               pump_queue=app.pump.events.qsize())
+                next_sample = time.perf_counter() + args.interval
+            time.sleep(0.005)
+        sampler.sample(app.engine.current_count, widgets=count_widgets(root),
+                       pump_queue=app.pump.events.qsize())
+    finally:
+        app.stop_typing()
+        root.destroy()
+    return sampler.report(thresholds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak run with leak checks, printed as JSON")
+    parser.add_argument("--sends", type=int, default=1000000, help="engine sends")
+    parser.add_argument("--gui-sends", type=int, default=200000, help="window sends (0 skips the window)")
+    parser.add_argument("--restart-every", type=int, default=50000, help="engine sends between stop/start")
+    parser.add_argument("--interval", type=float, default=2.0, help="seconds between samples")
+    parser.add_argument("--display", type=int, default=98, help="Xvfb display number when DISPLAY is unset")
+    parser.add_argument("--warmup", type=float, default=0.1, help="fraction of sends before the baseline")
+    parser.add_argument("--no-tracemalloc", dest="tracemalloc", action="store_false",
+                        help="skip allocation tracing, which slows sends several times over")
+    parser.add_argument("--max-rss-mb", type=float, default=20)
+    parser.add_argument("--max-traced-mb", type=float, default=5)
+    parser.add_argument("--max-threads", type=int, default=0)
+    parser.add_argument("--max-widgets", type=int, default=0)
+    parser.add_argument("--max-pump-queue", type=int, default=100)
+    args = parser.parse_args()
+
+    thresholds = {
+        "rss_mb": args.max_rss_mb,
+        "traced_mb": args.max_traced_mb,
+        "threads": args.max_threads,
+        "widgets": args.max_widgets,
+        "pump_queue": args.max_pump_queue,
+    }
+    if args.tracemalloc:
+        # One frame keeps tracing cheap; sites are reported by line
+        tracemalloc.start(1)
+
+    report = {"engine": soak_engine(args, thresholds)}
+    server = None
+    if not args.gui_sends:
+        report["window"] = "skipped"
+    elif not os.environ.get("DISPLAY") and (server := start_xvfb(args.display)) is None:
+        report["window"] = "skipped: no DISPLAY and no Xvfb"
+    else:
+        if server is not None:
+            os.environ["DISPLAY"] = f":{args.display}"
+        try:
+            report["window"] = soak_window(args, thresholds)
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+    print_report(report)
+
+    failures = report["engine"]["failures"] + (
+        report["window"]["failures"] if isinstance(report["window"], dict) else []
+    )
+    if failures:
+        sys.exit("soak failed: " + "; ".join(failures))
+
+
+if __name__ == "__main__":
+    main()
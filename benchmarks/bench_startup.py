@@ -0,0 +1,69 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from _common import ROOT
+
+GUIS = ["text_typer_GUI.py", "text_typer_GUI(V2.0).py"]
+
+# Run in a fresh interpreter per sample so nothing is already imported;
+# the GUI is loaded by _common, which is imported before timing starts.
+CHILD = r"""
+import json, sys, time
+sys.path.insert(0, sys.argv[2])
+from _common import load_app
+t0 = time.perf_counter()
+module = load_app(sys.argv[1])
+t1 = time.perf_counter()
+root = module.tk.Tk()
+module.AutoTyperApp(root)
+root.update()
+t2 = time.perf_counter()
+lazy = ["pyautogui", "webbrowser", "ctypes", "tkinter.filedialog",
+        "tkinter.colorchooser", "tkinter.messagebox"]
+eager = [name for name in lazy if name in sys.modules]
+root.destroy()
+print(json.dumps({"import_ms": (t1 - t0) * 1000, "first_paint_ms": (t2 - t0) * 1000,
+                  "eager_modules": eager}))
+"""
+
+
+def sample(path):
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, path, os.path.dirname(os.path.abspath(__file__))],
+        capture_output=True, text=True, cwd=ROOT,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    if result.returncode:
+        raise SystemExit(f"{os.path.basename(path)} failed to start:\n{result.stderr}")
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+    data["process_ms"] = wall_ms
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure GUI import and first-paint time (needs a display)")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    if sys.platform.startswith("linux") and not os.environ.get("DISPLAY"):
+        raise SystemExit("No DISPLAY; run under xvfb-run")
+
+    report = {}
+    for gui in GUIS:
+        samples = [sample(os.path.join(ROOT, gui)) for _ in range(args.repeats)]
+        report[gui] = {
+            key: statistics.median(s[key] for s in samples)
+            for key in ("import_ms", "first_paint_ms", "process_ms")
+        }
+        report[gui]["eager_modules"] = samples[-1]["eager_modules"]
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
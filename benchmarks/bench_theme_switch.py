@@ -0,0 +1,83 @@
+import argparse
+import json
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from _common import count_widgets
+from themes import ThemeEngine
+
+# Cost of a Light/Dark switch as the number of open widgets grows, for the
+# role-style ThemeEngine against the previous update_theme that walked every
+# window's children and restyled frames one by one. "call" is the Python side
+# only; "settled" includes Tk redrawing the widgets. Needs a display.
+
+
+def legacy_switch(root, style, theme):
+    bg = "#FFFFFF" if theme == "light" else "#2d2d2d"
+    fg = "#000000" if theme == "light" else "#FFFFFF"
+    style.configure(f"{theme}.TFrame", background=bg)
+    for window in [root] + [w for w in root.winfo_children() if isinstance(w, tk.Toplevel)]:
+        for widget in window.winfo_children():
+            if isinstance(widget, ttk.Frame):
+                widget.configure(style=f"{theme}.TFrame")
+                for child in widget.winfo_children():
+                    if isinstance(child, ttk.Label):
+                        child.configure(style=f"{theme}.TLabel")
+    style.configure(f"{theme}.TLabel", background=bg, foreground=fg)
+
+
+def build(root, widgets, styled):
+    # Spread the widgets over a few windows, like the main window plus
+    # settings dialogs
+    windows = [root] + [tk.Toplevel(root) for _ in range(3)]
+    for window in windows:
+        frame = ttk.Frame(window, style="App.TFrame" if styled else "TFrame")
+        frame.pack()
+        for i in range(max(widgets // len(windows), 1)):
+            ttk.Label(frame, text=str(i), style="App.TLabel" if styled else "TLabel").pack()
+    root.update()
+
+
+def measure(root, switch, names, switches):
+    call = settled = 0.0
+    for i in range(switches):
+        name = names[i % 2]
+        started = time.perf_counter()
+        switch(name)
+        middle = time.perf_counter()
+        root.update_idletasks()
+        ended = time.perf_counter()
+        call += middle - started
+        settled += ended - started
+    return {"call_us": call / switches * 1e6, "settled_us": settled / switches * 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Theme switch cost by widget count (needs a display)")
+    parser.add_argument("--widgets", default="10,100,1000,5000", help="comma separated widget counts")
+    parser.add_argument("--switches", type=int, default=50)
+    args = parser.parse_args()
+
+    results = []
+    for widgets in [int(count) for count in args.widgets.split(",")]:
+        root = tk.Tk()
+        style = ttk.Style(root)
+        themes = ThemeEngine(style)
+        build(root, widgets, styled=True)
+        counted = count_widgets(root)
+        current = measure(root, themes.apply, ["Light", "Dark"], args.switches)
+        root.destroy()
+
+        root = tk.Tk()
+        style = ttk.Style(root)
+        build(root, widgets, styled=False)
+        legacy = measure(root, lambda name: legacy_switch(root, style, name), ["light", "dark"], args.switches)
+        root.destroy()
+        results.append({"widgets": widgets, "counted": counted, "current": current, "legacy": legacy})
+
+    print(json.dumps({"switches": args.switches, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import json
+import sys
+import time
+
+from _common import count_widgets, load_app
+
+# Widget count and first paint of text_typer_GUI.py, plus the cost of
+# opening the timer dialog the first time and every time after. Reopening
+# must not create widgets: the dialog is built once and only hidden.
+# Needs a display.
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Widget count and dialog reuse (needs a display)")
+    parser.add_argument("--reopen", type=int, default=20, help="times to open and close the timer dialog")
+    args = parser.parse_args()
+
+    module = load_app()
+    started = time.perf_counter()
+    root = module.tk.Tk()
+    app = module.AutoTyperApp(root)
+    root.update()
+    first_paint_ms = (time.perf_counter() - started) * 1000
+    widgets_at_start = count_widgets(root)
+
+    open_ms = []
+    for _ in range(args.reopen):
+        started = time.perf_counter()
+        app.set_timer()
+        root.update()
+        open_ms.append((time.perf_counter() - started) * 1000)
+        app.hide_timer_dialog()
+        root.update()
+    widgets_after = count_widgets(root)
+    dialog_widgets = count_widgets(app.timer_dialog) if app.timer_dialog is not None else 0
+    root.destroy()
+
+    print(json.dumps({
+        "first_paint_ms": first_paint_ms,
+        "widgets_at_start": widgets_at_start,
+        "widgets_after_reopen": widgets_after,
+        "timer_dialog_widgets": dialog_widgets,
+        "timer_first_open_ms": open_ms[0] if open_ms else None,
+        "timer_reopen_ms": sum(open_ms[1:]) / max(len(open_ms) - 1, 1),
+        "reopens": args.reopen,
+    }, indent=2))
+    if widgets_after != widgets_at_start + dialog_widgets:
+        sys.exit("timer dialog created widgets on reopen")
+
+
+if __name__ == "__main__":
+    main()
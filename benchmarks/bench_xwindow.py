@@ -0,0 +1,115 @@
+import argparse
+import json
+import sys
+import time
+
+from _common import start_xvfb
+from backends import XWindowBackend, _x11_char
+
+# The xwindow backend end to end on a private Xvfb server. Two windows are
+# created and focus is put on the second; a command sent to the first must
+# arrive there in full, characters outside the layout included, while
+# focus stays on the second. Done for both delivery strategies, with the
+# time per send. Needs Xvfb and python-xlib.
+
+TEXT = "owo hunt Ünïcødé €5 ½ ĳ"
+
+
+def make_window(display, name):
+    from Xlib import X
+    screen = display.screen()
+    window = screen.root.create_window(
+        0, 0, 200, 100, 0, screen.root_depth,
+        event_mask=X.KeyPressMask | X.KeyReleaseMask,
+    )
+    window.set_wm_name(name)
+    window.map()
+    return window
+
+
+def decode(display, event):
+    # The character the event types, as a client using the current mapping
+    # would see it
+    from Xlib import X, XK
+    index = 1 if event.state & X.ShiftMask else 0
+    if event.state & X.Mod5Mask:
+        index += 4
+    keysym = display.keycode_to_keysym(event.detail, index) or display.keycode_to_keysym(event.detail, 0)
+    if keysym == XK.XK_Return:
+        return "\n"
+    return _x11_char(keysym) or ""
+
+
+def receive(display, window, expected, timeout=5):
+    from Xlib import X
+    text = ""
+    deadline = time.monotonic() + timeout
+    while len(text) < len(expected) and time.monotonic() < deadline:
+        if not display.pending_events():
+            time.sleep(0.005)
+            continue
+        event = display.next_event()
+        if event.type == X.MappingNotify:
+            display.refresh_keyboard_mapping(event)
+        elif event.type == X.KeyPress and event.window.id == window.id:
+            text += decode(display, event)
+    return text
+
+
+def check(strategy, display_name, sends):
+    from Xlib import X, display
+    receiver = display.Display(display_name)
+    target = make_window(receiver, f"texttyper target {strategy}")
+    other = make_window(receiver, "texttyper other")
+    receiver.sync()
+    time.sleep(0.2)
+    other.set_input_focus(X.RevertToParent, X.CurrentTime)
+    receiver.sync()
+
+    backend = XWindowBackend(display_name, window=f"0x{target.id:x}", strategy=strategy)
+    try:
+        keys = backend.compile(TEXT)
+        started = time.perf_counter()
+        for _ in range(sends):
+            backend.send_compiled(keys)
+        per_send_ms = (time.perf_counter() - started) * 1000 / sends
+        expected = (TEXT + "\n") * sends
+        received = receive(receiver, target, expected)
+        focus = receiver.get_input_focus().focus
+    finally:
+        backend.close()
+        target.destroy()
+        other.destroy()
+        receiver.close()
+    return {
+        "delivered": received == expected,
+        "focus_kept": getattr(focus, "id", focus) == other.id,
+        "per_send_ms": per_send_ms,
+        "received_first": received.split("\n", 1)[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="xwindow backend check on Xvfb, printed as JSON")
+    parser.add_argument("--display", type=int, default=99, help="Xvfb display number")
+    parser.add_argument("--sends", type=int, default=20)
+    args = parser.parse_args()
+
+    server = start_xvfb(args.display)
+    if server is None:
+        sys.exit("Xvfb is not installed or did not start")
+    try:
+        report = {"text": TEXT, "sends": args.sends}
+        for strategy in XWindowBackend.strategies:
+            report[strategy] = check(strategy, f":{args.display}", args.sends)
+    finally:
+        server.terminate()
+        server.wait()
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if not all(report[strategy]["delivered"] and report[strategy]["focus_kept"]
+               for strategy in XWindowBackend.strategies):
+        sys.exit("targeted delivery failed")
+
+
+if __name__ == "__main__":
+    main()
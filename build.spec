@@ -5,7 +5,9 @@ a = Analysis(
     ['text_typer_GUI.py'],
     binaries=[],
     datas=[],
-    hiddenimports=['threading','tkinter','pyautogui','webbrowser'],
+    # pyautogui and webbrowser are imported inside functions, which the
+    # analysis still follows, so they need no hidden import
+    hiddenimports=['threading','tkinter'],
     hookspath=[],
     runtime_hooks=[],
     excludes=[],
@@ -0,0 +1,47 @@
+# build_fast.spec
+# Start-up tuned profile: a onedir bundle does not unpack itself to a temp
+# directory on every launch the way the onefile build.spec does, and skipping
+# UPX avoids decompressing every DLL at load time. pyautogui and the dialogs
+# are imported lazily by the app, so they stay out of the start-up path even
+# though they are bundled. Only modules nothing in the bundle can reach are
+# excluded; trimming more of the stdlib needs a frozen build to verify.
+block_cipher = None
+
+a = Analysis(
+    ['text_typer_GUI.py'],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    runtime_hooks=[],
+    excludes=['lib2to3', 'test', 'tkinter.test'],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+    optimize=1,
+)
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='AutoTyper',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=False,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=False,
+    name='AutoTyper',
+)
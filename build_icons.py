@@ -0,0 +1,171 @@
+import argparse
+import base64
+import os
+import struct
+import zlib
+
+from icons import BASE_SIZE, ICON_FILES, SCALES, icon_size
+
+# Regenerates icon_data.py from the full-size PNGs next to this file:
+#
+#   python build_icons.py
+#
+# Every icon is shrunk once per DPI scale with an area-averaging filter and
+# stored as base64 PNG, so the app never decodes the 512 px sources at
+# start-up. Only 8-bit RGB/RGBA non-interlaced PNGs are supported, which is
+# what the icon sources are; no imaging library is needed.
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_CHANNELS = {2: 3, 6: 4}
+
+
+def read_png(path):
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(_PNG_SIGNATURE):
+        raise ValueError(f"{path} is not a PNG")
+    position = len(_PNG_SIGNATURE)
+    idat = []
+    while position < len(data):
+        length, kind = struct.unpack(">I4s", data[position:position + 8])
+        body = data[position + 8:position + 8 + length]
+        position += 12 + length
+        if kind == b"IHDR":
+            width, height, depth, color_type, _, _, interlace = struct.unpack(">IIBBBBB", body)
+            if depth != 8 or color_type not in _CHANNELS or interlace:
+                raise ValueError(f"{path}: only 8-bit RGB/RGBA non-interlaced PNGs are supported")
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind == b"IEND":
+            break
+    channels = _CHANNELS[color_type]
+    raw = zlib.decompress(b"".join(idat))
+    stride = width * channels
+    rows = []
+    previous = bytearray(stride)
+    for y in range(height):
+        start = y * (stride + 1)
+        line = unfilter(raw[start], bytearray(raw[start + 1:start + 1 + stride]), previous, channels)
+        if channels == 3:
+            rgba = bytearray(width * 4)
+            rgba[0::4], rgba[1::4], rgba[2::4] = line[0::3], line[1::3], line[2::3]
+            rgba[3::4] = b"\xff" * width
+            rows.append(rgba)
+        else:
+            rows.append(line)
+        previous = line
+    return width, height, rows
+
+
+def unfilter(kind, line, previous, bpp):
+    if kind == 1:
+        for i in range(bpp, len(line)):
+            line[i] = (line[i] + line[i - bpp]) & 0xFF
+    elif kind == 2:
+        for i in range(len(line)):
+            line[i] = (line[i] + previous[i]) & 0xFF
+    elif kind == 3:
+        for i in range(len(line)):
+            left = line[i - bpp] if i >= bpp else 0
+            line[i] = (line[i] + ((left + previous[i]) >> 1)) & 0xFF
+    elif kind == 4:
+        for i in range(len(line)):
+            a = line[i - bpp] if i >= bpp else 0
+            b = previous[i]
+            c = previous[i - bpp] if i >= bpp else 0
+            p = a + b - c
+            pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+            predictor = a if pa <= pb and pa <= pc else b if pb <= pc else c
+            line[i] = (line[i] + predictor) & 0xFF
+    elif kind != 0:
+        raise ValueError(f"Unknown PNG filter {kind}")
+    return line
+
+
+def area_weights(source, target):
+    # For every target pixel, the (source index, coverage) pairs it averages
+    scale = source / target
+    weights = []
+    for t in range(target):
+        start, end = t * scale, (t + 1) * scale
+        pairs = []
+        s = int(start)
+        while s < end and s < source:
+            coverage = min(end, s + 1) - max(start, s)
+            if coverage > 0:
+                pairs.append((s, coverage / scale))
+            s += 1
+        weights.append(pairs)
+    return weights
+
+
+def resample(width, height, rows, size):
+    # Separable area average on premultiplied alpha, so transparent pixels
+    # do not bleed their (usually black) colour into the edges
+    columns = area_weights(width, size)
+    lines = area_weights(height, size)
+    narrow = []
+    for row in rows:
+        alpha = row[3::4]
+        premultiplied = [
+            [row[x * 4 + c] * alpha[x] / 255 for x in range(width)] for c in range(3)
+        ] + [list(alpha)]
+        narrow.append([
+            [sum(channel[s] * w for s, w in pairs) for pairs in columns]
+            for channel in premultiplied
+        ])
+    pixels = bytearray(size * size * 4)
+    for y, pairs in enumerate(lines):
+        for x in range(size):
+            r, g, b, a = (sum(narrow[s][c][x] * w for s, w in pairs) for c in range(4))
+            offset = (y * size + x) * 4
+            if a > 0:
+                pixels[offset:offset + 4] = bytes((
+                    min(round(r * 255 / a), 255), min(round(g * 255 / a), 255),
+                    min(round(b * 255 / a), 255), min(round(a), 255),
+                ))
+    return pixels
+
+
+def write_png(size, pixels):
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+    stride = size * 4
+    raw = b"".join(b"\x00" + pixels[y * stride:(y + 1) * stride] for y in range(size))
+    return (
+        _PNG_SIGNATURE
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 6, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw, 9))
+        + chunk(b"IEND", b"")
+    )
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Pre-render the GUI icons for every DPI scale")
+    parser.add_argument("--source", default=here, help="directory holding the full-size PNGs")
+    parser.add_argument("--output", default=os.path.join(here, "icon_data.py"))
+    args = parser.parse_args()
+
+    sizes = sorted({icon_size(scale) for scale in SCALES})
+    entries = []
+    for name, file_name in ICON_FILES.items():
+        width, height, rows = read_png(os.path.join(args.source, file_name))
+        for size in sizes:
+            encoded = base64.b64encode(write_png(size, resample(width, height, rows, size))).decode("ascii")
+            entries.append(f"    ({name!r}, {size}): (\n")
+            entries.extend(f"        {encoded[i:i + 76]!r}\n" for i in range(0, len(encoded), 76))
+            entries.append("    ),\n")
+        print(f"{file_name}: {width}x{height} -> {', '.join(map(str, sizes))} px")
+
+    with open(args.output, "w", encoding="utf-8", newline="\r\n") as file:
+        file.write("# Generated by build_icons.py, do not edit.\n")
+        file.write(f"# (name, pixel size) -> base64 PNG of the {BASE_SIZE} px icons at every DPI scale\n")
+        file.write("ICONS = {\n")
+        file.writelines(entries)
+        file.write("}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+import json
+import os
+import queue
+import socketserver
+import stat
+import threading
+import time
+
+from scheduler import POLICIES
+from templates import compile_template
+
+# Newline-delimited JSON over a Unix domain socket, for driving the typer
+# from scripts without going through the window:
+#
+#   {"op": "status"}
+#   [{"op": "set_command", "command": "owo hunt"}, {"op": "set_delay", "delay": 12}, {"op": "start"}]
+#   {"op": "subscribe"}
+#
+# A request is one op or a list of ops; the reply is one line,
+# {"ok": true, "results": [...]} or {"ok": false, "error": "..."}, echoing
+# "id" when the request had one. A list is validated as a whole first, so a
+# bad op rejects the batch before anything changed. Its set_* ops are then
+# applied together under the engine's command_lock, so the typing loop never
+# sees half of a batch, and the other ops run afterwards in order. After
+# "subscribe" the connection also receives
+# {"event": "sent" | "finished" | "error", ...} lines.
+#
+#   echo '{"op": "status"}' | socat - UNIX-CONNECT:/tmp/texttyper.sock
+
+SETTINGS = ("set_command", "set_delay", "set_policy")
+OPS = SETTINGS + ("start", "stop", "status", "report", "subscribe")
+SUBSCRIBER_BACKLOG = 1024
+
+
+def validate(op):
+    name = op.get("op")
+    if name not in OPS:
+        raise ValueError(f"Unknown op {name!r}")
+    if name == "set_command":
+        command = op.get("command")
+        if not isinstance(command, str):
+            raise ValueError("set_command needs a command string")
+        compile_template(command).close()
+    elif name == "set_delay":
+        delay = op.get("delay")
+        if not isinstance(delay, (int, float)) or delay < 0:
+            raise ValueError("set_delay needs a delay of 0 or more seconds")
+    elif name == "set_policy":
+        if op.get("policy") not in POLICIES:
+            raise ValueError(f"set_policy needs one of {', '.join(POLICIES)}")
+    elif name == "start":
+        count = op.get("count")
+        if count is not None and (not isinstance(count, int) or count < 1):
+            raise ValueError("start needs a count of at least 1")
+
+
+class ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, engine, path):
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise ValueError(f"Control socket path {path!r} exists and is not a socket")
+            # A socket left behind by a previous run
+            os.unlink(path)
+        super().__init__(path, ControlHandler)
+        self.path = path
+        self.subscribers = set()
+        self.subscribers_lock = threading.Lock()
+        self.thread = None
+        # Called after every applied request, from the connection's thread
+        self.on_change = None
+        self.engine = None
+        self.attach(engine)
+
+    def attach(self, engine):
+        # Chains onto the engine's callbacks so whoever set them (the GUI,
+        # the CLI) still gets them
+        self.engine = engine
+        sent, finished, failed = engine.on_sent, engine.on_finished, engine.on_error
+
+        def on_sent(count):
+            if sent is not None:
+                sent(count)
+            self.publish({"event": "sent", "count": count, "ns": time.monotonic_ns()})
+
+        def on_finished():
+            if finished is not None:
+                finished()
+            self.publish({"event": "finished", "count": engine.current_count})
+
+        def on_error(e):
+            if failed is not None:
+                failed(e)
+            self.publish({"event": "error", "error": str(e)})
+
+        engine.on_sent, engine.on_finished, engine.on_error = on_sent, on_finished, on_error
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.shutdown()
+        self.server_close()
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def publish(self, event):
+        # Called from the typing thread; never blocks on a slow subscriber
+        line = (json.dumps(event) + "\n").encode()
+        with self.subscribers_lock:
+            subscribers = list(self.subscribers)
+        for events in subscribers:
+            try:
+                events.put_nowait(line)
+            except queue.Full:
+                pass
+
+    def apply(self, ops):
+        for op in ops:
+            validate(op)
+        engine = self.engine
+        results = [None] * len(ops)
+        with engine.command_lock:
+            for index, op in enumerate(ops):
+                if op["op"] in SETTINGS:
+                    results[index] = self.apply_one(engine, op)
+        # Outside the lock: a threaded engine's start() joins a loop that may
+        # be waiting for it
+        for index, op in enumerate(ops):
+            if op["op"] not in SETTINGS:
+                results[index] = self.apply_one(engine, op)
+        if self.on_change is not None:
+            self.on_change()
+        return results
+
+    def apply_one(self, engine, op):
+        name = op["op"]
+        if name == "set_command":
+            engine.set_command(op["command"])
+        elif name == "set_delay":
+            engine.set_delay(op["delay"])
+        elif name == "set_policy":
+            engine.set_policy(op["policy"])
+        elif name == "start":
+            count = op.get("count")
+            engine.start("count" if count else "infinite", count)
+        elif name == "stop":
+            engine.stop()
+        elif name == "status":
+            return {
+                "running": engine.is_running(),
+                "sent": engine.current_count,
+                "command": engine.current_command,
+                "delay": engine.delay,
+                "policy": engine.policy,
+            }
+        elif name == "report":
+            return engine.timing_report()
+        return None
+
+
+class ControlHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        # Replies and forwarded events come from two threads
+        self.write_lock = threading.Lock()
+
+    def write(self, data):
+        with self.write_lock:
+            self.wfile.write(data)
+
+    def handle(self):
+        server = self.server
+        events = None
+        try:
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                reply, subscribe = self.respond(line)
+                if subscribe and events is None:
+                    events = queue.Queue(SUBSCRIBER_BACKLOG)
+                    with server.subscribers_lock:
+                        server.subscribers.add(events)
+                    threading.Thread(target=self.forward, args=(events,), daemon=True).start()
+                self.write((json.dumps(reply) + "\n").encode())
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            if events is not None:
+                with server.subscribers_lock:
+                    server.subscribers.discard(events)
+                try:
+                    events.put_nowait(None)
+                except queue.Full:
+                    # The forwarder stops on its next failed write instead
+                    pass
+
+    def respond(self, line):
+        request_id = None
+        try:
+            request = json.loads(line)
+            ops = request if isinstance(request, list) else [request]
+            if not ops or not all(isinstance(op, dict) for op in ops):
+                raise ValueError("Expected an op object or a list of them")
+            request_id = ops[0].get("id")
+            reply = {"ok": True, "results": self.server.apply(ops)}
+            subscribe = any(op["op"] == "subscribe" for op in ops)
+        except (ValueError, ImportError, RuntimeError) as e:
+            reply = {"ok": False, "error": str(e)}
+            subscribe = False
+        if request_id is not None:
+            reply["id"] = request_id
+        return reply, subscribe
+
+    def forward(self, events):
+        while True:
+            line = events.get()
+            if line is None:
+                return
+            try:
+                self.write(line)
+            except OSError:
+                return
@@ -0,0 +1,402 @@
+import threading
+import time
+
+from backends import get_backend
+from paste import DEFAULT_PASTE_THRESHOLD, make_paster
+from scheduler import SKIP, FixedRateScheduler, LatencyHistogram
+from templates import compile_template
+
+# How a run ended, returned by typing_steps
+FINISHED = "finished"
+STOPPED = "stopped"
+FAILED = "failed"
+
+
+class TypingEngine:
+    def __init__(self, backend=None, command="owo hunt", delay=12, policy=SKIP,
+                 start_immediately=False, chunk_size=16, hard_abort=False,
+                 paste_threshold=DEFAULT_PASTE_THRESHOLD, clock=time.monotonic_ns, sleeper=None):
+        self.backend = backend
+        # Nanosecond clock behind the schedule and the emit timestamps, and
+        # the wait of the threaded loop (stop_event.wait when None), which
+        # returns True once stopped. simulate() runs on a
+        # scheduler.VirtualClock instead of either.
+        self.clock = clock
+        self.sleeper = sleeper
+        self.current_command = command
+        # current_command parsed once into a templates.Template
+        self.template = compile_template(command, clock=clock)
+        # When set, each send takes the playlist's next line instead of
+        # current_command
+        self.playlist = None
+        # Reentrant so control.ControlServer can hold it across a batch of
+        # set_command/set_delay calls
+        self.command_lock = threading.RLock()
+        # Held for the duration of each send; engines that share one (see
+        # jobs.JobRunner) never interleave their keystrokes
+        self.inject_lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.delay = delay
+        self.policy = policy
+        self.start_immediately = start_immediately
+        self.current_count = 0
+        # Text is injected chunk_size characters at a time with a stop check
+        # in between; hard_abort drops to single keys so Stop lands mid-word
+        self.chunk_size = chunk_size
+        self.hard_abort = hard_abort
+        # Sends per scheduler tick, injected together (see inject_burst).
+        # Count runs end with a partial burst when needed; a rate limiter
+        # keeps it at one send per tick.
+        self.repeats = 1
+        # Commands of paste_threshold characters or more go through the
+        # clipboard as a single paste; None always types
+        self.paste_threshold = paste_threshold
+        self.paster = None
+        # (text, backend layout version, keys) of the last send: a repeated
+        # command is translated to keys once and replayed after that, None
+        # keys meaning it is pasted
+        self.compiled = None
+        # Optional ratelimit.RateLimiter consulted before every send
+        self.limiter = None
+        # Optional profiling.Instrumentation; sends are only timed while it
+        # is attached and not "off"
+        self.instrumentation = None
+        self.stop_requested_ns = None
+        self.last_emit_ns = None
+        self.stop_latency = LatencyHistogram()
+        self.lateness = LatencyHistogram()
+        self.scheduler = None
+        self.thread = None
+        # Called from the worker thread after each send, when a count run
+        # completes and when a send fails
+        self.on_sent = None
+        self.on_finished = None
+        self.on_error = None
+
+    def set_command(self, command):
+        # Raises ValueError for a malformed template, leaving the old one
+        template = compile_template(command, clock=self.clock)
+        with self.command_lock:
+            self.current_command = command
+            previous, self.template = self.template, template
+            playlist, self.playlist = self.playlist, None
+        previous.close()
+        if playlist is not None:
+            playlist.close()
+
+    def set_playlist(self, playlist):
+        with self.command_lock:
+            previous, self.playlist = self.playlist, playlist
+        if previous is not None and previous is not playlist:
+            previous.close()
+
+    def next_command(self, ahead=0):
+        # ahead counts the sends of the current burst before this one
+        with self.command_lock:
+            if self.playlist is not None:
+                return self.playlist.next()
+            return self.template.render(self.current_count + 1 + ahead)
+
+    def set_delay(self, delay):
+        self.delay = delay
+        if self.scheduler is not None:
+            self.scheduler.set_period(delay)
+
+    def set_policy(self, policy):
+        self.policy = policy
+        if self.scheduler is not None:
+            self.scheduler.policy = policy
+
+    def set_limiter(self, limiter):
+        self.limiter = limiter
+
+    def signal_throttled(self):
+        limiter = self.limiter
+        if limiter is not None:
+            limiter.signal_throttled()
+
+    def effective_rate_text(self):
+        if self.limiter is None:
+            return f"Effective rate: {60 / self.delay:.1f}/min" if self.delay else "Effective rate: unlimited"
+        return self.limiter.describe(self.delay)
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def prepare(self):
+        # Loads the backend (and pyautogui with it) on first use
+        if self.backend is None:
+            self.backend = get_backend()
+        if self.paster is None:
+            self.paster = make_paster(self.backend, self.paste_threshold)
+
+    def start(self, mode="infinite", count=None):
+        self.prepare()
+        if self.is_running():
+            # Clearing stop_event under a live loop would leave two running
+            self.stop()
+            self.thread.join()
+        self.current_count = 0
+        self.lateness.reset()
+        self.stop_requested_ns = None
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, args=(mode, count), daemon=True)
+        self.thread.start()
+
+    def stop(self, requested_ns=None):
+        # requested_ns is when the stop was asked for, when that was earlier
+        # than this call (isolated.IsolatedEngine's parent process)
+        if not self.stop_event.is_set():
+            self.stop_requested_ns = self.clock() if requested_ns is None else requested_ns
+        self.stop_event.set()
+
+    def close(self):
+        self.stop()
+        if self.thread is not None:
+            self.thread.join()
+        self.template.close()
+        if self.playlist is not None:
+            self.playlist.close()
+
+    def compile(self, command):
+        # The backend's keys for command, reused while the text and the
+        # keyboard layout stay the same. Texts the backend would type with
+        # characters missing are pasted when a clipboard is reachable.
+        backend = self.backend
+        version = backend.layout_version()
+        compiled = self.compiled
+        if compiled is None or compiled[0] != command or compiled[1] != version:
+            paster = self.paster
+            paste = paster is not None and (paster.should_paste(command) or not backend.can_type(command))
+            keys = None if paste else backend.compile(command)
+            # Compiling may itself remap keys and move the version on
+            compiled = self.compiled = (command, backend.layout_version(), keys)
+        return compiled[2]
+
+    def inject(self, command):
+        # Returns False when a stop request interrupted the send, in which
+        # case Enter is never pressed
+        keys = self.compile(command)
+        if keys is None:
+            self.paster.send(command)
+            self.last_emit_ns = self.clock()
+            return True
+
+        backend = self.backend
+        step = 1 if self.hard_abort else self.chunk_size
+        if len(keys) <= step:
+            backend.send_compiled(keys)
+            self.last_emit_ns = self.clock()
+            return True
+
+        stop_event = self.stop_event
+        for start in range(0, len(keys), step):
+            if stop_event.is_set():
+                return False
+            backend.type_compiled(keys[start:start + step])
+            self.last_emit_ns = self.clock()
+        if stop_event.is_set():
+            return False
+        backend.press_enter()
+        self.last_emit_ns = self.clock()
+        return True
+
+    def inject_burst(self, commands):
+        # Several sends as one injection: each is compiled (repeats of one
+        # text share their keys) and the backend gets them all at once,
+        # flushing once and checking for Stop between them. Returns how
+        # many went out. Pasted, chunked and hard-abort sends go one at a
+        # time instead.
+        keys = [self.compile(command) for command in commands]
+        step = 1 if self.hard_abort else self.chunk_size
+        if any(entry is None or len(entry) > step for entry in keys):
+            for sent, command in enumerate(commands):
+                if self.stop_event.is_set() or not self.inject(command):
+                    return sent
+            return len(commands)
+        sent = self.backend.send_many(keys, self.stop_event)
+        self.last_emit_ns = self.clock()
+        return sent
+
+    def inject_timed(self, command, marks):
+        # inject() appending a perf_counter_ns timestamp to marks after each
+        # of profiling.SEND_STAGES it covers. The text and Enter go out as
+        # separate calls here so their costs can be told apart.
+        now = time.perf_counter_ns
+        keys = self.compile(command)
+        marks.append(now())
+        with self.inject_lock:
+            marks.append(now())
+            if keys is None:
+                self.paster.send(command)
+                self.last_emit_ns = self.clock()
+                marks.append(now())
+                marks.append(marks[-1])
+                return True
+            backend = self.backend
+            stop_event = self.stop_event
+            step = 1 if self.hard_abort else self.chunk_size
+            for start in range(0, len(keys), step):
+                if stop_event.is_set():
+                    return False
+                backend.type_compiled(keys[start:start + step])
+                self.last_emit_ns = self.clock()
+            marks.append(now())
+            if stop_event.is_set():
+                return False
+            backend.press_enter()
+            self.last_emit_ns = self.clock()
+            marks.append(now())
+        return True
+
+    def run(self, mode="infinite", count=None):
+        try:
+            self.typing_loop(mode, count)
+        finally:
+            if self.instrumentation is not None:
+                self.instrumentation.release()
+            if self.stop_requested_ns is not None:
+                # Time from the stop request to the last key that still went
+                # out, zero when nothing was emitted after the request
+                last = self.last_emit_ns or 0
+                self.stop_latency.record(last - self.stop_requested_ns)
+
+    def typing_loop(self, mode, count):
+        sleep = self.sleeper or self.stop_event.wait
+        for wait in self.typing_steps(mode, count):
+            if sleep(wait):
+                return
+
+    def simulate(self, mode="infinite", count=None, until_s=None):
+        # Runs the schedule on the calling thread against a virtual clock:
+        # every wait advances self.clock (a scheduler.VirtualClock) instead
+        # of sleeping, so a day of sends takes a fraction of a second. Stops
+        # at until_s of virtual time when given; returns FINISHED, STOPPED or
+        # FAILED like typing_steps.
+        if mode != "count" and until_s is None:
+            raise ValueError("An infinite simulation needs until_s")
+        if mode != "count" and self.delay <= 0 and (self.limiter is None or self.limiter.effective_rate() is None):
+            # Nothing would ever wait, so virtual time would never reach until_s
+            raise ValueError("An infinite simulation needs a delay above 0 or a rate limit")
+        self.prepare()
+        clock = self.clock
+        end = None if until_s is None else clock() + int(until_s * 1e9)
+        self.current_count = 0
+        self.lateness.reset()
+        self.stop_requested_ns = None
+        self.stop_event.clear()
+        steps = self.typing_steps(mode, count)
+        try:
+            while True:
+                try:
+                    wait = next(steps)
+                except StopIteration as end_of_run:
+                    return end_of_run.value
+                if end is not None and clock() + wait * 1e9 > end:
+                    clock.sleep((end - clock()) / 1e9)
+                    return STOPPED
+                clock.sleep(wait)
+        finally:
+            steps.close()
+            if self.instrumentation is not None:
+                self.instrumentation.release()
+
+    def typing_steps(self, mode, count):
+        # The send loop as a generator that yields how long to wait before
+        # going on; the caller does the waiting (a thread above, asyncio in
+        # async_engine) and returns when stopped. The return value is
+        # FINISHED, STOPPED or FAILED.
+        scheduler = self.scheduler = FixedRateScheduler(
+            self.delay, self.policy, clock=self.clock, histogram=self.lateness
+        )
+        scheduler.start(immediately=self.start_immediately)
+
+        while True:
+            yield scheduler.time_until_next()
+            limiter = self.limiter
+            if limiter is not None:
+                wait = limiter.wait_time()
+                while wait > 0:
+                    yield wait
+                    wait = limiter.wait_time()
+            scheduler.mark_fired()
+
+            instrumentation = self.instrumentation
+            marks = None
+            if instrumentation is not None and instrumentation.apply():
+                marks = [time.perf_counter_ns()]
+            command = self.next_command()
+            if marks is not None:
+                marks.append(time.perf_counter_ns())
+            if command is None:
+                # A non-looping playlist ran out of lines
+                if self.on_finished is not None:
+                    self.on_finished()
+                return FINISHED
+
+            commands = [command]
+            repeats = self.repeats if limiter is None and marks is None else 1
+            if mode == "count":
+                repeats = min(repeats, count - self.current_count)
+            while len(commands) < repeats:
+                following = self.next_command(len(commands))
+                if following is None:
+                    break
+                commands.append(following)
+
+            try:
+                if len(commands) > 1:
+                    with self.inject_lock:
+                        sent = self.inject_burst(commands)
+                elif marks is None:
+                    with self.inject_lock:
+                        sent = int(self.inject(command))
+                else:
+                    sent = int(self.inject_timed(command, marks))
+            except Exception as e:
+                if self.on_error is None:
+                    raise
+                self.on_error(e)
+                return FAILED
+
+            if limiter is not None and sent:
+                limiter.record_send(command)
+            self.current_count += sent
+            if sent and self.on_sent is not None:
+                self.on_sent(self.current_count)
+            if sent < len(commands):
+                return STOPPED
+            if marks is not None:
+                marks.append(time.perf_counter_ns())
+                instrumentation.sends.record_marks(marks)
+            if mode == "count" and self.current_count >= count:
+                if self.on_finished is not None:
+                    self.on_finished()
+                return FINISHED
+
+    def timing_report(self):
+        lines = [f"Target period: {self.delay:g} s"]
+        scheduler = self.scheduler
+        if scheduler is not None:
+            achieved = scheduler.achieved_period()
+            if achieved is not None:
+                lines.append(f"Achieved period: {achieved:.3f} s")
+            if scheduler.skipped:
+                lines.append(f"Skipped ticks: {scheduler.skipped}")
+        stats = self.lateness.summary()
+        lines.append(
+            f"Lateness over {stats['samples']} sends: mean {stats['mean_ms']:.2f} ms, "
+            f"p99 {stats['p99_ms']:.2f} ms, max {stats['max_ms']:.2f} ms"
+        )
+        lines.extend(self.lateness.format_buckets())
+        if self.limiter is not None:
+            lines.append(self.limiter.describe(self.delay))
+            if self.limiter.throttled:
+                lines.append(f"Throttle signals: {self.limiter.throttled}")
+        if self.stop_latency.total:
+            stops = self.stop_latency.summary()
+            lines.append(
+                f"Stop latency over {stops['samples']} stops: "
+                f"p99 {stops['p99_ms']:.2f} ms, max {stops['max_ms']:.2f} ms"
+            )
+        return "\n".join(lines)
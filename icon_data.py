@@ -0,0 +1,481 @@
+# Generated by build_icons.py, do not edit.
+# (name, pixel size) -> base64 PNG of the 20 px icons at every DPI scale
+ICONS = {
+    ('settings', 20): (
+        'iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAABI0lEQVR42q2VzQmDQBCF13jRS67a'
+        'gGePWkZKyNVGDNiAHcSzBcQSEhA8hzRgAYIhb8MTJv4bHPhAZmcG3844KjVvR1CANyno22QWMPgc'
+        'gQr4pKJPMcaaK2SCFLSgBGdwB7mI0c8PnpWMTZk7MH3wAgHIQA1i4IkYj76aMQFz0jGZLQO0HYA9'
+        'o8ZmjGJO25dvUEImAjtzwYm4vTMde2XuwM6UYos7TUADnqShzxRvWjP3ZzQiNiAW/oT3Ewpfd2eJ'
+        '8MXMjbqRKjgOuWiAy7cJRpSEPHNEo3LW0LW+A+v3kk6UOGVPxkjzWWv/gmOSHcoK/5G8pSnhmqbs'
+        'PjZLg+2IwXbWDvbun97Ucrj8uxy2rK/72vUl5asVC1YtLdipX8Btyy/gA/F5b2V6j0hJAAAAAElF'
+        'TkSuQmCC'
+    ),
+    ('settings', 25): (
+        'iVBORw0KGgoAAAANSUhEUgAAABkAAAAZCAYAAADE6YVjAAABa0lEQVR42r2WMW6DQBAAcZMKWSko'
+        'UoXSfwiN/Q7nBaSk4AUUVngD6f0VGtz4AdS4IEJWCguyoEFCpwOTGFhpdGjZXW7vdu8wjHHyJETC'
+        'j1AxRugnE1cohVDwGUv0/5KNEAieYKL7ElLFLkVvYOfht7n3gTchFwrhJiRQMXal1Z94vuH3LThD'
+        'GeQ4WMIWp1jYC2vFfo0+xm6HX8KHtBkFGFsd3bOwupP9CrtWLOIEOmOPlHcPFsmWOJ7upUmqhTKz'
+        'Wl6oqLNwYQzRG0rmBXHMvlmcWOPuEtWbmAlX4SgcGK/oHWXpYk2RNA3lUo4Vm9nNIMPJVvxs9JmS'
+        '0Z44dbyPtmEjGivFqVtFITN+7cnc5n2oVF1CvJL4zRER9gQ5szRDcsROJyHxm9T8HqMLezAkB+x0'
+        '4hN/mUzG7In96J7MWV2u7jpI5uqTsR3/OUXHL3J2LXIKD90n73+8T/KhG9KZ+2Zc7I5f7G9l8v+u'
+        'X1a+rgKQKSe3AAAAAElFTkSuQmCC'
+    ),
+    ('settings', 30): (
+        'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAABzklEQVR42sWXMW7CUAyGQUUVvCGh'
+        'AyfgBNyBnZWNg4BSrkFpOQFDpzJ04ghIqBtbURYmxBSG1EFfpKfXlxBC0LP0S5Hj59+xHcep1W6T'
+        'umAiOAhicEBXrz1QRpCFgjUI0Y2qImkBXZaQdDVdF92ywPlceRbMBJHgLFgIlGAg2EHiafYeuh02'
+        'ijNnfLzh8yrpJ45+BFuuj1pNN4KGdqaBLjZst/iI8ZlLPsPwm8ibgi8inwt6OWd72CS2K84qfMX4'
+        'zqxpRJTKeKLODaXqGBlR+Iyyat6iLluirUqa+DznNduCtKyMqHVpC4aCKUiuXzJsG5QqxnemKJoj'
+        'sqQ3cRIITlojpUh0r5ZgO/g6GuX7JwMczS2kabfvBWNBHyTXv1r3muRz7g1sY3DEAEjfU7N7A63b'
+        'fUvAvta9gaXb0/d8CddlvE6MtG0sNT3xVH5OtnyyceKM/mAbgyPhvAz5kNHnWVI1xHhcoIPH2A4t'
+        'pfLgCOG8GK5znE2x6Rcg7mM7zbFZY+OO2FmqizbXvurmcvY6VTFA9mUGSFUjM7hnZJb9SLTv+Ugo'
+        'V5/FrEXg6dGLwLXV550OrWfs26VXH6fLXlXr7cet663Thd75L8xDf9r+AEE3+otaLK7kAAAAAElF'
+        'TkSuQmCC'
+    ),
+    ('settings', 35): (
+        'iVBORw0KGgoAAAANSUhEUgAAACMAAAAjCAYAAAAe2bNZAAACMklEQVR42tVYvYrCQBAWJIUYia1g'
+        'd29hqqsU4oG2V5wvoI9gYXui2F16H8BOfYYUFhaRs7WwtjhEkNxNji8yLJs/k3i5hY+Q2ZnZYWZn'
+        'ZncLhfvHK2FPcAjf+O5Bf+hoMyNEOJh/2Fhj4QlBI1TwnYC+TnvBJ8KIMCMYwtwWi+oCXQd9K9AN'
+        '6BlBb6zRJHwJ7jcJPYLFQtQQ5BosVBb4TUGPq7cVx5AzBJeEMeEiKHTnF4SyIFsG/SzwX6BnyeRb'
+        'UULjeWROKILegcIDYYD9ETTc+T74L5AvQN+ceSgwZCPmkaIwVyOUYoa7BDk+isxDoyDhGZjGGWfj'
+        'GOvMgpgMFuNORMUqoY5vlNFhe9AIYzaZQTUfniphSLCFCrwDveojV2OGmFEs74H54LNHnglHlilX'
+        'wglfj3YEn2wPHcDTi2KMBea+jyFe2m4IXRYeFf8blr4ygwaYt4J6zRqV04EiTRKaI0t7xUeXwtL3'
+        'KAmZBv0O1nPXfeHdV2x6C8kiQ+YRJcS7CvPQUDK/kDTX326/Z01PR0kvSxTswNeNmDVd8NuSuTLW'
+        '0Vlzde24eUULSV8Hm1SNkfJXyKkh1drzzs1VlQCBOnhOMYvbCXL1AJ4KsyFfnom6Z+yM9syU75lc'
+        'ZVMe6kw7rAIP/qoC57Y3JenadppdO1fnGe+k956Hk96jzsCrKGfgNG8Hg6S3g6zvTSsm30x6o3y7'
+        '40b5keRGmbu79r2vENOsXiH+zfuM1+0/03y5+gH1SFUY3Oj6ngAAAABJRU5ErkJggg=='
+    ),
+    ('settings', 40): (
+        'iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAACpElEQVR42tVZvU5qQRAGTDSRG1ue'
+        'QAt8AQsTbqO8AAUdJpcQOwi+g4QOCrC2xYTGwkiiDZLQ03G11Ob0xFiIw813zHc3u7DnzwOTfAnZ'
+        'mZ2ZszszO7skEsHpWDAUfAjmwOL3E3ix0pHgnRxT8Q6Z2OgejrwKKoIiUMHYHDKR0o4gI0hpeA6c'
+        'qGt4dfAcDS8FnTtBHNsVdAUzGHoTlMnACfHONfPPwVvInNIHlqHL5V3BlmfnHgxxdS14VsZKGh0l'
+        'ReYFc3U6HwVpv851BHnBWKN4KmgalKfBm2rmjaGzozhptZJdmtSg8T3BCOMDQU6QtNCXhOwAc0fQ'
+        '5VKD7HVtEmJGK6fStmA/QFwfQIdKHYrJpYmToa/J/2C5ypPdzDLBFGXYWNmKqGiP4vvNUM7+ozJ9'
+        'zciwJWpSFQRtQR9oY2xV0G9TXM+pjK0kLgemmNsS1KhY6+BAZmtJTHL5sqIU1bmBQeaX4I6Ufwom'
+        'gh4wwZjLv8McHbnZ/WyzvQmcEK7inGHl2LlbQVYjlwWPndStZI5kTpZ1JffYkhkVYV2dq5HCyxW1'
+        'MKnUuZpBZkplxoEvR9zP6VqmpiEhHFo520J9SzGpS5ymoVX7108+UctUxyFfMhxfBYq5rIdSkqWY'
+        'LBg+vATbdWrVFo3wdydcsTDUhuzER72bYG7LQrZCnfn3khYtJvYh2/PhYA9z+xayRfLrxxy88evg'
+        '2m/xUJMkZyEnyeGKJEnD5sL2hZoka19mghTqhsdCXfVTqMM46g6jPuo2qlnw0m5VLdqtatjtlt+G'
+        'tUUNayuqhnXtW/61vzTZXDsP4rx2erm4/47j4u4G/aPl08ffOJ4+wno8Oovq8Sjq57c/1AzMYGM3'
+        'SIb5fcC8iPoBc2OegDf6Ed3tJ3V/QwwTIfwN8QXYdb1yBgOw5wAAAABJRU5ErkJggg=='
+    ),
+    ('settings', 45): (
+        'iVBORw0KGgoAAAANSUhEUgAAAC0AAAAtCAYAAAA6GuKaAAADBElEQVR42tVZMWsiQRReBBMORLBI'
+        'SHUQT+5PnFhf6pMjKB7YRdRrrPSw9wdoZadduuwvyKWzMr/ALleluAQkKDHem+NN+Bh2xtl11d0H'
+        'H8rOe2++nX3z5s2M44QnOcI14YmwBjzx85wTMflMeFTIqnhkvciIC+QmhBFgAm1uVAgnCS9M6o6Q'
+        'UNoT/HzNesl9kPpI6BCGhC4hq7SnYSQHGh990EkrbefsV/j/xf1tJd8IcyU2xWiVCceECuEW2voW'
+        'pH8TfrB9Gb6ShOivGJTwd8ISnL3B/1fCg8dka2t8tT10/7AfL/9L7t+XFIGwcNYipAh1wkrpfMkT'
+        'rEo40vg74vYbwkKxX7HfFPfzBn6LfmJ4DoRrSnuVR0jo9AhnPgfkjO3m7KeqtNeA+Nw2xjswCi2N'
+        'jpiMp1vOl1OPSS2lBRw6Ns6GMMqpA6XRFIz20MagC29ZPxDpOnDo2hhkIQ2tPGJuk5wQ8oQL/j3x'
+        'aV+Fyf7CedxKypCOXg2xJ+UDoUm4V1KXDDPx/CfrbRow7Lfs522PIQ/PN0y6AmG2oViSmLG+aXLK'
+        'zPXAPKylAh31DHqXygL0TBgTGoQS/475Oeb1S4PPHuhWbIufNCzNC0MeLigLkKg7MhrdDLfjwlEw'
+        '5HG5AN0yn6SuHnY96oAbQwzPgPCV5Re8AuIzQ4y7HvWOi/V4zlDA6zJH06JI0skAbJuGDKLbSPzf'
+        'AV3Dwzt22uciR1dL3EMMZ3ySzkCMTw21Spt5DKAeXzPf9z3dxKOA1+Vh+YnHARePMYSWTR5PwA5I'
+        '8H1/g5Flh3mwaQQk3QAfeUubEdj4Jn0BNqWApEvg4+s+SIc90l+CkI5lTMcye2ybpwd7ztOfwloR'
+        'a5aEa2GtiLGtPbap8haHrvJiXU8H3blMNTuXKbfvbOcStT1i1sYolrvxWJ572JwwnUfthCmWZ3m7'
+        'PDV1d3VqGtvzaSm7uAkQ+vImoOSEfBOAMb7tnQtWdqY7l44Twp2L7QFP5G63bCR294iyHo/dja3D'
+        'OwqxFfrr7Phu/B+woTPUwgOZMgAAAABJRU5ErkJggg=='
+    ),
+    ('settings', 50): (
+        'iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAYAAAAeP4ixAAADpUlEQVR42t1aT0tbQRDfJ8lFLKkI'
+        'QS/ec2wCgmdzS6RFWvSWfACvzQfIxZw0Bf0G+gniuSIIweLJPxhtoFZ7DSGhhyikdl6ZJ8P43r7d'
+        '916S7Rv4gWZnZ2fezszO/hEiepoF7AAeAH8Azwj771/YNisMpzTghijvhRvkNZYO2Ax0AR1El83Q'
+        'galGvAEMUMknwArAIu0W/vaEPAPsM3ZKAhYBKY/2DPnaTYmcJuHLePCkcKxklAbMAOqAHg4+BBwB'
+        'soRnCvCRKHgskXdM+D5hX4eyKHuI7faYX1CHUPQWcOoRsL8Bq4BNQIu1qRriBL4to4gy3cY6RV0i'
+        'McIO1EtAXyErVSVyqwr9+zgWTQ7fghgzw4x4BKxh2zzgwmXwe0ANsMyCnJOFPFuAny5yLnAMgWM+'
+        'spnRcrM6M+KDy3pxju3XgHVAIsCsJ7DvNco6d1lf3jNj6jrZqUfcac2DbxqwFFFmSaKsaY/2NeJm'
+        'PdUxF4n1lwatU5dEr0WVDimS/vrEXydJCyTJDCVr2Ss6YsE3yboozZLLkU7nLMvp5xL/dfP3AmAX'
+        'cAJoI+y/97BNNa6mSVJx1q53ul+iyNLikg+/nVbLgDuFdeIOeS0fmUus32qQKd0kAq59vqLtsw0F'
+        'AzgOffw9SVLzM+qkRVOs7Fj3MeKMKXgLqABygDlEDn+7ZbxnPsZsEN4Wq82kpXgGizm6Yick7nRI'
+        'eJ9Q2YTPV66Qcv4ZZ9OSLJr3rNDMeG0B0rjRGbhM/5ZEqTIzQseHV5kxZQlvzUWvAeqcpnts2fZ0'
+        'WfJlaWBXAsRhhSUArzhc9tk2/zsD2GFftYml9jFWql5TXmAxEaTWSrKYKUhcuEr0arLZ3BZ42uHU'
+        'VSsaSuwRQZ9DLHh0VnY1+uVJ/WXb8PJPVyGvUzohCuRCGJIjck40+lmoszMJL0I6mgq0Sd+5EIbM'
+        'ETltzb4d0tcoQ76HMSQ2rkWDPR8w2CsmBHtU6TfITjHS9GvKgvgj7ILolCj7HiVKTaJIKcISpRS2'
+        'RAlbNDZcisbkpIrG2JXx495YNUa9sQq61S1h0KpsdUvj2OqafPiQ1TEkFsdBJh7QzQc5oDP1yPRK'
+        '98g0NofYNuleK2wIA68VbJJd9CyIaC56amzFpsllgcxEqIsem2Jx9eZlDL8MLYrwl6EtMeLLUOpm'
+        '47qetk/av4oRXE/zzPJfPxhQJf6EIy9eP+HICwOecKiQzqOafWEwxeaZk3MGsC3cH549YFvkD8/+'
+        'AmY5uAjW4Q2KAAAAAElFTkSuQmCC'
+    ),
+    ('settings', 60): (
+        'iVBORw0KGgoAAAANSUhEUgAAADwAAAA8CAYAAAA6/NlyAAAEXElEQVR42u1bvU4bQRBeMDSIH7uL'
+        'IiwOYcELkA7JFJSWjOAdKALIEgiBgA43rkyQXNCQgg6egeQFCIJApDRGipwfZAcKQ4UFyVw0J5bR'
+        '+vZ2b/1zXFb6Cs6zs/uxu7Mzc3OMNb51AGYAHwC3gD8E9rOPgFmUDXSLAPYEJOvhPfYJbNtUIOtg'
+        'M6hkBwBVjkgNsA/IArYQWXxW4+Sq2DdwLUVWbtFFdpHIptqJSBfAAgwDul3k5giJIRfZISI75yLb'
+        'jWNbOJeGtT5ADlDhJnYD2AZEBfKrhMSgi+5BIrsmkIniWDecXAXn1Gea7CvAmYuh+QqIA3oB84BT'
+        'wKMPwo843gKSieMY9cY/wzkaI3vhwbp+A5Tr/HYvMUQDKCPqW0HdsvG/mCAtIvsLsATIAEoeJlKS'
+        'nEn+zHvVl8E5XJHfLvyQ7hNs4++AMU7GNhyXgkldA/KAcUCnwpid2CePOqjeSzRYThvDOdHtrXWm'
+        'cwKyowI5m3QRZX4DVvAs+229qMshXsSxaBsVkM7pXD28Nb4iK0tbP2AKEGvA7RBD3f0uMmNke1dU'
+        'ryyL/MeWAuDoLJE5Wyqdh0nnTAAIZ8ich1U6d5MLvqSqoMnNIhb+RscL2xZYSMvA5OyYtwfRYYgs'
+        'vSm2dRRFBd5NUWI86l01ScAO4ARwx+m7w2f2b5OKV5hjLIsCry+q+9+LC7ycKYX+acBnhVjYlp1W'
+        'WPkpgbcX93sXlolDEfO4Ow40gn8Hhx5XKUYclLJfH2CeTGTFQ5/XgHMBiQfAMaAAWEcU8NmDQP4c'
+        'dcnaCuk374fwKVndXg8rS8na2YxdQMKlXwJlagLSUQ+7kF/lU9W0TAod+TUS4uU99D8kE/4BmFAY'
+        'fwL70O0ta3kSWq4hh1S9KC2CybOqy7kalww6LSA7orGrRgSk05I+4y7zvkVuEf5elKVSS5Iro5NY'
+        '45riyopWukast2x8WWi551j/WYngvYd4dpL02TXgUOwSnUkP8fS9hIvN9d8bAX5lFjCpNojwkjLd'
+        'IdY4YYBwgljvHY82yJn3EGZD+Z1ic332+mNfc3InnI5jgz7yMaf3RFPHPjnPz5Y8q+kb8+5iwSDh'
+        'AnFDdXzvLOH47I8tDYU9RMe6QcIbRHePho6t/4TDtqVDZ7TotbTYptfSO1PXkgnHIxkQx2MmlK6l'
+        'qeAhLQgeEppb+afB4KFKgweaI2q38PBAIzxclYWHoU0ANCvFs4FouxRPq5J4B61K4rUiTZtW0G80'
+        'TWs6EW87Dp9cEvHJVifiQ/WqJXQv00L3utRiwXshvsx8vBAPeslDmWlU5eoUtVyjI2CiMq6pRS2M'
+        '+S9bsi3lG2a+bMkiK2usbMluosK0K9YehWnLzHBhmhvpF1t6yJP2Wlz6lgW8uJQ/0zmyis0uH6Zn'
+        'u2Hlw3yLsKcC8S7JmWxEgXgXeyoQb6sPQl7MJwBem5+PPPpZQFuoPuNxzrvKh1p7LOAfajnxr50A'
+        'P2L1P8Wz3wg05VO8vya46jyFlPupAAAAAElFTkSuQmCC'
+    ),
+    ('update', 20): (
+        'iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAB6ElEQVR42p3U30uTURzH8WcX62Im'
+        'ZNOE2X5AkQTlhm70y39geRtGXUkQ9AcYQUIXKTTFxJ9t1f0YCApGkCvqIvpBaLiIDV00txubCHVb'
+        'kU/vrxzhtJ79HLwuznnO+ew55znnaxg1/FzLN08iCbfR6M+TjnhxC0vutZEMYSa+I1xvUAse4zc2'
+        'MOdevTuuAuM4rMZdgKta2HF8wTrCsKklt+MS9LEL2EKgXFgbNvEMB2tYyQEk8A1HrQbMIwVHHdsj'
+        'oe/w1PP53j8PurGLMw18PP9/c2lM4nW1yae+ThmhQuwGngQL0VZt/itM64GrGKoU1pOP2gmKwhTB'
+        'QuysNv+2ZOiBO7istV3yxrgu7WA+6iTkpQr7iWsly76CYmlgv9YOqX351ZmdGCAgq8KKvFmvxT5e'
+        'la+td6zJrSgZJPtq+jKjZiA3K2Ep9s1X5sPcwQe94wFeWByJ9xKKxa7cjOXZ7Fl5KGPf4r4++Tz+'
+        '4HRJqEMt31bh2JxT2+PXOw11Q97AXscZbMInuTFWDz3YRlyWW0NYM5LIobXcILkxRbmG+30dyUEp'
+        'Dv04sjcmE7Hx/KKqRFkcq/bPHbKnqso4kZDS5f44PCalTAVJaXuEQ3XdU4L68GMvMDWSlmKriq63'
+        '4cpNmAfPcaKW8X8B3VtRizbi6dcAAAAASUVORK5CYII='
+    ),
+    ('update', 25): (
+        'iVBORw0KGgoAAAANSUhEUgAAABkAAAAZCAYAAADE6YVjAAACaklEQVR42q2WTWgTQRTHt9VaKPEk'
+        'SE1ME6uHWorYGC1WpPTgxYIIXrQnBQ+K9WAxUG39AKFGPIiXJAcRURAUFC+C7SGgqKAnbSEUa0sT'
+        'vzXWL6we1PU38haGcdNusl34QfLmzfvvzHvzZi2rzCc4lLgK+6HKms+nIZeMQjccC2X7JhCw4Q4s'
+        '9xu4GnbBY7AdQneP2iLyC3r9CKyEhxL4JQxCJ9QHhxNDBFer2az5B+E6xL0KbISPMAOHodbISRcE'
+        'XF6qKHO65hJohk/wGtaWufoV8Ax+QFspp0UwCl+gpcJtjsB7mIA6N4dDkoM9Pgtmh8TpNwcWwAt4'
+        'Ar7qP5xLqniP4A0s1EU6RH2f12Atk+eteCHTs76QKcIp46X3SrxO3TggxqgXgVg+VUPgDNjCiEtu'
+        'VLwB3XgJvplbxf8YnIClji2eTy8haFYTeMeK2o15VfAdLurGG6psXZI4Km90X+1vvJBuJuhzTeAp'
+        'tmiJAlBVdk03XIavEZJmOKacdtI4dvYmQT9rArfW5dOBWVqSOi8XdONJCRYynOtgxBFqGj9nszV/'
+        'EBhsnUpVz1LGq2ROn27cIsbdLhNWS77U+Awr6vZwVnrEf5N52tUePmjInXGb1AZJL61Gtkrlckr9'
+        'NgePi/p2nyfeOSMH3QYDov4WwhUKrFEFJJ2jppRTO/yEMXWgyhSISSuZhqa5nLdJ+X1Q7du4SxbD'
+        'VsO/FhJylxRLtnkXoQ1y09VrAh0wyc14G/syuSlPwyvtwDZWnEyCJ+C3uttD9/pt/c6Xjrvzv0qq'
+        'QCQMw/9EskfG1VeLfL1ErPl81HcWHIAr5c79C3DT62ir/sqNAAAAAElFTkSuQmCC'
+    ),
+    ('update', 30): (
+        'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAADAElEQVR42r2XXUhTYRjHN9Ey6EPS'
+        'CseOwzLUIcrc+tSLorsiqSgK8qoiabQwSO9WS6UaUZC2j+qii4SKbroK8sJBaGApEsS0CG0j7PMi'
+        'c7Uc5un/ynPg7fBuOzucHPxu3o/nd96P85xnJpPOn+VpWwN4BjaYFuNXFr2yFFRbB70eSGUwA1os'
+        'fefM/0O2DrSD5yAFZGm0Uyaxwj0jhavAdZBkMuIriEjDHRFOOgSquHlmUKhX2gDiJEuAblBvQ1A6'
+        '450gBbwgXzU3DL6Dg7lKD4DfJH0ISgWXqwTUpZl/BvwhTmuV7gKzNMljjfr17th+OqJ5cCTb4FI6'
+        'Q7bSkwbckSYwB2ZARaaBD0gasgz7jLqgXRTzSdnry8IBdbQtU2CFwe/9BMm3igbcos6zeiXOWGiN'
+        'MxYsEsQ+RbHvqjvywBdKDsW5Cmsmbphc8bBnUzycAj9c8VCtKn4RXdhvzMV32OmJBnOV1seCBZCF'
+        'gayAh3ALVj1ADrv6vWWNgTTnVA4qBVtbDFE/LwWv0F4iiBEixz6+sYUazwsmbKcjYBevWWl3xUJ2'
+        'SN6ppI8hXZ7m4S+S47hI7M1wMZTUWY0z3A3JNCecx/ZeckwG8jLc7k6KcYxvPESN3YIJK8FbRW4b'
+        '83/AquY4aRLSoxpeq9sUo0n9DrPGSJpJDv4LtX78qux4H2DSKWz5Fo3v8xDN38g35tPXJJkueai2'
+        'XMZX6kXtZI9Vo3Qtpc6PUtRvVnf2UtATosk2fCzQ5wNvQBAsyyF7tVPsm6LORupk57nE4GLiE33t'
+        'akQDGH0kv2CEtHx8YZfuUMzeTE9XCX7SeewxYLVukn5mdVu2wc2ULH6BvXqEtrGF3Wul7WU5eofW'
+        'J20lOZvoTlNXO8BqwVwLeEQrTf6TIjXKD4Np0KMSFgAfFXqNXFXppIIwQdIY2Kb3jAolqipJagcv'
+        'lbJWGunoZ0mHK5eUVV5jGc+wOhuy+3wRL412KbJZKvbbsl4inWIzcIMEE+NvDMtmVay8WZT/T5BW'
+        'gAGwWW+Mvwrnnn4EbHNRAAAAAElFTkSuQmCC'
+    ),
+    ('update', 35): (
+        'iVBORw0KGgoAAAANSUhEUgAAACMAAAAjCAYAAAAe2bNZAAADvUlEQVR42s2YXUiTURjH9/pVGVYk'
+        'UW5+Z59qoi0si+4qwosioi6CLsTISiEQJYUsiHSmRGY6DbzqpoLC0sJZOSPwJqGQ5lrpciMiKig1'
+        '+nL69j/5rI5v551zH9bgd7PnOef575znPOc502gC8NGaSjpBMQjR/OsPRDwGMngIkmctcHy/IRkU'
+        'gaugD7zXmctcJIYxAvJ1ppJgCaiSEDQXmMEEkHkgRubEMFqBFIyVWAG6FAIGQTMoYCK190ptJGIY'
+        '5MVwQlY9r2Zz7ATZ/grZD0ZJAFuRGyAn3mqQBDnTBRIEc6TQWBcoj7MYJF+EHOe2xAa2JFrOqSVw'
+        'utpJwrg54AG3qheBNBMheZyQ2yDKzxUOA/WcoIpUy2mvBurBNxrEtiUsELkXN5k7F2jecbBjOiER'
+        '4BkN6AXzAnwYQoGJ5neA+Z6cC8mRrczqINUpHRimOOWe9tVJTjVBLpwVFOctS3CRQy45fAcx/gbU'
+        'O4ypYFeWo3GuIFY0+ErxdovEXCZjmz8i0ux1Gr3TWLTB2TQGZNCZ7qgTxbtJ8VpERisZj/kqJGuo'
+        'MVzvbGomEW7GMocawgTxjlA8q6gwjZFxo+peWwwajVlcH9Y7jNEIbFYIkSGuRSVvNlE8FjeCN8Rx'
+        'BUmrMvgoeEfVdLEyPxB4QCFkAkLOZrxqUKvMfMwY3rCSMyz8q2BZq8O4hGPccpd0CMlF4GGFkC/I'
+        'mwPTnKgl3HxJvCGBMywTDGQtxEvFzV2MgMUI7FIIeQOB2V4cb3FMVmmpRDODXmVwDvjBTTCxzl4v'
+        'K4T0Indivaw1W7lS8ifBlw7WaqhHYcZ8DxOUKBurtQN1biHXUVMiZ9gVsDn6RMYrZLymNkHC5Ha1'
+        'KQSNp9hqT2YMXZJmWIU7aHyDyLiPjJ/BIg+TsOr5hHw/gT0+XAexXCnZJnJgefOBHE54cfuu8bXP'
+        '4VoJO5tLzekUOX0UnaoAXZKplLQszmFPjlHgNTm2x/UbQgIsJJLb4qfTNm50e7tbzhqdtTJQQsJB'
+        'K83LCmjmtINYcDie4U7LedV99V7IAnCHe2Uc9H6wtZodYSMnyDTlMuPF41WAl0GayJZoq3QXtxdc'
+        '71voy6+RqCMbp1+TIHiiJIFu0DP1x/x6gW6mnsW95SNgr+/rK8vuq347/3VMZ4kEAYfoXS3jRWmh'
+        'XCugl6ZdURjvs8dcwI8mbUs7/7bWdZfJymuCVsQ8+bStkoJRJjTajlK2PQVg9LcYc5mLep0++nei'
+        'aEpbMAv/ySwHj0hQz//wJ1EoKAV3AzHfT6WZhNXNFDHIAAAAAElFTkSuQmCC'
+    ),
+    ('update', 40): (
+        'iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAAEBklEQVR42s2YWUhUURjHRw1NW10w'
+        'UkcriUrFcomkhwQhsbS0UKMFeqqHKLHQCnpwodTKoMh0JLAgjRYfKirLFsEMUkcwSiMLR60kzEij'
+        'tHKZ/kfPhY/bmeudcbw58GOYOd/9n/8953xn0+ns+PF5mJkA6sEK3XT8wFgqMIMBcNCnOtPxvxry'
+        'by1YABLBMWDwq8+u4wYlasBirU3NB2mgHowAs4TemGuWGWT0AQ8tjM0C2aCfmiJ80zfm9MjMfQRx'
+        'WpiLAR0yQ+z3KbAeeMjGIKMCuAu0IkAV2AsmZyyg9aQDRI6CYWKsGSQBJ0GSpADWisnA0suWEa3L'
+        'wNnGVstn5s4SsQGQLjJGDLoCzwl6IxJ8Irp3gYt17szZTOg4EfkAwuw4ZBaCRqJfARysEUgBo/xh'
+        'E1g0BeN6Lp8JJJPpah/0YRkpZSZYPoXJ5w26eF2DYJmah8rJW6VqMENEk/n0vv/rfMXgEBJ8S99S'
+        'oNXkTzM7SinwIg9iJoM0XJ0CwB8pYSwFuZJV4p49DUR2lkRFdhny8L1RwWQlr/sHW7VEAXGkmbfb'
+        'w1hI+zldZFdJ2uouwxAwM/B7iwWDyaT+eFHACdK9k17cwzuLndFqpZIxQpEFg+5k/OeJAu7wwrbJ'
+        'movoLPGCkRqBuVF0c4JCN7/jHm6LCpt5YZWCAFv+9oMrYLOF8RYMI+8F5gbQvTsmSJZq7qFJVNih'
+        'mEXjMXvIOGHdsUFmLh5G+gXmulG2RkU237TYi/izkxeWKwgUy7ZcX4BfiGksGTJgZFhgzogu91M5'
+        '3VQqGXwl7S4UBNbJtl6MZzBwSWAMGWu4Ht5R7GbFfPiUazaICqt4YcsEIjny3fTStjPMDDU3ghbN'
+        'CjUVOVg5YUu9WCkqLOSFQ2C2gogTeCI3Gfi20IzWYuZ+Yryl2HgAk3ZQWaKAraTCTSr2c5/lJrED'
+        '7wg1nQ+zcbnbTbRiRAHz+JaHBVxVeU75RUTrWCvYNG8aS5neI67z1eIxgKQ5q9hXhckgcATssvls'
+        'Ma6zknTvBd0EWSq1iEGjnYxubB84Xuew4qaVBz8mwWs1MLiTNEqZmgfYpvU3f6AdeE2huWCyxetV'
+        'PYYReJi81XMwZwrMLSHnETb+kqw5EzvigRvE5AtbM1Tl2TjLFpGZ4IE1Z2Mc2r2Ai4LmDHCITGdm'
+        'vkA42PqmLvxQrZjZvtUZzNw20AsS/9F5M7b6sIXgJdFiSZgR0Jo/ue7Qj1+B7ONTwSpBq3mCa+TS'
+        'KIm/nAeIBafJGmsmyRetxY1qPOimV256Y24PKu+zcEXH/s8CblqY8wbf5ReW+qZcuakRnmQH2HKq'
+        '9Z10IKilBv0asmvZWOXXwux62Pt/X5w7gQwwSMfgdLzhDwZGEGtP3b9nQ04ZdlhsbAAAAABJRU5E'
+        'rkJggg=='
+    ),
+    ('update', 45): (
+        'iVBORw0KGgoAAAANSUhEUgAAAC0AAAAtCAYAAAA6GuKaAAAEyElEQVR42tWZa2iTVxjHk2jbmKng'
+        'pUNjk9QbKC1T23iZihVU3IehAwXrxtANYR/GFK3WImIDgklg1a3YpKJQLwhuKuo2vLQ65wdXpbrB'
+        'uiQlxbapDAXrvSJqNf5PPC3PXs77vqe51hd+n/q8z/nl9Fyf12BI0WO9sOUm2A4GG96XB7IREAXX'
+        'wJQBKWkPuQfZg55JYDEotdaXd3FpxjOwwVq/2ZR50aDHDjaBBvAURHsZd3FrlEj38jvIzZTsfPAr'
+        '6KGiEtL/AFu6ZSeAX1REH4CLwAcqrQ3lD4lsD/CCHEFONqxG2Fq8yZV1BHex5OtAt0L0HqgCsx1o'
+        'XGUitoL5Kp3AhP8Er0E1yElW72aBfQrZLrARWDRWjzDwg6EauUeBNyTvFTAyUeFscEoh/BPIlVjy'
+        'LHoxBQEXa6MMvCL5/45bHC+awFGSjCX+Li/oTcVcWQQekrauAnM8ibaRJC/ByhRP8iI+mXvb3G8P'
+        'ePqV4GPyL2Njbk2aVqcS8IKIfyb74mDQTF78wXrDlc5ldRNp+zb4QOalb8hLobjGVgKP7d1cukoc'
+        'KmR6uZ288EmGdtxZZCm8q9lx+OPy/83gkCcTzgZHs5e5nCcupVrSP5PA1akQckb8C52dtafA4eKI'
+        'f7JkB57W2vke8aBurd0unqew7UeDs9O/fmZn7SsQ5bRP76jJUvHJAY+5DztBZouCiskvO5tM4Rkd'
+        'NdkQ3kdk+0BvT9Ho7d+Ik1MU8DUJqEyWcHHENxpyl0XC4G5RR41ZQ7qSOK0VBewkAasktvilfNyZ'
+        '1YX9BRC7pSL8H8a3U6edz4mTSxRQSwIWqiYK72Gxx0lsk2j8Q+hTiD1WEW7CD8qTWPqWkHaqRQF1'
+        'JGCORqKJggvAAXvAHfv71NY9RghvhliPSBirxrGiiM8iuV6XkDZqRQH0zLxAI9FYlWvWl5hwOZCq'
+        'U+ndN/gxO6a17TX2Y5NZSo8TogA3CVihk+x7gfTTae17r6sId0N4ZRw74xqSf7vemaNC4nLQqBTP'
+        'D3mj6G2lcCeEi+LczneR/F+IAuaRgJMSCfPBfaW4A+KFt6p7hRsx4cYkcAa5RHIXigKGgOc8gMlk'
+        'SSRdprjj9TE5XFU3o8NnTkB4OPHpsgW9JrXAc/054eUFvKLx3RO79wXcxkQ2JbaZkJxHZAf+GUNU'
+        '//DvCLpN/ODOzsBn2X0vvz2xSwNyGPn6r9+B7JbAywNRXouYnqHz9DIiHLYraip6+/1lR9BrTLOw'
+        'BbQSh69kJ8Ad8tK36RIe3xKbIz7S9l82vV4m4qvIi2wGz01TL68jq9FL4XFU9XIZ8LAEhxRlsI9S'
+        'LFyqqDRtiXdsXSdJ2NpdkvT7YCi2UmxUnGcOYlUyxvvrc8G/ikrTesnPFxaJ/B+CE4p1/rjMxqaX'
+        'eLSiDsGWwmEassPAftCss7SWKcpgjBpWxkjWeDPzWc0myR9qux1ES0Abr0uHBbXoOWA3r2tT2Sds'
+        'aetX7U5KvCVWWB/JKkAC2SGgCrzuq/43lLPJ6wJ+/oXggcoXhNPs8JXW3QuC+SCg/L4y7lJFVO17'
+        'DJ907DPIvIxUgyA4BlyRkGZDoJ6fU2yGTD+QNIEy8JwMjzt8k1rMvy8OMgzEB7IFoEk0EQf0A9ks'
+        '4AKNqWrjLcUBbqelX3OnAAAAAElFTkSuQmCC'
+    ),
+    ('update', 50): (
+        'iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAYAAAAeP4ixAAAFaUlEQVR42tWaa2xURRTHb59QUlGk'
+        'kXrZ3RJetTy0tCWCJhg/kPhBkqolUiRilJQv8rDabgikFq22JVGrDW2piA+iIYSABIkU2ogJUtIi'
+        'ktjulpbS7kaNRsViClgorP/ZzCaH6X3M3d3Lbjf5fTtz5vzvnXPm3JlVFJt/akvZGnAe5Crj+QcB'
+        'r4IAGAFbQfK4EjDDW624PDWT1BPuci4kRDvIjtvAEbQDvAw+AWfBZTDq6KgMCEIYV8EG9Xh5YrwE'
+        'nwZeAafBbRAQ0RESYlWsBUwApeAPreAlhLA3shEkxlLEk6BXJ3AfX1rrwTIwS211bxFEnNHLEZen'
+        'OgFjisDzwB6RTk9NMpzXgFtC8NfBbrDE5R07uVC1thlVLfgoIX5bQEa038I94FtBwChoBqrkPrJI'
+        'Yp4KYY4+MDtaIu4F7cIEbGktlXJQWamobaUJFuY6Isz1C5gTqYiJ4HvB8WEw2cYcTATbhSrYD6aF'
+        'lxNdwQ3tU0HEbqenNsnugoJ8ZHNvEMScBMnhPJm1gogvbaskWvN7d7AYtgkxVFgVoYJ/iIMzbO+4'
+        '66XeGyzH+0kcI2CeFSF0Sf0LZsZw35rCEz4Uz1EXlr3MwBxeWkMDN8dBK7SKxMPy5lGZQc1k0EWQ'
+        'EmshSH62xH4kce2T2fiGyYCSOOqu6Vv5D9xvZFxMjK+AdDuDy/c1Li/wN51b7G/6tcDf+P6iwYYU'
+        'k0b1LxLfWiMhe2m5tUvAgksfKgW+xk0QcBMEQkDMFpO3sofE95WmUfrlKmY4SAzX2CEid3BnKgJu'
+        'pgIIJ0yErKaddvrfb2saTRU621nRFpHna8jAUjqpIwJvpKnORMhsEh+LdYqW0WJiNCzTDmT31LJx'
+        'k2UqG/JhAYLt1xMBOiB0qomQFHCNxJmnZbSCll3JjeoYfzIsCVfr2SIfnkagVwzexD6ImCRZvXwk'
+        'zqfM1t85CYd1Qh/E2ocl1GahL5jUZQh2VEfEbeRLRe6l+gQLZbiLzPmclsELxOCshMPvND51B0L1'
+        'HaV0AoL8zGApDUNkURj7STeZ71ktg0JicEHC4Vs63+1f5/l2ZiLQUwYi/MiZvDA3Rtp3LdcyeIxu'
+        'hlkmLTs/CjqvJeahvg+GDES05/saMiM4vRkhcy3UMsoUPmQcEo6zeXc8RkzOxTqtpP4CS25iBG3K'
+        'fOHMYGzn4eoO9v6/G64/803qDub0vhfA02cibiEf3PMHPkqIZB+Cz3XEf4+R4UFi2CjjPKs7uJfs'
+        '0hOT5a0denigfkWUGscDxPfHRobrieFvsi08z5efNIT0WfqiM57jPnCV+H7GyHgauEmMCy1M5OQH'
+        'BKH24WA0D9jgayOJa4g9PLMBh8iA0y5PrZXNipHBnp7T8060z5rpjl4vM2iZsDwKlRj/EIObxHND'
+        'qqHlT7WVDBy080BOIp65wldrk5XBj3DlocF7nSjPMRCRJnyr/wkesOrkXWGJveG4UHU3RSQJZ1qM'
+        '4nAcpfKbKPohU5LVXW2/CG/wCuNzQcSumf01YT8VVagWrIXZaucy4/vFUUEEy9nUSB3nCK1LgO8R'
+        'UicsD7aUWynfj/OzNDrXKXZMFa2nlM2/NegE5Wbj1JayAtAFVpr4d/BbL/E27JuoH0mxagHayCQv'
+        'GghIAZXgBr92W6fhj92DLOV3jtc1bsOqWMLbWUmKgx9hPdo7PoKeBzrpBej0Nvfr/ATkCd7PsfMp'
+        'v06j2cM25ZjtvurxsiQEXQquidfRjs7tAbNrbJ6Hm2NxfSG+iZf0/hhgIIRVwR/4PybS4uKQmV3+'
+        'g9cM3sgo/1tHJ88LFvx0JV5/PEc67hDT6t7E/mAzo3eHMq5+vGq9aVS1xpugfPAzKLJ7rv8BHZyR'
+        'HgKDdbUAAAAASUVORK5CYII='
+    ),
+    ('update', 60): (
+        'iVBORw0KGgoAAAANSUhEUgAAADwAAAA8CAYAAAA6/NlyAAAGeElEQVR42uWae2xURRTGd2lpG9D6'
+        'oLV1291ShYCxhbJFRC3RqAFU8EUUQRKpEI1SiEqBqo0SI+kuUl5NH6aYoCiiUUQlxhLEooCFYBAo'
+        'u1jtYxtBeUStolhaWL9TZ/XmePfeudvd7W17k98/uzNz5rt3Zs7MmWOx9MBjq1k0D3jAeEt/eCD0'
+        'JeAHHeBlENdfBAc4AEb1CXEOb4nV4XGlg9vAbLAw7YvndzDBxFmwxLatMKb3ifS47OBJsAWcAH4l'
+        '6V+94FcRHGAXGNYLvqRrIMRMBztAJxdpQDDxppm/ZiyYC5q1REoKPg8qwEVmFZsHDuoIbAOfgdVg'
+        'AY2CtNpnN6mIbQWTkj9fqmWPRpF9qMc1IMpCS+JhuBScDyLyOFhJLyQDnZRYpTeAy3Rebio4Ktrf'
+        'BTKj9VVpxa0LIvQQmAniJN3SSTANyNh9mtk6TSt/pMVmgVYVoT+BfCDlUiDwPlqYQIoB21NU7LaD'
+        'GZESmyPeKjf6LkiKwjSiPhSAs8w+eYSHwy12uIo/7aBFKN3jtkZ5oRwPfmR9OQcmh8vApeBbZuBP'
+        'MLUHvcPVoIn16VcwolsNp9e7aVu4mTX8F5hkApd4FTjG+vYNSOhOo3NZg+SGZppoH+AEZ1gfS0Jt'
+        'jPzeL6yxV2z7l5pt85OvsnJfG0pD1ayhr/X8a088dm8p9fUD1tetjvoSQ2KHi5VPufTnmvx0phza'
+        'F8A4Iw1UsTf2Wi84ki5jfX7HiBv6nfm4zF4gOIl9ZZrLKTIV5/CdVE8IGNNSnpjrq5yc66vIG91U'
+        'FhviulMgU+kTVmlitMWS0Otaq04BPzG2tWo/frtC8riq7Pt2vQoJ4A9FhVMOleNdpJ6spjWWsb7K'
+        'pyCyIyD2P9GV6yUEx4ijaaD/tO8epFXhJvaGNkVtCPvK4yCqmgtV0CI5rN9iGvK0Cs9nhedHQ6zT'
+        'V5GMYVurIZaG9V5JwQXS8xh/VrDCE6IwX7MhqFFLLOhEuXskBd/CNKzVKryVFbYZcAspYB4olD21'
+        'QMRUiGnTEXsG5aYZ6EcG07BZq3AdO+/GSxoZzYID5AMfCLo4fbfGisVpMX05HbE+iB1j0B8PEjut'
+        'QF92ahU+rCj4m2zIBuVqVCIhVH8kL5vjK4+H2PU6QmnO7oEPTg1hAzJQHGED/dgnK7hNRnD60eUW'
+        'lQhEgINKt4DFKRVCduuK9VW+Pqa5PKRzLR1wxAgL9GGvVuF9bFjqn478fou4bQgWl65OOrCM5msO'
+        'uRYdsechdsmoprKQw0awdzEb0ju0Cn/KOpssaeR69laVXBjeUFpOi4+O2Da8lLvDsKceJr01xp/r'
+        'WOFxBgw9o3UDga+mJbaJ3FOYDhGTmO0VWoUXs8JzpA/inq741xYt0VmNa9UWp53OlorkcPl1FQ1z'
+        'tQpP5PPPoLHL9S7VRjSs9ONrBhandTktFWGNosDGh8ymU+8s3KEojM4bizuLuHG7luihXve5Uc1l'
+        'C7Kby6xhFpsgvMu/oVuMvOBHy5TvV1ClPayDuSEY1prPtEG5PUJBgHuZrfdCmQNrjBrO+Gc+b1AR'
+        '66F4WUT25Ptfpb5/xOzNkBHsYMOaIvqXGI4mHnENQL1ZIpBPQYUi8pERDPGMZJkHP4PBspU/Zm+q'
+        'uBfEtDayPq8yUvlmlXubVBOLvZFdztNeOsNIA1aRpqAUvdHuXW5GsQnsDKB9BtZoyMnmsj9il88h'
+        'PplH3dTPMtZHisMNCfXtrVZJUMk20dedzQ4KxKzuNDhYuBJlgz662jCB2CnsOoh4G5saa3cbzmY3'
+        'EUSDoUUh/GLvV0l9qAeJ4dzB8Pn8Q7Qv2DK8XYvpQpVMv+Nhvw4SVzA8L4uC9o9lHCmJxldNVslG'
+        '8Ivck6xIGc1XmTd+I/lStppFNkCZeHdK2owRmQgnVey2gGsi/abvUMkMeFyvXtq2QhI7HZwWSWlF'
+        'mna8XbGpWWJuqh1CdoMro7Vo0IX5XmH4sJ7fg7gh4qsq0w2LggTgJtC2UCS7qQml+euOejaC3dt1'
+        'OLDbPa6g582U7UUk9i5wjCeTptU+9wbqPyQSTleLnV2bTqLqAXCDKfe3EJUIqsEFtVTh9LoX/bLp'
+        'xqARPOrQeLlmEPy+VhK4hOBO8dUfdHhKzCtUIXgEqDMo+ITIyHmCsnYtve2BsFhQDNr/N4e/LK4R'
+        'm4hHwK0iLdlq6QsPBDrBIb1Vuk89EJgA3KCzXwhWCM8DDSC/J+z/DYFPDHJ4e/ZuAAAAAElFTkSu'
+        'QmCC'
+    ),
+    ('start', 20): (
+        'iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAA/ElEQVR42mNgwAFsD7WyA7EbENcA'
+        '8XQoroWKsTMQC4CKOaGGvALi/zjwa6gaTkKGqQHxVTwGoeNrQKyOz7CXJBgGwyA9ati8ieIy+0Nt'
+        '/z2P9hJr6FUU70PDA0VR5tmF/x+9efd/0o3d/52PdBJjaA1ybL5GV5B9btH/l+8+gfGVl0//l19c'
+        'RchAUCSyMUCTwX98BsLwgcc3/sednoXPUDcGaNoiykAQfv7u4/9ld4//9znWj93b0ARLtIEwfP/1'
+        'm/+Nlzeg65tOEwNrqO1lqkcKO7Z8S3ayoWLCrqZd1qN64UBB8XUVp2Fo3q+mSgGLZjAbliqgBirG'
+        'hksfAPSgWpVUalvVAAAAAElFTkSuQmCC'
+    ),
+    ('start', 25): (
+        'iVBORw0KGgoAAAANSUhEUgAAABkAAAAZCAYAAADE6YVjAAABQklEQVR42mNgIABsD7UAcasiEIcD'
+        'cTkQN0LpcIh4CwPZAGgABxBnAfElIP6PB4Pks0HqSbXAGYjvETAcHYPUOxNrQTEQ/yHRAhj+C9JP'
+        'jAX/qYCL8QXRXypZ8gcj6KCRjDUO+q/v/L//8fX/8adn/ycjjjiQLcnGpXjRnaP/X7779P/5u4//'
+        'l9098d/3WD8pFmWBLbA+As4HlwhZAsP337z533Nt+3/Hwx3EWHLJ+kgzAyyj/SfWEhi+8OLR/8Lz'
+        'y4ixSJEBmnNJtgSGdz268j/q5HR8loQzQIsIsi0B4WdvP/yff/vwf8+jvdjMKAdZ0kSpJTC84f45'
+        'bGY00s0ndIkTeqSuNprmE7uDrfAcn0XTHE+3sgupFP5Ds1IYyaIimtYnaBb9ocAHxYOjjsfSWrlI'
+        'k9YKMrA+0oq33WVzuJWgGQBNESjAqA2wiwAAAABJRU5ErkJggg=='
+    ),
+    ('start', 30): (
+        'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAABkklEQVR42mNgIAHYHmplA2JDIA4F'
+        '4nQoBrGNQHIM1ARAA5mBOAiINwLxFyD+jwN/haoBqWUm20Kbgy0gS32B+AYey3Dhm0DsZ3O4hWRf'
+        'cgPxQjIsRMeLQGYRa6kwEJ+kgqUwDDJLmBifUtNSZMux+9zuYBsDNGj+0wgvsjncitW3fvg0zrl1'
+        '8H/Pte3/nQ53UGK5H7YscxOfphuvnv9/+e7T/4svHv8vurCcXItvoGQ1aN77T4zFMLz70dX/Uadm'
+        'kGN5ELLFG0m1GISfvf3wf8HtI/89j/aSYvEG5GLwKzkWw/Cd16/+t13d/N/hcDsxFn8BF6/QcvY/'
+        'JRbD8Oln9/9nn1tEjOWGDNBCnioWw/CWBxf+h56Ygs+8UAZoDUNVi0H4ydv3/5uvbMRlXtqAWjxg'
+        'QT1giWtgstOAFSAUFZknKS8ymQk1cWhSSUAt96VDteiLUR9bH2xloFI7CxcGmY2z6cNFw6YP1+Br'
+        '7KH5fCGVgpebtAb94WaKG/R2h9oo7sIEgjI+XbowRHTa0qCYrE4bAM8jaPaGMW0lAAAAAElFTkSu'
+        'QmCC'
+    ),
+    ('start', 35): (
+        'iVBORw0KGgoAAAANSUhEUgAAACMAAAAjCAYAAAAe2bNZAAAB8ElEQVR42s2YT0vCYBjA9wm868cQ'
+        '7KJbdsqJkacunSK69R2CxBWE0iWIKCI8R6AeulluidYIohYURgX9UcOKLp3G0/va3phl29ze6QY/'
+        'ZOie/dg7nz8vw9g82HLahwgiYoik9onPfYzbB7oJJoTIIhSEioAeqNr3+Hcj+DpqR7QkYAkeUfvn'
+        '5mbg6+KOpVAAP6JgU+I3OE7ArgiLaFISIeB4XL8iCcQnZRECjjthVYRzUUQvxJmJBFxYGqMl6/0O'
+        'haVFxuxlHROXIXO5D9PH67SECtFSuudTiZtdPHOyCc3XD3hqv8NOXYL4UYaGEN8lwh12EpppHpmV'
+        'tzoyhJuXFghKEaLikhOZWlcO0jIr9CtDkJ/vYP4050QopJfJOpEhFO/PYKq6Zkcmo5dRaMhgHtpv'
+        'sHF9AOPSSj8yir76qrRkCFetBiyc78FoWbAio3aqvVb2gbYMofJYhzl520r8IKnIrslgGojdWxkm'
+        'K6tG8WOM1hi5KkPI1StG8ZOM1qF55sl46p3xzr/JI3nmwrMZ2FO1aZhVu8qWhT/9DO+Jfua7p0kN'
+        'o9PLh6WU4Zw0yB7Yb2VeGsR0wHplbkrYmSgbLiwN62TWzlOctf2Ohv+I+LMLUXXQ/fN4LqO4PyOQ'
+        'TJ3BtcTi/kwoIqaZQWweUd+5+gI40vcGfQVndgAAAABJRU5ErkJggg=='
+    ),
+    ('start', 40): (
+        'iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAACJElEQVR42tWZzUsCQRTAF/oDPNfR'
+        'Lt3DS2kJBd27dA2SDlZ/QDcPqVSXiAqkQ4cOHYJUrEsE+RURZSARZRB90GJGGUU3wdd7sRNiazvu'
+        'h84O/GBh3ZkfM/tm3zwlyWDrPYtInnTQgfQgLgW6dtC9tjQcvAvxI1FERqoI1FFV7tFvpugZS6X6'
+        's3Mk5kbiSEVFSIuK8qzHkw6ZPmNOJKFDqhG7SLcZYoQP+TJRjkF9+tyZkG65DmTNArF6aIyOJuXm'
+        'SG6rBXKMLW5JlJNaNHN/ZpICkWdpfW2QY/h4olUzIIay8zB9vgneTNiKwHGqyg2kfpZ2l6ejpat9'
+        'KJU/IVe8hxkUNVkyoRrZyibM1Unk5vBHkLH3kIexk1UzJd1qgnG9goT89g7rN0kYOVo0QzCu9m2t'
+        'GBFkFF6eIXARg8F0yIgguXTWCvqb6eA/QcaxfAuTZxtGJP21glGzBRk7dzkYPV7WIxitzedkqwSJ'
+        'x9cyrFwfwHB2oRlB2XsYkFiyWbVSkHFZkmE2vw0DfO8nOTkkJfuFVggyUk8FGD9d5xmrR1JS9JYK'
+        'EsXyB0Z7VGssly0EhV9isYNE+G1G+I3aLp86sZMF4dMtWySsSmkjIULKP5gM2/DQJMixc0LzXNx3'
+        'FGzbwZ1qQc3UZcQsfdiieFS33BNWlt8aRmybC5gJzWjVWcykzTxmsATs5qpiGZTtVBKMHc4iut/y'
+        'InqjRjlbo78hfvM5A+0bm+H9d4hIx3IAAAAASUVORK5CYII='
+    ),
+    ('start', 45): (
+        'iVBORw0KGgoAAAANSUhEUgAAAC0AAAAtCAYAAAA6GuKaAAACdUlEQVR42t2ZT0sbQRTAFxQln6A5'
+        'eRJEP4NNoEj0JOg38OQH6C2eBLOaoqC2ycUevKlRqHgSFHeT2KqI1CraKkjEf1lLEtGLp+X5Rmdk'
+        'CavuZmc2GQM/AiF582OZvHnznqJwfIXSqvIxEwsgQaSJvgfaszGlZl4o1IhEkDiiIQZiImDBpJ9r'
+        '9Hvk+43+mgIQ2TYkgZTKBJ1CfpckcUg80U+2GUnZPM1KIXHmSVwRsvVIFLnnJFsOiTtA1uElTP5M'
+        'uiDZctJkPa/CLUjOJ2EGWa/Fi3DeZ2FG3rU43RK5Kglbn7izrYIHQT3dW1AD6I7+nDRLOAoazqrQ'
+        '+XNUtHjUSR52nNaWTn/DZfEGpo7T0CVO/v7lPP500qXcBNzNn8F16e6R4/8GDO4vQjijihBP2Z6c'
+        '9Gg2K5VmbF6dQP/ONG9p8/HIt5FOug1mJ00wkB+5Hejd+MpTPGFXrZV4STPOCyVI/FuFjvUvPKSL'
+        'SINVOlJJoLekGYfXVxDdW4CQ9/0esUrHRUozMhdH0Lf93Yt03Cqt+SH9tN9vYfZkC7p/jVcirdEr'
+        '0pBCbxa+SDNOCwUY+7sMn7IjbtY0wrqqsDud6bc0449xDp93Z9ykvgArjqBa0oyVswPo2Zhwsm5Q'
+        'obfmqksTvmF6dLBuk7RPWsY9rUqVPZ4bP9LlaZlPRClrD/mqPCqe4F9PT4qrp6W9uVBxue6IXm/j'
+        'nVW5jcva97C0dfVa6TCRjtf77OVJ2zWVtj9tEf/g4x7XPU8CLOJ1PsxcotxmLjZ5fI7zdCslZLpl'
+        '011tpbVK0UPxk3zxaBY8V2ygZe0Isla7E9tXZ+PDtrPxUJrvbPwB3XJXKmGjEZEAAAAASUVORK5C'
+        'YII='
+    ),
+    ('start', 50): (
+        'iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAYAAAAeP4ixAAAC8ElEQVR42t2azWsTQRTAF0qkf0Ju'
+        'kXj00IAnSdu0gicPHsRDgqfk4sVTAg14KRuTiIciiNg0HkQvGjx48KDgR8xui1VbTNJUKn4UE2yr'
+        'MaiQxIt5zpMZ2YYYdjc7+7Xwg7Iks/PLdGfevHmCwOkKFdPCVCk9RjhA8ODfR1dEwdbXVOkCdtpP'
+        'iBFyBJlQJ3QIvykdek+mn8HPHsLv2kAg7SUkCVVCjwAa6dHvYhteKwR8hDyhq6Pz/+MXbfOgGQLj'
+        'BNFggX6w7RQ+i5fEBGGDo0A/NULAMIGZp/MoESa0TZRg4DMjR17lDBmJOJ11wCJwQkjoFsBfgUqA'
+        'TUgcrs3rGomIzimV58hEtEoELHon1LwzAS1TbM2GEsrZbFyNSEpLw7PSRXj4qQqlxhacXbthloyo'
+        'ZsXWtNiFV6/BXuvnP+59XIdTz6/wFsE++oaJ5LU2GukTQerNFlzdegzH5Us8ZfLDAsCuESKMzb3P'
+        'cL5yF6ZLGV6j4h0kktTT4DARhtR4C9GX13nIJPdJBOW/+4kqLxFkt/UD7nxYhZMrl40UKQfl1L7R'
+        '8Otd/NSKMLabTVh48wCOkdnOoEXSrxSJ6W1MqwijsluHxOvbRsjElCI5s0UYj+qbcObF4igiOaWI'
+        'bJUIsvPtO9x8twwnlhf09EGiEiKKNKwUYbz/+gWytfswI2W19KE+KYkCS9l07CDCWNvZhnPrt7QE'
+        'kmMCzTv17CTCSJYLavqAmz6Pq0Tc8a8VKmYFmgF07Ms++yTjounXbQui6SFK2bgQJerGoDGDMhUn'
+        'hvHTz9LmbaxK/DZWc+7d6jow+bDk/nQQlREdn6BzSMp0Q/VpFj2dsmsSe0JrRj5s8QHPoHA97IaD'
+        'njgeAzr56A2fHR/5DPF0oeCOw1CLj6cnBB6XomCgw3mxE7kVDAyIAJYMroDo0hDJZ1VRzRyG0yMU'
+        '1VQsK6rpv4Jymm3OooRFRZlTW1Hm1Kb3JEWZk39SStu7hitUzLBUk4cVnuE9XtcfmfIRr14hHPIA'
+        'AAAASUVORK5CYII='
+    ),
+    ('start', 60): (
+        'iVBORw0KGgoAAAANSUhEUgAAADwAAAA8CAYAAAA6/NlyAAADU0lEQVR42u2bz08TQRSAm94kKVf4'
+        'G/gHoLHUVGNioCUmXrx48ObB0JtSjtpWMUA0JiQmbWKBi3rRRNPEhAPdAi3GalFaJEJpkB+Vdhs4'
+        'eOQ5AzNmrQW729ndGbabfJc23ZkvM7t9M/Oezda62Fzu2bCtNxHqQHgRw4goIo5II7KENPkMfxdA'
+        'DCA6EWJI9kohO+qsEzGGyCEOEaCSQ/JbfA+nSwrb+RNNhBwIP+koMCZP7t3Og2gbYghR1kG0lgqZ'
+        '9m2Gi7pmg1jWhygYIFoLbnPAJQUNG9V2REzj88mSSd2nOWqgizxTwAkruE96yXoQMkeylCruG2vZ'
+        'PsQvDmUpuG/9LEeWZ1ml9EUWz2xVAFnl9O5q5m28IpCsMlBR9/YmcfCkgLJ//rJcUkjV6Pq0NtY/'
+        'Nw4jy+/g5oeImcI4RvCpCRc1R1BvNz5DST6AXXkfXq4vwtWFJ2ZJFxoKQ0lsrLmhha21I2FKsVyB'
+        'x/n3cCk5Yob0UCOrnjJLYcqX3R9wJ/sC3MYKYxfHacL+Zhs5SZgys5mDG4vPjJT2118BJYN2FnHy'
+        '/4QxO5V9mPo+D975cSOE8RrdXm90nSwaaESYsr63d/RG90gP9ZbuqSc8ZrQwJbNTBP+naT2FR2sC'
+        'jZCN1faMFmFKvLgE19MTukxrHEwpR7eT1YK+GWHMVqUK0dUEXJkbZR2IdDCJrFgLU1Z/luDe1zdw'
+        'QXrAStqnFB7mTZiS2l6DWx+fs+hbQCkc5VX4OEw9gNeFDFxLPW2mb1GlcJxnYcpmWYaJbzNwOflI'
+        'S9/iSuG0CMKUXGkbAtlXavuWUgoviSRMuZ2ZUtO3rKWFLTelLffSssLfUkQpHLBa4GGF0NLL7eIh'
+        'ov/iIXjWl4fL/+xTm70BMGjkBoAFtni66wnbWUxrYTbxLLdNa8mNeD2OWjbMPWq52zpMO+W4VFMg'
+        'ItxxKb7OH+9TxwQ+EI+pTlAlKQ95AWXVpzzUJLXIAsnKTSeqCZa25LFSYlpfK/XwDCaX5nVLLuUw'
+        'fThmWJa8S7pvI8UbZiWI+9yJsCklAOdwvGpQCUCZxPnGlwCcsMoa1LnIw8FrGU833lLB+0hNlvHg'
+        'e/RwWcZTf9T/KtQKKAq1UopCrVRNoRZetHQYVsBhhes3nQOrXdDr8scAAAAASUVORK5CYII='
+    ),
+    ('stop', 20): (
+        'iVBORw0KGgoAAAANSUhEUgAAABQAAAAUCAYAAACNiR0NAAAAxElEQVR42rWVXQrDIAyAA33xcqt9'
+        'lDHt89h9doueaYvsFoW6CFnpj+I208D30tiPqGkKkIin7hVhiYFAYmSQn8WcglI82j7KDPEiQoG4'
+        'xnht0zJKNsT9C9GW+E6zqczBn7JZ6ju3qs5UyD6Y5QXszsyfr8FfbmkolzlTBXxjO1mYppANymWk'
+        'FrgN1kKqohRxTUI4APeWlBCBG1ZKOB4iFN+y+KWIt41sY4t/ejGws9XDAU/uwPE1V6rdzwMWW1cc'
+        '3FW/gDfk0LtYKLg7LwAAAABJRU5ErkJggg=='
+    ),
+    ('stop', 25): (
+        'iVBORw0KGgoAAAANSUhEUgAAABkAAAAZCAYAAADE6YVjAAAA7UlEQVR42mNgwAMe+MdzAnE4EC8C'
+        '4qtA/AWI/0Hpa1BxkDwnA6kAqIkNiMuA+DUQ/ycCv4aqZyPWAg0gvkSk4egYpE+TkAVWQPyeTAtg'
+        'GKTfEp8PKLUA2SINbHFwiUoWIAcdO7IlZVS2AIbLkJMp1lT0srnv/6cd+whikDoclrwCJ29oOseq'
+        'CGQAMQCkDo9vwhmgGYqWlixkgOZcWlpylQFaRNDSki8M0LKIlpb8o5tPrtIjTuiSuuiST2iZ41/D'
+        'KzSal100LoXZ6FufIFlkSdOakYp1vAaxjQl2aGJ4RZPWCo5210Ic7a6FxLS7AAAfummkyPg7AAAA'
+        'AElFTkSuQmCC'
+    ),
+    ('stop', 30): (
+        'iVBORw0KGgoAAAANSUhEUgAAAB4AAAAeCAYAAAA7MK6iAAABM0lEQVR42sWXSw6CMBCGZ0Ng68Gk'
+        'rEkoC7duPINcAaOXwHPgJRTYCUfQ1GkyGuVhK0I7yZeQ0OFnmul0BkDDLiz2EIakSI7UyI2Qzydk'
+        'R2s8+NfwIwskQRpEaNKQz+JnwbMfS9GQohEjkb5hySLtKB3k8IdgG/ktR0f0OKHok2xQ/OxzmDjS'
+        'TuRlwHujDWcUfRL2ZW9tQLj+yHZK/0GHiq9FtdrogWsV4sl7cRg8p1W0FuJ+F9qGa6WP4px7QNVm'
+        'OFqM4leTPoqoGVCpMy2cAtVe08I5qLJ5JuEa6IYxLXyzKmxtq60lV2rrOFkrIDZKpjv9JRFpXhKG'
+        'r8Vrpwm00ghIK4JIiu/nbH2KJf/a7GVGm72W+N5oe/vadsYna+gLn48eYbbGRpieH3AVQ1tO77SH'
+        'tgdZojokAAZsfgAAAABJRU5ErkJggg=='
+    ),
+    ('stop', 35): (
+        'iVBORw0KGgoAAAANSUhEUgAAACMAAAAjCAYAAAAe2bNZAAABPklEQVR42s2YSw6CMBBAZ0U4gzfg'
+        'GhDcegSvAkuMRxJXnqBcQJa6YiFhB84kQ4KET4tQpsmLidD6AnWmMwAG43k6O0iIJEiK5EiF1PyZ'
+        '8/d0/Uj3w9oDFz3wD7yRxgC6/0Lz15BwkRgpDSX6lLyOu1TEQ9SfEn0yWtdUJECKlUVaaN3ARKTa'
+        'SKSlmhXiV1NsLNJ9Qt7UZs0siXT3kDskE1sWaYmH4ki5k0z5E4c4ME1OesXX5nN/GEPzNISSboif'
+        'jay08JJB8zQjtQOca5qdZYgQOOdIkEmAs6wEmRQ47UuQyUE39FuQqYAPRhJkanFPRtSeEfVvEhVn'
+        'REVgOblJVNYWd55hoWgnmWjsDKwsi6jRwk5MddAR8i3VTb5uIedvXFH6EmptZVxrb9SFiBZ3IcT1'
+        'Z2Y6V7eZzlVo2rn6AkczFXIJzPR0AAAAAElFTkSuQmCC'
+    ),
+    ('stop', 40): (
+        'iVBORw0KGgoAAAANSUhEUgAAACgAAAAoCAYAAACM/rhtAAABkklEQVR42tWZMW7CMBRALSFl4ABh'
+        'JPfgDCXsKaZrO3RlgQuEC5Segm5wEkYIFekUKTOUuv9XP1UUpRCbOvxYeguK7Sc7fH//CGHQtv6o'
+        'BfSAKbAA1kAKnIiUfnujZ/DZlrDdYBIPCIEPQGmCfWY4hg2xDjAHDgZiRQ40VudqsU1/hHIBkPyD'
+        'WBEc837nD41XzQFeLYgVwTkcXbk2sKpBLgPnauusXJ1yeUnnwjsnRU3b+ud27wby7OoFN5TLCM6F'
+        'koSBYFIagig2KSbMy06ISkH4/eFZ7Z/GRmBfjWDezQvOqsp9HT+VacO+GpJh/uCvdLbuH8fq2oZj'
+        'VBSMfxIMyjQUQ0GkJygd4io4FZSzcRVcCEosuQquBWW/XAVTQSk6V8FTIwTZbzH7Pwn7MMM5UE/4'
+        'H3Ub7skCZTRhPenWUT/dYpywepxT/peyO4nL6NLkNu/aiS0aDG9+cY/uZKXSx5Jl6aNQPFqyLB41'
+        'ovz2+0760nYBM4j6km0J2LVRq+7SsRgbiMXU16uj2p99hpjY/gzxDRhwd6D0hM6iAAAAAElFTkSu'
+        'QmCC'
+    ),
+    ('stop', 45): (
+        'iVBORw0KGgoAAAANSUhEUgAAAC0AAAAtCAYAAAA6GuKaAAABpUlEQVR42t2ZP07DMBSHrWy9RiOl'
+        '6tZjZGMpK3CEXoAVwjkIag8CA7RTOADJlrVDhwCq+RleJCuKqtr5Yz8sfapUJfZX17Kf3xOiQ8sv'
+        'rgOwACvwCHagBBU40mdJ3z/Rc+r5QIzdMGgIEpADaUFB74djyM7AGnxbyjZR/WxANITsBNzT3y0H'
+        'oKL+J30Jz0E2kGyTdzVeV+EY7EcSrlHjxbbCl+BzZGF9uSxtZtiVsC4em6zhvWNhfanMz9klMk+E'
+        'a7KTuwptO9JDklMHR+WptPKatUlvPBWuWbfFEmcfzeXtgzw8v8rDy5s9eF/1Y3jkT3XpxORXqwH7'
+        'aKofq7X98RdeFkbSmKlepNGPoXT+G9ZSfCuZSCsWggJzTtIrJZ0yk04FXYU4Se8E3eE4SZfC5hR0'
+        'LF0JujVzkj6ynWmWa5rb7rFlu0+zPBE5xh43gWlOzm2UdxXwjKeZ3VxC3ndEko48v41H3PIed/8r'
+        'w8Qyl9fImlZssqaa+NKhuHl+mm0lwFHNJetcc2Fb3Wo5gFQd8cv7OmKL/JRmxv+KbbMVZrXxtK/a'
+        '+A9y8C8b5qjHpgAAAABJRU5ErkJggg=='
+    ),
+    ('stop', 50): (
+        'iVBORw0KGgoAAAANSUhEUgAAADIAAAAyCAYAAAAeP4ixAAACMUlEQVR42uWaO27CQBBAl4qO1KEF'
+        'bgA9F4ihccUviPRwgUiR4A5EpIaUwAUc0iU3gMoYpLQUVEQBZ4aMI+SA8GeNvRtLr0Gw9vPa7Mzs'
+        'MMbhmBdqMSAD3AFdYALowBrYEmv67BV4pO9m5kotxsI+4EJSQBuYAaZH8LcdIH3RizfzeRTIAiPg'
+        'y4eAHRxrDORMVQ18BpLAANhxFLCzo3MkuQvoSg0lysAqQAE7eK7yolDhNgtx4OmCAnbw3HG/EleA'
+        'FqKExQuQ8CPxHgEJizfXMvQ4aRGSsNAcP2a6UmUhvxNn35lFsepoNsoRlrAoO1knVgKIrE6uM7Ri'
+        'PwsgYTE4GgFgaBDwih1EBJA7JjJ2O9iy3jI/WvdcWNabXmSGdom02wAQT7zbfJq8DhzLgwxec+pQ'
+        'pOP2buBd5H3gmB5mpf0joeyTopnAIjMDkzPK7EyBRZAMo5RTdJEGoxxbdJEuo2KA6CITRpUN0UV0'
+        'RmUa0UXWjGpOootspRKR5tGS5mWX5u9XmgVRmhBFlqDxVvQwfooOVmLVFj6xik6qu/Gf6pLMyH3x'
+        'oRl28WEkQzkIQ6vs3wKdqqJMXyCR/sktOsFKptcyFLFLZ6vxRrGCMr0IS/SMm+o/2ug5kEnQdpe4'
+        'W282GS0iM5HgsT0d5jvjf3v69w+gsN9XLIXRMGAoVWFbOLa0MCcD7UehCACbaoaBNdU8PITW5jT1'
+        '2ebUvnib01Gh4n6PBVOBhoPGswk1njV4Np59AzFsgN8VhGqeAAAAAElFTkSuQmCC'
+    ),
+    ('stop', 60): (
+        'iVBORw0KGgoAAAANSUhEUgAAADwAAAA8CAYAAAA6/NlyAAACwElEQVR42u2bMU/bQBTHLxsrMLBA'
+        '+mECrRSEbTo2sU34AukCTNCh36L5AnRomWBPpUaFTOlexTagjmVJK0VE5j16hxzTIJM722e/nvRn'
+        'QHC+n86+u/fu/xhLqXmmuwSqgw5BH0F90BVoBJpwjfjv+vxv3vH/WWK6tx9GCyGroH1QDzQGhXNq'
+        'zPvAvl5cv36jD6hnuRUY1CvQKZ+1ULGwzzN8xtB0KvmBmg7O6DroPAXIWbrAZwaGkzWsuwr6nCFo'
+        'XPjstdRBh4aLsE3QTY6wQjgGOzDt1GZ1AdTRADQuHNOCathlUFdDWKEvOEZVsCug7xrDCg1wrCpm'
+        'tgiwUehlmW+2WyBYoe6zv+mhcb/HdgoI+7CQBZbzrNltFhhWqJkUdk2TfVbFPl1NcrA4KQGs0Amc'
+        'v5+c3Y0SwQqtPxX1XJQQ+Nw3/hFl8RBv7o4vW2/DnwfvUxH2LQm9MQV7vd1gPOacG3by+0+YVsO+'
+        'JaHPLjfdqdmtygTvOAtpN3yGBPDt1IrNUylhiYFR+1HgHgHgXjS7OCYAPL7PhsKPTdmlvyDAqDoC'
+        'HxECPmI8AU4F+JjxrD8V4D7jVx1UgK8Yv9+hAjxiKq5HCgQ8IQlM7pUmt2iR25bIHTzIHS3r1IIH'
+        'WuEhoQTAV2opnj26STz0QcmladsZpGnbcmlaY1d1Ir6dYiK+Lfs6v3x8kWbtVDL2XGV21eIB26zL'
+        'tFoJgWszbw/97R2Ws+FMtT75W3Yil10ZLsR/IQsly0MjscfDt2yE/lBkU4u/5fy3LSU1pg1IGNNi'
+        '1sNBQWBXqJhLu8rMpbFvWseFrOOZjlr78MPq/df23+B7nA77bNPPohyAu/XKXwIQbYFhiyKPbxkX'
+        'edQCOALn1tD0xR18pzzQVg15K8p4PKuVXxlPvKEPir/qe5g/UlioVX0UvOvYYKCLkVK8Y11K8e4A'
+        'zKFHL1WFn6YAAAAASUVORK5CYII='
+    ),
+}
@@ -0,0 +1,46 @@
+import bisect
+
+# Icons pre-rendered by build_icons.py into icon_data.py. Nothing is decoded
+# until an icon is first asked for, and then only the one small PNG for the
+# current DPI scale.
+
+BASE_SIZE = 20
+# Windows DPI steps (GetDpiForSystem / 96) that get their own rendering;
+# anything in between uses the nearest one
+SCALES = (1.0, 1.25, 1.5, 1.75, 2.0, 2.25, 2.5, 3.0)
+ICON_FILES = {
+    "settings": "settings.png",
+    "update": "updated.png",
+    "start": "play.png",
+    "stop": "stop-button.png",
+}
+
+
+def icon_size(scale):
+    return round(BASE_SIZE * scale)
+
+
+def nearest_scale(scale):
+    index = bisect.bisect_left(SCALES, scale)
+    candidates = SCALES[max(index - 1, 0):index + 1]
+    return min(candidates, key=lambda candidate: abs(candidate - scale))
+
+
+class IconCache:
+    # One PhotoImage per icon, created on first use. Tk keeps a reference to
+    # the image only as long as Python does, so the cache also keeps them
+    # alive for the lifetime of the window.
+    def __init__(self, master, scale=1.0):
+        self.master = master
+        self.size = icon_size(nearest_scale(scale))
+        self.images = {}
+
+    def get(self, name):
+        image = self.images.get(name)
+        if image is None:
+            import tkinter as tk
+            from icon_data import ICONS
+            image = self.images[name] = tk.PhotoImage(
+                master=self.master, data=ICONS[name, self.size], format="png"
+            )
+        return image
@@ -0,0 +1,425 @@
+import multiprocessing
+import struct
+import threading
+import time
+from multiprocessing import shared_memory
+
+from engine import TypingEngine
+from scheduler import CATCH_UP, SKIP
+from templates import compile_template
+
+# Run the typing engine in a child process so Tk, dialogs and the GIL of the
+# GUI process cannot delay sends, and a hung backend call cannot freeze the
+# window. Both sides share one small control block instead of exchanging
+# pickled messages: the parent writes the command and settings and bumps
+# request counters, the child writes its state and counters. Two semaphores
+# act as doorbells so neither side has to poll.
+
+# Fixed-size fields, 8-byte ones first so every one of them is aligned
+_FIELDS = (
+    # Written by the parent
+    ("command_version", "Q"),
+    ("start_request", "Q"),
+    ("stop_request", "Q"),
+    ("report_request", "Q"),
+    # When the user asked to stop, so stop latency counts from the click
+    ("stop_requested_ns", "q"),
+    ("delay", "d"),
+    ("count", "q"),
+    ("rate", "d"),
+    ("burst", "d"),
+    ("per_minute", "d"),
+    ("per_hour", "d"),
+    # Written by the child
+    ("run_id", "Q"),
+    ("sent", "Q"),
+    ("report_version", "Q"),
+    ("state", "I"),
+    ("error_length", "I"),
+    ("report_length", "I"),
+    # Written by the parent
+    ("command_length", "I"),
+    ("repeats", "I"),
+    ("is_playlist", "B"),
+    ("policy", "B"),
+    ("hard_abort", "B"),
+    ("start_immediately", "B"),
+    ("shutdown", "B"),
+)
+COMMAND_BYTES = 262144
+ERROR_BYTES = 1024
+REPORT_BYTES = 8192
+
+STARTING, IDLE, RUNNING, FINISHED, ERROR = range(5)
+_POLICIES = (SKIP, CATCH_UP)
+
+
+def _layout():
+    offsets = {}
+    position = 0
+    for name, code in _FIELDS:
+        offsets[name] = (position, struct.Struct("<" + code))
+        position += struct.calcsize("<" + code)
+    position = (position + 63) // 64 * 64
+    buffers = {}
+    for name, size in (("command", COMMAND_BYTES), ("error", ERROR_BYTES), ("report", REPORT_BYTES)):
+        buffers[name] = (position, size)
+        position += size
+    return offsets, buffers, position
+
+
+_OFFSETS, _BUFFERS, BLOCK_SIZE = _layout()
+
+
+class ControlBlock:
+    def __init__(self, name=None):
+        if name is None:
+            self.memory = shared_memory.SharedMemory(create=True, size=BLOCK_SIZE)
+        else:
+            # A spawned child shares the parent's resource tracker, so the
+            # segment is still unlinked exactly once, by the parent's close()
+            self.memory = shared_memory.SharedMemory(name=name)
+        self.name = self.memory.name
+        self.buf = self.memory.buf
+
+    def __getitem__(self, field):
+        offset, packer = _OFFSETS[field]
+        return packer.unpack_from(self.buf, offset)[0]
+
+    def __setitem__(self, field, value):
+        offset, packer = _OFFSETS[field]
+        packer.pack_into(self.buf, offset, value)
+
+    def bump(self, field):
+        value = self[field] + 1
+        self[field] = value
+        return value
+
+    def write_text(self, buffer, text):
+        offset, size = _BUFFERS[buffer]
+        data = text.encode("utf-8")
+        if len(data) > size:
+            if buffer == "command":
+                raise ValueError(f"Command is longer than {size} bytes")
+            data = data[:size]
+        self.buf[offset:offset + len(data)] = data
+        self[buffer + "_length"] = len(data)
+
+    def read_text(self, buffer):
+        offset, _ = _BUFFERS[buffer]
+        return bytes(self.buf[offset:offset + self[buffer + "_length"]]).decode("utf-8", errors="replace")
+
+    def write_command(self, text):
+        # Seqlock: the version is odd while the parent is writing
+        self.bump("command_version")
+        try:
+            self.write_text("command", text)
+        finally:
+            self.bump("command_version")
+
+    def read_command(self):
+        while True:
+            version = self["command_version"]
+            if version % 2:
+                time.sleep(0)
+                continue
+            text = self.read_text("command")
+            if self["command_version"] == version:
+                return version, text
+
+    def close(self, unlink=False):
+        self.buf = None
+        self.memory.close()
+        if unlink:
+            self.memory.unlink()
+
+
+class IsolatedEngine:
+    # Drop-in for TypingEngine as far as the GUIs use it. The child process
+    # is started on the first prepare(), like the backend of the in-process
+    # engine, and the callbacks are called from a watcher thread of this
+    # process whenever the child rings the events semaphore.
+    effective_rate_text = TypingEngine.effective_rate_text
+
+    def __init__(self, backend=None, command="owo hunt", delay=12, policy=SKIP,
+                 start_immediately=False, hard_abort=False):
+        # spawn, not fork: the GUI process has Tk and worker threads running
+        self.context = context = multiprocessing.get_context("spawn")
+        self.backend_name = backend
+        self.block = ControlBlock()
+        self.doorbell = context.Semaphore(0)
+        self.events = context.Semaphore(0)
+        # Shared with the child's engine, so jobs.JobRunner can still
+        # serialise its sends against this engine's
+        self.inject_lock = context.Lock()
+        self.process = None
+        self.watcher = None
+        self.command_lock = threading.RLock()
+        self.current_command = ""
+        self.playlist = None
+        self.limiter = None
+        self.delay = delay
+        self.policy = policy
+        self.block["start_immediately"] = start_immediately
+        self.hard_abort = hard_abort
+        self.repeats = 1
+        self.set_delay(delay)
+        self.set_policy(policy)
+        self.set_command(command)
+        self.on_sent = None
+        self.on_finished = None
+        self.on_error = None
+
+    @property
+    def hard_abort(self):
+        return bool(self.block["hard_abort"])
+
+    @hard_abort.setter
+    def hard_abort(self, value):
+        self.block["hard_abort"] = bool(value)
+        self.doorbell.release()
+
+    @property
+    def repeats(self):
+        return self.block["repeats"]
+
+    @repeats.setter
+    def repeats(self, value):
+        self.block["repeats"] = max(int(value), 1)
+        self.doorbell.release()
+
+    @property
+    def current_count(self):
+        return self.block["sent"]
+
+    def set_command(self, command):
+        # Compiled here only to raise ValueError in the caller's thread
+        compile_template(command).close()
+        self.block["is_playlist"] = 0
+        self.block.write_command(command)
+        self.current_command = command
+        playlist, self.playlist = self.playlist, None
+        if playlist is not None:
+            playlist.close()
+        self.doorbell.release()
+
+    def set_playlist(self, playlist):
+        # The child reopens the file itself; its saved line index makes that
+        # instant
+        self.block["is_playlist"] = 1
+        self.block.write_command(f"{playlist.order}\n{int(playlist.loop)}\n{playlist.path}")
+        previous, self.playlist = self.playlist, playlist
+        if previous is not None and previous is not playlist:
+            previous.close()
+        self.doorbell.release()
+
+    def set_delay(self, delay):
+        self.delay = delay
+        self.block["delay"] = delay
+        self.doorbell.release()
+
+    def set_policy(self, policy):
+        self.policy = policy
+        self.block["policy"] = _POLICIES.index(policy)
+        self.doorbell.release()
+
+    def set_limiter(self, limiter):
+        self.limiter = limiter
+        block = self.block
+        if limiter is None:
+            block["rate"] = block["burst"] = block["per_minute"] = block["per_hour"] = 0.0
+        else:
+            block["rate"] = (limiter.rate or 0) * 60
+            block["burst"] = limiter.bucket.burst if limiter.bucket is not None else 1
+            block["per_minute"] = limiter.per_minute or 0
+            block["per_hour"] = limiter.per_hour or 0
+        self.doorbell.release()
+
+    def is_running(self):
+        block = self.block
+        return block["state"] == RUNNING or block["run_id"] != block["start_request"]
+
+    def prepare(self):
+        if self.process is not None and self.process.is_alive():
+            return
+        self.block["state"] = STARTING
+        self.block["run_id"] = self.block["start_request"]
+        self.process = self.context.Process(
+            target=child_main,
+            args=(self.block.name, self.doorbell, self.events, self.inject_lock, self.backend_name),
+            daemon=True,
+        )
+        self.process.start()
+        # The child loads the backend before reporting in, so a missing
+        # dependency surfaces here just like with the in-process engine
+        while self.block["state"] == STARTING:
+            if not self.process.is_alive():
+                raise RuntimeError("Typing process exited on start-up")
+            time.sleep(0.01)
+        if self.block["state"] == ERROR:
+            self.process.join()
+            raise RuntimeError(self.block.read_text("error"))
+        self.watcher = threading.Thread(target=self.watch, daemon=True)
+        self.watcher.start()
+
+    def start(self, mode="infinite", count=None):
+        self.prepare()
+        self.block["count"] = count if mode == "count" else 0
+        self.block.bump("start_request")
+        self.doorbell.release()
+
+    def stop(self):
+        # CLOCK_MONOTONIC is system-wide, so the child can compare it with
+        # its own emit times
+        self.block["stop_requested_ns"] = time.monotonic_ns()
+        self.block.bump("stop_request")
+        self.doorbell.release()
+
+    def watch(self):
+        block = self.block
+        reported_sent = 0
+        reported_run = None
+        reported_end = False
+        while True:
+            self.events.acquire()
+            if block["shutdown"]:
+                return
+            run_id = block["run_id"]
+            if run_id != reported_run:
+                reported_run, reported_sent, reported_end = run_id, 0, False
+            sent, state = block["sent"], block["state"]
+            if sent != reported_sent:
+                reported_sent = sent
+                if self.on_sent is not None:
+                    self.on_sent(sent)
+            if state in (FINISHED, ERROR) and not reported_end:
+                reported_end = True
+                if state == FINISHED and self.on_finished is not None:
+                    self.on_finished()
+                elif state == ERROR and self.on_error is not None:
+                    self.on_error(RuntimeError(block.read_text("error")))
+
+    def timing_report(self, timeout=1.0):
+        if self.process is None or not self.process.is_alive():
+            return "Typing process not started"
+        request = self.block.bump("report_request")
+        self.doorbell.release()
+        deadline = time.monotonic() + timeout
+        while self.block["report_version"] != request:
+            if time.monotonic() > deadline:
+                return "Typing process not responding"
+            time.sleep(0.005)
+        return self.block.read_text("report")
+
+    def close(self):
+        self.block["shutdown"] = 1
+        self.doorbell.release()
+        self.events.release()
+        if self.process is not None:
+            self.process.join(1)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        if self.watcher is not None:
+            self.watcher.join(1)
+        if self.playlist is not None:
+            self.playlist.close()
+        self.block.close(unlink=True)
+
+
+def child_main(name, doorbell, events, inject_lock, backend_name):
+    from backends import get_backend
+    from playlist import Playlist
+    from ratelimit import RateLimiter
+
+    block = ControlBlock(name)
+    try:
+        engine = TypingEngine(backend=get_backend(backend_name), command="")
+        engine.prepare()
+    except (ImportError, RuntimeError, ValueError) as e:
+        block.write_text("error", str(e))
+        block["state"] = ERROR
+        block.close()
+        return
+    engine.inject_lock = inject_lock
+
+    def sent(count):
+        block["sent"] = count
+        events.release()
+
+    def finished():
+        block["state"] = FINISHED
+        events.release()
+
+    def failed(e):
+        block.write_text("error", str(e))
+        block["state"] = ERROR
+        events.release()
+
+    engine.on_sent = sent
+    engine.on_finished = finished
+    engine.on_error = failed
+
+    seen = dict.fromkeys(("command_version", "start_request", "stop_request", "report_request"), 0)
+    seen["start_request"] = block["start_request"]
+    limits = None
+    block["state"] = IDLE
+    while True:
+        doorbell.acquire()
+        if block["shutdown"]:
+            engine.stop()
+            break
+
+        if engine.delay != block["delay"]:
+            engine.set_delay(block["delay"])
+        engine.set_policy(_POLICIES[block["policy"]])
+        engine.hard_abort = bool(block["hard_abort"])
+        engine.repeats = max(block["repeats"], 1)
+        engine.start_immediately = bool(block["start_immediately"])
+        current = (block["rate"], block["burst"], block["per_minute"], block["per_hour"])
+        if current != limits:
+            limits = current
+            engine.set_limiter(RateLimiter.from_settings(*current))
+
+        version = block["command_version"]
+        if version != seen["command_version"]:
+            version, text = block.read_command()
+            seen["command_version"] = version
+            try:
+                if block["is_playlist"]:
+                    order, loop, path = text.split("\n", 2)
+                    engine.set_playlist(Playlist(path, order=order, loop=loop == "1"))
+                else:
+                    engine.set_command(text)
+            except (OSError, ValueError) as e:
+                failed(e)
+
+        request = block["stop_request"]
+        if request != seen["stop_request"]:
+            seen["stop_request"] = request
+            engine.stop(requested_ns=block["stop_requested_ns"])
+            if engine.thread is not None:
+                engine.thread.join()
+            if block["state"] == RUNNING:
+                block["state"] = IDLE
+                events.release()
+
+        request = block["start_request"]
+        if request != seen["start_request"]:
+            seen["start_request"] = request
+            if engine.is_running():
+                engine.stop()
+                engine.thread.join()
+            count = block["count"]
+            block["sent"] = 0
+            block["state"] = RUNNING
+            block["run_id"] = request
+            engine.start("count" if count else "infinite", count or None)
+            events.release()
+
+        request = block["report_request"]
+        if request != seen["report_request"]:
+            seen["report_request"] = request
+            block.write_text("report", engine.timing_report())
+            block["report_version"] = request
+    block.close()
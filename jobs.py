@@ -0,0 +1,207 @@
+import heapq
+import itertools
+import threading
+import time
+
+from engine import TypingEngine
+from scheduler import LatencyHistogram
+from templates import compile_template
+
+
+class Job:
+    __slots__ = ("id", "command", "template", "delay", "count", "sent", "paused", "in_flight", "due_ns", "version")
+
+    def __init__(self, job_id, command, delay, count=None, clock=None):
+        self.id = job_id
+        self.command = command
+        self.template = compile_template(command, clock=clock)
+        self.delay = delay
+        self.count = count
+        self.sent = 0
+        self.paused = False
+        # While the runner is typing a job it is out of the heap and gets
+        # re-queued by the runner itself afterwards
+        self.in_flight = False
+        self.due_ns = 0
+        # Bumped on every pause/resume/update/remove so stale heap entries
+        # can be recognised and dropped when they surface
+        self.version = 0
+
+    def finished(self):
+        return self.count is not None and self.sent >= self.count
+
+    def state(self):
+        if self.finished():
+            return "done"
+        return "paused" if self.paused else "running"
+
+
+class JobRunner:
+    # Many (command, delay, count) jobs driven by one thread. Due times sit
+    # in a heap, so adding, pausing or firing a job is O(log n) however many
+    # jobs exist, and every send goes through the single engine injector so
+    # two jobs can never interleave their keystrokes.
+    def __init__(self, engine=None, clock=time.monotonic_ns):
+        self.engine = engine if engine is not None else TypingEngine()
+        self.clock = clock
+        self.jobs = {}
+        self.heap = []
+        self.condition = threading.Condition()
+        self.ids = itertools.count(1)
+        self.sequence = itertools.count()
+        self.lateness = LatencyHistogram()
+        self.thread = None
+        self.stopping = False
+        # Called from the runner thread
+        self.on_sent = None
+        self.on_job_finished = None
+        self.on_error = None
+
+    def push(self, job):
+        heapq.heappush(self.heap, (job.due_ns, next(self.sequence), job, job.version))
+
+    def add(self, command, delay, count=None, start_immediately=False):
+        with self.condition:
+            job = Job(next(self.ids), command, delay, count, clock=self.clock)
+            job.due_ns = self.clock() + (0 if start_immediately else int(delay * 1e9))
+            self.jobs[job.id] = job
+            self.push(job)
+            self.condition.notify()
+        self.ensure_running()
+        return job
+
+    def pause(self, job_id):
+        with self.condition:
+            job = self.jobs[job_id]
+            job.paused = True
+            job.version += 1
+
+    def resume(self, job_id):
+        with self.condition:
+            job = self.jobs[job_id]
+            if not job.paused or job.finished():
+                return
+            job.paused = False
+            job.version += 1
+            job.due_ns = self.clock() + int(job.delay * 1e9)
+            if not job.in_flight:
+                self.push(job)
+                self.condition.notify()
+
+    def remove(self, job_id):
+        with self.condition:
+            job = self.jobs.pop(job_id)
+            job.version += 1
+            # Templates can hold an open file and map ({line:...})
+            job.template.close()
+
+    def update(self, job_id, command=None, delay=None):
+        with self.condition:
+            job = self.jobs[job_id]
+            if command is not None:
+                # The runner renders under this lock, so the old template is
+                # no longer in use once swapped out
+                template, job.template = job.template, compile_template(command, clock=self.clock)
+                job.command = command
+                template.close()
+            if delay is not None and delay != job.delay:
+                job.due_ns += int((delay - job.delay) * 1e9)
+                job.delay = delay
+                job.version += 1
+                if not job.paused and not job.in_flight:
+                    self.push(job)
+                    self.condition.notify()
+
+    def snapshot(self):
+        with self.condition:
+            return [
+                (job.id, job.command, job.delay, job.count, job.sent, job.state())
+                for job in self.jobs.values()
+            ]
+
+    def ensure_running(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.engine.prepare()
+            self.stopping = False
+            self.engine.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, daemon=True)
+            self.thread.start()
+
+    def shutdown(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+        self.engine.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+
+    def next_due(self):
+        # Returns the job to fire now, or None after waiting for the next
+        # due time or a change to the table. Called with the lock held.
+        heap = self.heap
+        while heap:
+            due_ns, _, job, version = heap[0]
+            if version != job.version or job.paused or job.id not in self.jobs:
+                heapq.heappop(heap)
+                continue
+            wait_ns = due_ns - self.clock()
+            if wait_ns > 0:
+                self.condition.wait(wait_ns / 1e9)
+                return None
+            heapq.heappop(heap)
+            job.in_flight = True
+            return job
+        self.condition.wait()
+        return None
+
+    def run(self):
+        condition = self.condition
+        while True:
+            with condition:
+                if self.stopping:
+                    return
+                job = self.next_due()
+                if job is None:
+                    continue
+                self.lateness.record(self.clock() - job.due_ns)
+                command = job.template.render(job.sent + 1)
+
+            try:
+                with self.engine.inject_lock:
+                    completed = self.engine.inject(command)
+            except Exception as e:
+                with condition:
+                    job.in_flight = False
+                    job.paused = True
+                    job.version += 1
+                if self.on_error is not None:
+                    self.on_error(job, e)
+                continue
+            if not completed:
+                # Stopped mid-send: the job goes back in the heap, due now,
+                # for when ensure_running() starts the runner again
+                with condition:
+                    job.in_flight = False
+                    if not job.paused and job.id in self.jobs:
+                        self.push(job)
+                return
+
+            with condition:
+                job.in_flight = False
+                job.sent += 1
+                period_ns = int(job.delay * 1e9)
+                job.due_ns += period_ns
+                now = self.clock()
+                if job.due_ns <= now and period_ns:
+                    # Skip ticks missed while other jobs were typing
+                    job.due_ns += ((now - job.due_ns) // period_ns + 1) * period_ns
+                done = job.finished()
+                if done:
+                    job.template.close()
+                elif not job.paused and job.id in self.jobs:
+                    self.push(job)
+
+            if self.on_sent is not None:
+                self.on_sent(job)
+            if done and self.on_job_finished is not None:
+                self.on_job_finished(job)
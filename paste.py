@@ -0,0 +1,121 @@
+import os
+import sys
+import time
+import warnings
+
+PASTE_CHORD = ("command", "v") if sys.platform == "darwin" else ("ctrl", "v")
+
+
+def _env_threshold(default=200):
+    # TEXTTYPER_PASTE_THRESHOLD, or the default when it is unset or unusable;
+    # read at import, so a bad value must not raise
+    value = os.environ.get("TEXTTYPER_PASTE_THRESHOLD")
+    if value is None:
+        return default
+    try:
+        threshold = int(value)
+    except ValueError:
+        threshold = -1
+    if threshold < 0:
+        warnings.warn(f"Ignoring TEXTTYPER_PASTE_THRESHOLD={value!r}, expected a whole number of 0 or more; "
+                      f"using {default}")
+        return default
+    return threshold
+
+
+# Texts at least this long are pasted instead of typed. Calibrate it for a
+# given machine and backend with benchmarks/bench_paste_threshold.py.
+DEFAULT_PASTE_THRESHOLD = _env_threshold()
+
+
+class SystemClipboard:
+    def __init__(self):
+        import pyperclip
+        self.copy = pyperclip.copy
+        self.paste = pyperclip.paste
+
+    @classmethod
+    def available(cls):
+        try:
+            import pyperclip
+            pyperclip.paste()
+        except Exception:
+            return False
+        return True
+
+
+class MemoryClipboard:
+    def __init__(self, text=""):
+        self.text = text
+
+    def copy(self, text):
+        self.text = text
+
+    def paste(self):
+        return self.text
+
+
+class PasteInjector:
+    # Sends a text as one paste chord plus Enter. The user's clipboard is
+    # saved first and put back once the target had settle_s to read ours.
+    def __init__(self, backend, clipboard=None, threshold=DEFAULT_PASTE_THRESHOLD,
+                 settle_s=0.05):
+        self.backend = backend
+        self.clipboard = clipboard if clipboard is not None else SystemClipboard()
+        self.threshold = threshold
+        self.settle_s = settle_s
+
+    def should_paste(self, text):
+        return self.threshold is not None and len(text) >= self.threshold
+
+    def send(self, text):
+        clipboard = self.clipboard
+        try:
+            saved = clipboard.paste()
+        except Exception:
+            saved = None
+        clipboard.copy(text)
+        try:
+            self.backend.hotkey(*PASTE_CHORD)
+            if self.settle_s:
+                time.sleep(self.settle_s)
+            self.backend.press_enter()
+        finally:
+            if saved is not None:
+                clipboard.copy(saved)
+
+
+def make_paster(backend, threshold=DEFAULT_PASTE_THRESHOLD):
+    # None when pasting is disabled or no clipboard is reachable, in which
+    # case the engine simply keeps typing
+    if threshold is None or not SystemClipboard.available():
+        return None
+    return PasteInjector(backend, threshold=threshold)
+
+
+def calibrate_threshold(backend, clipboard=None, lengths=(8, 16, 32, 64, 128, 256, 512, 1024),
+                        repeats=3, settle_s=0.05):
+    # Times typing against pasting for growing lengths and returns the first
+    # length where pasting wins, or None if typing was always faster
+    paster = PasteInjector(backend, clipboard, threshold=0, settle_s=settle_s)
+    results = []
+    threshold = None
+    for length in lengths:
+        text = "x" * length
+        typed = _best_of(repeats, lambda: backend.send(text))
+        pasted = _best_of(repeats, lambda: paster.send(text))
+        results.append({"length": length, "type_s": typed, "paste_s": pasted})
+        if threshold is None and pasted < typed:
+            threshold = length
+    return threshold, results
+
+
+def _best_of(repeats, func):
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
@@ -0,0 +1,129 @@
+import array
+import mmap
+import os
+import random
+import re
+import struct
+
+SEQUENTIAL = "sequential"
+SHUFFLE = "shuffle"
+RANDOM = "random"
+ORDERS = (SEQUENTIAL, SHUFFLE, RANDOM)
+
+INDEX_SUFFIX = ".idx"
+# magic, file size, file mtime_ns, line count
+_INDEX_HEADER = struct.Struct("<8sQQQ")
+_INDEX_MAGIC = b"TTLINES1"
+# Start of a line that has something other than whitespace on it
+_NONBLANK_LINE = re.compile(rb"^[ \t\r\f\v]*\S", re.MULTILINE)
+
+
+class LineIndex:
+    # Offsets of every non-blank line of a memory-mapped text file. The file
+    # itself is never read into memory; lines are sliced out of the map on
+    # demand. The offsets are saved next to the file as <name>.idx and reused
+    # as long as the file's size and mtime match.
+    def __init__(self, path, persist=True):
+        self.path = path
+        self.file = open(path, "rb")
+        stat = os.fstat(self.file.fileno())
+        self.size = stat.st_size
+        self.mtime_ns = stat.st_mtime_ns
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+        self.offsets = self.load_sidecar()
+        if self.offsets is None:
+            self.offsets = self.build()
+            if persist:
+                self.save_sidecar()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def build(self):
+        return array.array("Q", (match.start() for match in _NONBLANK_LINE.finditer(self.map)))
+
+    def sidecar_path(self):
+        return self.path + INDEX_SUFFIX
+
+    def load_sidecar(self):
+        try:
+            with open(self.sidecar_path(), "rb") as file:
+                magic, size, mtime_ns, count = _INDEX_HEADER.unpack(file.read(_INDEX_HEADER.size))
+                if magic != _INDEX_MAGIC or size != self.size or mtime_ns != self.mtime_ns:
+                    return None
+                offsets = array.array("Q")
+                offsets.fromfile(file, count)
+                return offsets
+        except (OSError, EOFError, struct.error):
+            return None
+
+    def save_sidecar(self):
+        try:
+            with open(self.sidecar_path(), "wb") as file:
+                file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, self.size, self.mtime_ns, len(self.offsets)))
+                self.offsets.tofile(file)
+        except OSError:
+            # Read-only location; the index is simply rebuilt next time
+            pass
+
+    def line(self, number):
+        start = self.offsets[number]
+        end = self.map.find(b"\n", start)
+        if end == -1:
+            end = self.size
+        return self.map[start:end].rstrip(b"\r").decode("utf-8", errors="replace")
+
+    def close(self):
+        if self.size:
+            self.map.close()
+        self.file.close()
+
+
+class Playlist:
+    # One command per line. "sequential" and "shuffle" walk every line once
+    # per pass, "random" picks lines independently. With loop=False next()
+    # returns None after the first pass.
+    def __init__(self, path, order=SEQUENTIAL, loop=True, rng=None):
+        if order not in ORDERS:
+            raise ValueError(f"Unknown playlist order {order!r}")
+        self.index = LineIndex(path)
+        if not len(self.index):
+            self.index.close()
+            raise ValueError(f"{path} has no non-blank lines")
+        self.path = path
+        self.order = order
+        self.loop = loop
+        self.rng = rng or random.Random()
+        self.position = 0
+        self.passes = 0
+        self.permutation = None
+        if order == SHUFFLE:
+            self.reshuffle()
+
+    def __len__(self):
+        return len(self.index)
+
+    def reshuffle(self):
+        if self.permutation is None:
+            self.permutation = array.array("Q", range(len(self.index)))
+        self.rng.shuffle(self.permutation)
+
+    def next(self):
+        count = len(self.index)
+        if self.order == RANDOM:
+            return self.index.line(self.rng.randrange(count))
+        if self.position >= count:
+            self.passes += 1
+            if not self.loop:
+                return None
+            self.position = 0
+            if self.order == SHUFFLE:
+                self.reshuffle()
+        number = self.position
+        if self.permutation is not None:
+            number = self.permutation[number]
+        self.position += 1
+        return self.index.line(number)
+
+    def close(self):
+        self.index.close()
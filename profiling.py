@@ -0,0 +1,160 @@
+import array
+import cProfile
+import csv
+import os
+import time
+import tracemalloc
+
+# Per send, measured by the typing worker: getting the command
+# (command_lock contention with update_command, template rendering),
+# translating it to keys, waiting for the injector lock, typing the text (or
+# the whole paste), pressing Enter, and the bookkeeping after the send (rate
+# limiter, on_sent callback)
+SEND_STAGES = ("command", "compile", "inject_lock", "type", "enter", "callback")
+# Per UIPump round, measured on the Tk thread: how late the after() callback
+# ran, which is how long Tk was stalled, and how long the handlers took
+PUMP_STAGES = ("late", "dispatch")
+MODES = ("off", "stages", "cprofile", "tracemalloc")
+
+
+class StageTimer:
+    # A fixed ring of rows (start time, one duration per stage, all in ns)
+    # in one flat array. It has a single writer and the only shared state
+    # is `written`, bumped once a row is complete, so recording takes no
+    # lock; a reader racing the writer can at worst see the oldest row half
+    # overwritten.
+    def __init__(self, stages, capacity=4096):
+        self.stages = stages
+        self.width = len(stages) + 1
+        self.capacity = capacity
+        self.data = array.array("q", bytes(8 * self.width * capacity))
+        self.written = 0
+
+    def record(self, started_ns, *durations):
+        data = self.data
+        offset = (self.written % self.capacity) * self.width
+        data[offset] = started_ns
+        for index, duration in enumerate(durations, offset + 1):
+            data[index] = duration
+        self.written += 1
+
+    def record_marks(self, marks):
+        # marks holds the start and the end of every stage in order
+        self.record(marks[0], *(end - start for start, end in zip(marks, marks[1:])))
+
+    def clear(self):
+        self.written = 0
+
+    def rows(self):
+        written = self.written
+        data, width, capacity = self.data, self.width, self.capacity
+        rows = []
+        for n in range(max(written - capacity, 0), written):
+            offset = (n % capacity) * width
+            rows.append(tuple(data[offset:offset + width]))
+        return rows
+
+    def summary(self):
+        rows = self.rows()
+        result = {}
+        for index, stage in enumerate(self.stages, 1):
+            values = sorted(row[index] for row in rows)
+            if values:
+                result[stage] = {
+                    "mean_ms": sum(values) / len(values) / 1e6,
+                    "p50_ms": values[len(values) // 2] / 1e6,
+                    "p99_ms": values[min(len(values) - 1, len(values) * 99 // 100)] / 1e6,
+                    "max_ms": values[-1] / 1e6,
+                }
+        return result
+
+    def write_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(("started_ns",) + self.stages)
+            writer.writerows(self.rows())
+
+
+class Instrumentation:
+    # The profiling mode, chosen on the Tk thread and applied by the typing
+    # worker. Stage timings are kept in every mode but "off". cProfile only
+    # sees the thread that enables it, so the worker switches it on or off
+    # itself at its next send (apply) and off when its run ends (release).
+    # tracemalloc traces the whole process and is switched right away.
+    def __init__(self, capacity=4096, tracemalloc_frames=10):
+        self.mode = "off"
+        self.sends = StageTimer(SEND_STAGES, capacity)
+        self.pump = StageTimer(PUMP_STAGES, capacity)
+        self.profile = None
+        self.profiling = False
+        self.tracemalloc_frames = tracemalloc_frames
+        self.tracing = False
+        # Kept when tracemalloc is switched off, for the next dump
+        self.snapshot = None
+
+    def set_mode(self, mode):
+        if mode not in MODES:
+            raise ValueError(f"Unknown profiling mode {mode!r}, expected one of {', '.join(MODES)}")
+        self.mode = mode
+        if mode == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+            self.tracing = True
+        elif mode != "tracemalloc" and self.tracing:
+            self.snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            self.tracing = False
+
+    def apply(self):
+        # Called by the worker before each send; True when the send should
+        # be timed
+        profile = self.mode == "cprofile"
+        if profile != self.profiling:
+            if profile:
+                if self.profile is None:
+                    self.profile = cProfile.Profile()
+                self.profile.enable()
+            else:
+                self.profile.disable()
+            self.profiling = profile
+        return self.mode != "off"
+
+    def release(self):
+        if self.profiling:
+            self.profile.disable()
+            self.profiling = False
+
+    def dump(self, directory):
+        # Writes everything collected so far into directory and returns the
+        # paths written
+        if self.profiling:
+            raise RuntimeError("Switch cProfile off or stop typing before dumping the profile")
+        os.makedirs(directory, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        paths = []
+        for name, timer in (("sends", self.sends), ("pump", self.pump)):
+            if timer.written:
+                path = os.path.join(directory, f"texttyper-{stamp}-{name}.csv")
+                timer.write_csv(path)
+                paths.append(path)
+        if self.profile is not None:
+            path = os.path.join(directory, f"texttyper-{stamp}.pstats")
+            self.profile.dump_stats(path)
+            paths.append(path)
+        snapshot = tracemalloc.take_snapshot() if self.tracing else self.snapshot
+        if snapshot is not None:
+            path = os.path.join(directory, f"texttyper-{stamp}-tracemalloc.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                for stat in snapshot.statistics("lineno")[:50]:
+                    file.write(f"{stat}\n")
+            paths.append(path)
+        return paths
+
+    def report(self):
+        lines = []
+        for name, timer in (("Send", self.sends), ("UI pump", self.pump)):
+            for stage, stats in timer.summary().items():
+                lines.append(
+                    f"{name} {stage}: mean {stats['mean_ms']:.3f} ms, "
+                    f"p99 {stats['p99_ms']:.3f} ms, max {stats['max_ms']:.3f} ms"
+                )
+        return "\n".join(lines)
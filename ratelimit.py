@@ -0,0 +1,143 @@
+import collections
+import time
+
+
+class TokenBucket:
+    # `rate` tokens per second, holding at most `burst`
+    def __init__(self, rate, burst=1, clock=time.monotonic_ns):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.updated_ns = clock()
+
+    def refill(self, now):
+        elapsed = (now - self.updated_ns) / 1e9
+        self.updated_ns = now
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+
+    def wait_time(self, now):
+        self.refill(now)
+        if self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+    def take(self, now):
+        self.refill(now)
+        self.tokens -= 1
+
+
+class WindowCap:
+    # At most `limit` sends in any sliding window of `window_s` seconds
+    def __init__(self, limit, window_s):
+        self.limit = limit
+        self.window_ns = int(window_s * 1e9)
+        self.sent = collections.deque(maxlen=limit)
+
+    def wait_time(self, now):
+        if len(self.sent) < self.limit:
+            return 0.0
+        return max(self.sent[0] + self.window_ns - now, 0) / 1e9
+
+    def record(self, now):
+        self.sent.append(now)
+
+
+class RateLimiter:
+    # Token bucket pacing with optional per-minute and per-hour caps. When
+    # the target signals throttling (signal_throttled, or throttle_detector
+    # returning True after a send) sending pauses for an exponentially
+    # growing backoff and the bucket rate is halved; every clean send after
+    # that wins back recovery_step of the configured rate.
+    def __init__(self, rate=None, burst=1, per_minute=None, per_hour=None,
+                 throttle_detector=None, backoff_s=5.0, max_backoff_s=600.0,
+                 recovery_step=0.05, clock=time.monotonic_ns):
+        self.clock = clock
+        self.rate = rate
+        self.bucket = TokenBucket(rate, burst, clock) if rate else None
+        self.caps = []
+        if per_minute:
+            self.caps.append(WindowCap(per_minute, 60))
+        if per_hour:
+            self.caps.append(WindowCap(per_hour, 3600))
+        self.per_minute = per_minute
+        self.per_hour = per_hour
+        self.throttle_detector = throttle_detector
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.recovery_step = recovery_step
+        self.scale = 1.0
+        self.backoff_level = 0
+        self.backoff_until_ns = 0
+        self.throttled = 0
+
+    def wait_time(self):
+        now = self.clock()
+        wait = max((self.backoff_until_ns - now) / 1e9, 0.0)
+        if self.bucket is not None:
+            wait = max(wait, self.bucket.wait_time(now))
+        for cap in self.caps:
+            wait = max(wait, cap.wait_time(now))
+        return wait
+
+    def record_send(self, command=None):
+        now = self.clock()
+        if self.bucket is not None:
+            self.bucket.take(now)
+        for cap in self.caps:
+            cap.record(now)
+        if self.throttle_detector is not None and self.throttle_detector(command):
+            self.signal_throttled()
+        elif self.backoff_level or self.scale < 1.0:
+            self.backoff_level = 0
+            self.set_scale(self.scale + self.recovery_step)
+
+    def signal_throttled(self):
+        self.throttled += 1
+        self.backoff_level += 1
+        backoff = min(self.backoff_s * 2 ** (self.backoff_level - 1), self.max_backoff_s)
+        self.backoff_until_ns = self.clock() + int(backoff * 1e9)
+        self.set_scale(self.scale / 2)
+
+    def set_scale(self, scale):
+        self.scale = min(max(scale, 1 / 64), 1.0)
+        if self.bucket is not None:
+            self.bucket.rate = self.rate * self.scale
+
+    def effective_rate(self, delay=None):
+        # Sustained sends per second once bursts are used up
+        limits = []
+        if delay:
+            limits.append(1 / delay)
+        if self.bucket is not None:
+            limits.append(self.bucket.rate)
+        if self.per_minute:
+            limits.append(self.per_minute / 60)
+        if self.per_hour:
+            limits.append(self.per_hour / 3600)
+        return min(limits) if limits else None
+
+    @classmethod
+    def from_settings(cls, per_minute_rate=None, burst=None, per_minute=None, per_hour=None):
+        # The GUI's fields: a rate in sends per minute plus optional caps.
+        # Returns None when nothing is limited.
+        if any(value is not None and value < 0 for value in (per_minute_rate, burst, per_minute, per_hour)):
+            raise ValueError("Rate limits cannot be negative")
+        if not (per_minute_rate or per_minute or per_hour):
+            return None
+        return cls(
+            rate=per_minute_rate / 60 if per_minute_rate else None,
+            burst=int(burst or 1),
+            per_minute=int(per_minute) if per_minute else None,
+            per_hour=int(per_hour) if per_hour else None,
+        )
+
+    def describe(self, delay=None):
+        rate = self.effective_rate(delay)
+        if rate is None:
+            return "Effective rate: unlimited"
+        text = f"Effective rate: {rate * 60:.1f}/min"
+        backoff = (self.backoff_until_ns - self.clock()) / 1e9
+        if backoff > 0:
+            text += f" (backing off {backoff:.0f}s)"
+        return text
@@ -0,0 +1,153 @@
+import time
+
+CATCH_UP = "catch-up"
+SKIP = "skip"
+POLICIES = (CATCH_UP, SKIP)
+
+
+class LatencyHistogram:
+    # Bucket i counts samples below 2**i microseconds (bucket 0 is "on time"),
+    # so 32 buckets cover everything up to ~35 minutes late
+    def __init__(self, buckets=32):
+        self.counts = [0] * buckets
+        self.total = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns):
+        if ns < 0:
+            ns = 0
+        index = min((ns // 1000).bit_length(), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.total += 1
+        self.sum_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def reset(self):
+        self.counts = [0] * len(self.counts)
+        self.total = 0
+        self.sum_ns = 0
+        self.max_ns = 0
+
+    def mean_ns(self):
+        return self.sum_ns // self.total if self.total else 0
+
+    def percentile(self, p):
+        # Upper edge of the bucket holding the p-th percentile, capped at the
+        # largest sample actually seen
+        if not self.total:
+            return 0
+        target = self.total * p / 100.0
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= target:
+                return min((1 << index) * 1000, self.max_ns)
+        return self.max_ns
+
+    def summary(self):
+        return {
+            "samples": self.total,
+            "mean_ms": self.mean_ns() / 1e6,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+    def format_buckets(self):
+        lines = []
+        for index, count in enumerate(self.counts):
+            if count:
+                lines.append(f"< {_format_us(1 << index)}: {count}")
+        return lines
+
+
+def _format_us(us):
+    if us >= 1000000:
+        return f"{us / 1000000:g} s"
+    if us >= 1000:
+        return f"{us / 1000:g} ms"
+    return f"{us} us"
+
+
+class VirtualClock:
+    # Stands in for time.monotonic_ns where time should only pass on
+    # request: sleep() advances it by exactly the time asked for, at least
+    # 1 ns so a rounding remainder cannot stall a waiting loop. start_ns
+    # stands for the wall time epoch_s (now by default), so wall() is the
+    # time of day a simulated send would go out at.
+    def __init__(self, start_ns=0, epoch_s=None):
+        self.start_ns = start_ns
+        self.now_ns = start_ns
+        self.epoch_s = time.time() if epoch_s is None else epoch_s
+
+    def __call__(self):
+        return self.now_ns
+
+    def wall(self):
+        return self.epoch_s + (self.now_ns - self.start_ns) / 1e9
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            self.now_ns += max(round(seconds * 1e9), 1)
+        return False
+
+
+class FixedRateScheduler:
+    # Fires on a grid of monotonic deadlines (start + k * period) instead of
+    # sleeping `period` after each send, so the time spent typing never
+    # accumulates into drift. When a deadline is missed entirely, "catch-up"
+    # fires the missed ticks back to back and "skip" drops them and realigns
+    # on the next grid point.
+    def __init__(self, period_s, policy=SKIP, clock=time.monotonic_ns, histogram=None):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown schedule policy {policy!r}")
+        self.period_ns = int(period_s * 1e9)
+        self.policy = policy
+        self.clock = clock
+        self.lateness = histogram if histogram is not None else LatencyHistogram()
+        self.next_deadline = None
+        self.started_at = None
+        self.first_fired_at = None
+        self.last_fired_at = None
+        self.fired = 0
+        self.skipped = 0
+
+    def start(self, immediately=False):
+        self.started_at = self.clock()
+        self.next_deadline = self.started_at + (0 if immediately else self.period_ns)
+        self.first_fired_at = None
+        self.last_fired_at = None
+        self.fired = 0
+        self.skipped = 0
+
+    def time_until_next(self):
+        remaining = self.next_deadline - self.clock()
+        return remaining / 1e9 if remaining > 0 else 0
+
+    def mark_fired(self):
+        now = self.clock()
+        self.lateness.record(now - self.next_deadline)
+        if self.first_fired_at is None:
+            self.first_fired_at = now
+        self.last_fired_at = now
+        self.fired += 1
+        self.next_deadline += self.period_ns
+        if self.policy == SKIP and self.period_ns and now >= self.next_deadline:
+            missed = (now - self.next_deadline) // self.period_ns + 1
+            self.next_deadline += missed * self.period_ns
+            self.skipped += missed
+
+    def set_period(self, period_s):
+        # Keep the last deadline as the grid origin so a change applies from
+        # the next send instead of restarting the schedule
+        period_ns = int(period_s * 1e9)
+        if self.next_deadline is not None:
+            self.next_deadline += period_ns - self.period_ns
+        self.period_ns = period_ns
+
+    def achieved_period(self):
+        if self.fired < 2:
+            return None
+        return (self.last_fired_at - self.first_fired_at) / 1e9 / (self.fired - 1)
@@ -0,0 +1,111 @@
+import random
+import re
+import time
+
+from playlist import LineIndex
+
+# {n}               send number, starting at 1
+# {time:%H:%M}      local time of the send (strftime format, default %H:%M:%S)
+# {choice:a|b|c}    one of the options at random
+# {line:file.txt}   next line of a file, wrapping around at the end
+# {{ and }}         literal braces
+#
+# Anything else in braces is kept as literal text.
+_TOKEN = re.compile(r"\{\{|\}\}|\{(n|time|choice|line)(?::([^{}]*))?\}")
+
+
+class Template:
+    # A command parsed once into literal strings and substitution functions.
+    # render() only calls the functions and joins; a template without
+    # placeholders renders to the same cached string every time.
+    def __init__(self, source, parts, dynamic, resources=()):
+        self.source = source
+        self.parts = parts
+        self.dynamic = dynamic
+        self.resources = resources
+        self.static = "".join(parts) if not dynamic else None
+
+    def render(self, n):
+        if self.static is not None:
+            return self.static
+        parts = self.parts.copy()
+        for index, substitute in self.dynamic:
+            parts[index] = substitute(n)
+        return "".join(parts)
+
+    def close(self):
+        for resource in self.resources:
+            resource.close()
+
+
+def _time_op(fmt, clock):
+    fmt = fmt or "%H:%M:%S"
+    wall = getattr(clock, "wall", None)
+    if wall is None:
+        return lambda n: time.strftime(fmt)
+    return lambda n: time.strftime(fmt, time.localtime(wall()))
+
+
+def _choice_op(options, rng):
+    choices = options.split("|")
+    return lambda n: rng.choice(choices)
+
+
+def _line_op(path, resources):
+    try:
+        index = LineIndex(path)
+    except OSError as e:
+        raise ValueError(f"Cannot read {path}: {e.strerror}")
+    if not len(index):
+        index.close()
+        raise ValueError(f"{path} has no non-blank lines")
+    resources.append(index)
+    position = [0]
+
+    def next_line(n):
+        line = index.line(position[0] % len(index))
+        position[0] += 1
+        return line
+    return next_line
+
+
+def compile_template(source, rng=None, clock=None):
+    # clock is the engine's clock; {time} reads the wall time from it when it
+    # has one (scheduler.VirtualClock.wall), so simulated sends are stamped
+    # with simulated time, and the real time of day otherwise
+    rng = rng or random.Random()
+    parts = []
+    dynamic = []
+    resources = []
+    literal = []
+    last = 0
+    for match in _TOKEN.finditer(source):
+        literal.append(source[last:match.start()])
+        last = match.end()
+        token = match.group(0)
+        if token in ("{{", "}}"):
+            literal.append(token[0])
+            continue
+        name, argument = match.group(1), match.group(2)
+        if name == "n":
+            if argument is not None:
+                literal.append(token)
+                continue
+            op = str
+        elif name == "time":
+            op = _time_op(argument, clock)
+        elif name == "choice":
+            if not argument:
+                raise ValueError("{choice:...} needs options separated by |")
+            op = _choice_op(argument, rng)
+        else:
+            if not argument:
+                raise ValueError("{line:...} needs a file name")
+            op = _line_op(argument, resources)
+        parts.append("".join(literal))
+        literal = []
+        dynamic.append((len(parts), op))
+        parts.append("")
+    literal.append(source[last:])
+    parts.append("".join(literal))
+    return Template(source, parts, dynamic, resources)
@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_engine import AsyncTypingEngine
+from backends import RecordingBackend
+
+
+class SlowBackend(RecordingBackend):
+    # Blocks in every send, like a backend typing a long command
+    def __init__(self, seconds):
+        super().__init__()
+        self.seconds = seconds
+        self.busy = []
+
+    def type_text(self, text):
+        started = time.monotonic_ns()
+        time.sleep(self.seconds)
+        self.busy.append((started, time.monotonic_ns()))
+        super().type_text(text)
+
+
+class AsyncEngineTest(unittest.TestCase):
+    def engine(self, backend, delay):
+        engine = AsyncTypingEngine(backend=backend, command="x", delay=delay,
+                                   start_immediately=True, paste_threshold=None)
+        self.addCleanup(engine.close)
+        return engine
+
+    def test_runs_interleave(self):
+        # The slow run's sends block on its backend; the fast run on the same
+        # loop must keep sending meanwhile
+        slow_backend = SlowBackend(0.3)
+        fast_backend = RecordingBackend()
+        slow = self.engine(slow_backend, 0)
+        fast = self.engine(fast_backend, 0.01)
+        slow_handle = slow.start("count", 2)
+        fast_handle = fast.start("count", 20)
+        fast_handle.wait(5)
+        slow_handle.wait(5)
+        sends = [ns for ns, _ in fast_backend.timeline()]
+        self.assertEqual(len(sends), 20)
+        during = [ns for ns in sends if any(start <= ns <= end for start, end in slow_backend.busy)]
+        self.assertGreater(len(during), 5)
+
+    def test_stop_during_a_send(self):
+        backend = SlowBackend(0.2)
+        engine = self.engine(backend, 0)
+        handle = engine.start("infinite")
+        handle.started.result(5)
+        time.sleep(0.05)
+        handle.stop()
+        handle.wait(5)
+        self.assertFalse(engine.is_running())
+        # The send in progress is left to finish; no new one starts
+        count = len(backend.busy)
+        time.sleep(0.3)
+        self.assertEqual(len(backend.busy), count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import array
+import os
+import sys
+import types
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends import XTestBackend
+
+FIRST_KEYCODE = 8
+WIDTH = 6
+
+
+class FakeDisplay:
+    # Just enough of an Xlib display for XTestBackend's layout handling.
+    # Rows come back as arrays, as python-xlib returns them.
+    def __init__(self, rows):
+        self.display = types.SimpleNamespace(info=types.SimpleNamespace(
+            min_keycode=FIRST_KEYCODE, max_keycode=FIRST_KEYCODE + len(rows) - 1,
+        ))
+        self.rows = [array.array("L", row + [0] * (WIDTH - len(row))) for row in rows]
+        self.events = []
+        self.changes = []
+
+    def get_keyboard_mapping(self, first, count):
+        return [row[:] for row in self.rows[first - FIRST_KEYCODE:first - FIRST_KEYCODE + count]]
+
+    def change_keyboard_mapping(self, first, keysyms):
+        self.changes.append((first, keysyms))
+        for offset, row in enumerate(keysyms):
+            self.rows[first - FIRST_KEYCODE + offset] = array.array("L", list(row) + [0] * (WIDTH - len(row)))
+
+    def pending_events(self):
+        return len(self.events)
+
+    def next_event(self):
+        return self.events.pop(0)
+
+    def refresh_keyboard_mapping(self, event):
+        pass
+
+    def sync(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class XTestLayoutTest(unittest.TestCase):
+    def setUp(self):
+        self.X = types.SimpleNamespace(KeyPress=2, KeyRelease=3, MappingNotify=34, MappingKeyboard=1)
+        self.display = FakeDisplay([
+            [ord("a"), ord("A")],
+            [0xFFE1],  # Shift_L
+            [0xFF0D],  # Return
+            [],
+            [],
+        ])
+        backend = XTestBackend.__new__(XTestBackend)
+        backend.X = self.X
+        backend.XK = types.SimpleNamespace(XK_Shift_L=0xFFE1, XK_Return=0xFF0D, string_to_keysym=lambda name: 0)
+        backend.display = self.display
+        backend.remapped = {}
+        backend.generation = 0
+        backend.load_layout()
+        self.backend = backend
+
+    def mapping_notify(self, first_keycode, count):
+        self.display.events.append(types.SimpleNamespace(
+            type=self.X.MappingNotify, request=self.X.MappingKeyboard,
+            first_keycode=first_keycode, count=count,
+        ))
+
+    def test_layout_reload_keeps_our_bindings(self):
+        self.backend.compile("é")
+        keycode, = self.backend.remapped
+        # A layout switch elsewhere, then the backend notices it
+        self.mapping_notify(FIRST_KEYCODE, 5)
+        self.backend.layout_version()
+        self.assertEqual(self.backend.remapped, {keycode: ord("é")})
+        self.backend.close()
+        self.assertEqual(self.display.changes[-1], (keycode, [(0, 0)]))
+        self.assertEqual(list(self.display.rows[keycode - FIRST_KEYCODE]), [0] * WIDTH)
+
+    def test_layout_reload_drops_overwritten_bindings(self):
+        self.backend.compile("é")
+        keycode, = self.backend.remapped
+        self.display.rows[keycode - FIRST_KEYCODE] = array.array("L", [ord("z")] + [0] * (WIDTH - 1))
+        self.mapping_notify(FIRST_KEYCODE, 5)
+        self.backend.layout_version()
+        self.assertEqual(self.backend.remapped, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends import RecordingBackend
+from engine import TypingEngine
+from jobs import JobRunner
+
+
+class JobTemplateTest(unittest.TestCase):
+    # A {line:file} template keeps the file open and mapped; the runner must
+    # close it whenever a job lets go of its template
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "lines.txt")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("first\nsecond\n")
+        self.backend = RecordingBackend()
+        self.runner = JobRunner(TypingEngine(backend=self.backend, paste_threshold=None))
+        self.addCleanup(self.runner.shutdown)
+
+    def index(self, job):
+        return job.template.resources[0]
+
+    def test_remove_closes_template(self):
+        job = self.runner.add(f"say {{line:{self.path}}}", delay=60)
+        index = self.index(job)
+        self.runner.remove(job.id)
+        self.assertTrue(index.file.closed)
+        self.assertTrue(index.map.closed)
+
+    def test_update_closes_old_template(self):
+        job = self.runner.add(f"say {{line:{self.path}}}", delay=60)
+        index = self.index(job)
+        self.runner.update(job.id, command="plain")
+        self.assertTrue(index.file.closed)
+        self.assertTrue(index.map.closed)
+
+    def test_finished_job_closes_template(self):
+        finished = threading.Event()
+        self.runner.on_job_finished = lambda job: finished.set()
+        job = self.runner.add(f"say {{line:{self.path}}}", delay=0, count=2, start_immediately=True)
+        index = self.index(job)
+        self.assertTrue(finished.wait(5))
+        self.assertEqual(job.state(), "done")
+        self.assertTrue(index.file.closed)
+        self.assertEqual(self.backend.sent_lines(), ["say first", "say second"])
+
+
+
+class SlowBackend(RecordingBackend):
+    def __init__(self):
+        super().__init__()
+        self.typing = threading.Event()
+
+    def type_text(self, text):
+        self.typing.set()
+        time.sleep(0.1)
+        super().type_text(text)
+
+
+class JobRestartTest(unittest.TestCase):
+    def test_job_stopped_mid_send_runs_after_restart(self):
+        backend = SlowBackend()
+        runner = JobRunner(TypingEngine(backend=backend, paste_threshold=None))
+        self.addCleanup(runner.shutdown)
+        finished = threading.Event()
+        runner.on_job_finished = lambda job: finished.set()
+        # Longer than a chunk, so Stop lands between chunks and Enter is
+        # never pressed
+        job = runner.add("again and again and again", delay=0, count=2, start_immediately=True)
+        self.assertTrue(backend.typing.wait(5))
+        runner.shutdown()
+        self.assertFalse(job.in_flight)
+        self.assertEqual(job.sent, 0)
+
+        runner.ensure_running()
+        self.assertTrue(finished.wait(5))
+        self.assertEqual(job.sent, 2)
+        self.assertEqual(backend.sent_lines()[-1], "again and again and again")
+
+
+if __name__ == "__main__":
+    unittest.main()
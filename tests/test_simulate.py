@@ -0,0 +1,40 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backends import RecordingBackend
+from engine import TypingEngine
+from ratelimit import RateLimiter
+from scheduler import VirtualClock
+
+
+class SimulateTest(unittest.TestCase):
+    def engine(self, delay):
+        self.clock = VirtualClock()
+        self.backend = RecordingBackend(clock=self.clock)
+        return TypingEngine(backend=self.backend, command="x", delay=delay, paste_threshold=None, clock=self.clock)
+
+    def test_zero_delay_without_limit_is_rejected(self):
+        # Virtual time would never advance, so the run would never end
+        engine = self.engine(0)
+        with self.assertRaises(ValueError):
+            engine.simulate("infinite", until_s=3600)
+        self.assertEqual(self.backend.sent_lines(), [])
+
+    def test_zero_delay_with_rate_limit_ends(self):
+        engine = self.engine(0)
+        engine.set_limiter(RateLimiter(rate=1, clock=self.clock))
+        engine.simulate("infinite", until_s=60)
+        self.assertEqual(self.clock(), 60 * 10 ** 9)
+        self.assertEqual(len(self.backend.sent_lines()), 61)
+
+    def test_zero_delay_count_run_ends(self):
+        engine = self.engine(0)
+        engine.simulate("count", 5, until_s=60)
+        self.assertEqual(len(self.backend.sent_lines()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import importlib.util
+import os
+import sys
+import time
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+@unittest.skipUnless(os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"), "needs a display")
+class WidgetReuseTest(unittest.TestCase):
+    # The V1 window builds its dialogs once and only hides them, so opening
+    # and closing them again must not add widgets
+
+    @classmethod
+    def setUpClass(cls):
+        spec = importlib.util.spec_from_file_location("gui", os.path.join(ROOT, "text_typer_GUI.py"))
+        cls.module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cls.module)
+
+    def setUp(self):
+        tk = self.module.tk
+        try:
+            self.root = tk.Tk()
+        except tk.TclError as e:
+            self.skipTest(f"no usable display: {e}")
+        self.addCleanup(self.root.destroy)
+        started = time.perf_counter()
+        self.app = self.module.AutoTyperApp(self.root)
+        self.root.update()
+        self.first_paint_s = time.perf_counter() - started
+        self.addCleanup(self.app.stop_typing)
+
+    def cycle(self, times):
+        for _ in range(times):
+            self.app.set_timer()
+            self.root.update()
+            self.app.hide_timer_dialog()
+            self.app.open_jobs()
+            self.root.update()
+            self.app.jobs_dialog.withdraw()
+            self.root.update()
+
+    def test_first_paint(self):
+        self.assertLess(self.first_paint_s, 5)
+        self.assertGreater(count_widgets(self.root), 1)
+
+    def test_dialogs_are_reused(self):
+        # The first cycle builds both dialogs; later ones only show them
+        self.cycle(1)
+        widgets = count_widgets(self.root)
+        self.cycle(10)
+        self.assertEqual(count_widgets(self.root), widgets)
+
+
+if __name__ == "__main__":
+    unittest.main()
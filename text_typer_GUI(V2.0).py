@@ -1,13 +1,17 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
-import threading
-import pyautogui
+from tkinter import ttk
 import os
-import ctypes
 import sys
+from async_engine import AsyncTypingEngine
+from icons import IconCache
+from ratelimit import RateLimiter
+from scheduler import CATCH_UP, SKIP
+from themes import THEMES, ThemeEngine
+from ui_pump import RateMeter, UIPump
 
 def set_dpi_awareness():
     if sys.platform == 'win32':
+        import ctypes
         try:
             ctypes.windll.shcore.SetProcessDpiAwareness(2)
         except (AttributeError, OSError):
@@ -23,26 +27,43 @@ class AutoTyperApp:
         self.master = master
         master.title("Auto Typer Pro")
         self.scale_factor = self.get_system_scaling()
-        master.geometry(f"{int(320 * self.scale_factor)}x{int(150 * self.scale_factor)}")
+        master.geometry(f"{int(320 * self.scale_factor)}x{int(175 * self.scale_factor)}")
         master.resizable(False, False)
         self.center_window(master)
         
-        self.current_command = "owo hunt"
-        self.stop_event = threading.Event()
-        self.command_lock = threading.Lock()
+        # The keystroke backend (and pyautogui with it) loads on the first Start
+        self.engine = AsyncTypingEngine(command="owo hunt", start_immediately=True)
+        self.rate_meter = RateMeter()
+        self.pump = UIPump(master)
+        self.pump.subscribe("progress", self.show_progress)
+        self.pump.subscribe("finished", self.on_finished)
+        self.pump.subscribe("error", self.show_typing_error)
+        self.engine.on_sent = lambda count: self.pump.post("progress", count)
+        self.engine.on_finished = lambda: self.pump.post("finished")
+        self.engine.on_error = lambda e: self.pump.post("error", e)
         self.delay = tk.DoubleVar(value=12.0)
         self.typing_mode = tk.StringVar(value="infinite")
         self.type_count = tk.IntVar(value=10)
-        self.current_count = 0
+        self.count_mode = tk.BooleanVar(value=False)
+        self.catch_up = tk.BooleanVar(value=False)
+        self.hard_abort = tk.BooleanVar(value=False)
+        self.rate_per_minute = tk.StringVar()
+        self.rate_burst = tk.StringVar(value="1")
+        self.rate_per_hour = tk.StringVar()
         self.theme = tk.StringVar(value="Light")
+        # Built on first open, then hidden and shown again
+        self.settings_window = None
         
-        self.style = ttk.Style()
-        self.configure_styles()
+        self.icons = IconCache(master, self.scale_factor)
+        self.themes = ThemeEngine(ttk.Style(), self.scale_factor)
+        self.themes.apply(self.theme.get())
         self.setup_ui()
         self.master.attributes("-topmost", True)
+        self.pump.start()
 
     def get_system_scaling(self):
         if sys.platform == 'win32':
+            import ctypes
             try:
                 user32 = ctypes.windll.user32
                 return user32.GetDpiForSystem() / 96
@@ -60,148 +81,163 @@ class AutoTyperApp:
         y = (screen_height - window_height) // 2
         window.geometry(f"+{x}+{y}")
 
-    def configure_styles(self):
-        self.style.theme_use('clam')
-        self.style.configure('.', font=('Segoe UI', int(9 * self.scale_factor)))
-        
-        # Light theme
-        self.style.configure('light.TFrame', background='#FFFFFF')
-        self.style.configure('light.TButton', 
-                        background='#4CAF50', 
-                        foreground='white',
-                        bordercolor='#4CAF50',
-                        focuscolor='#4CAF50')
-        self.style.map('light.TButton',
-                    background=[('active', '#45a049')])
-        
-        # Dark theme
-        self.style.configure('dark.TFrame', background='#2d2d2d')
-        self.style.configure('dark.TButton',
-                        background='#2196F3',
-                        foreground='white',
-                        bordercolor='#2196F3',
-                        focuscolor='#2196F3')
-        self.style.map('dark.TButton',
-                    background=[('active', '#1976D2')])
-
     def setup_ui(self):
         # Main container
-        main_frame = ttk.Frame(self.master)
-        main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        main_frame = ttk.Frame(self.master, style="App.TFrame", padding=5)
+        main_frame.pack(fill=tk.BOTH, expand=True)
 
         # Settings button
-        settings_frame = ttk.Frame(main_frame)
+        settings_frame = ttk.Frame(main_frame, style="App.TFrame")
         settings_frame.pack(fill=tk.X, pady=5)
-        self.settings_icon = tk.PhotoImage(file="texttyper/settings.png")  # Updated path
-        self.settings_icon = self.resize_image(self.settings_icon, (20, 20))  # Resize image
-        ttk.Button(settings_frame, text="Settings", command=self.open_settings, style=f'{self.theme.get().lower()}.TButton', image=self.settings_icon, compound=tk.LEFT).pack(side=tk.RIGHT)
+        ttk.Button(settings_frame, text="Settings", command=self.open_settings, style="App.TButton", image=self.icons.get("settings"), compound=tk.LEFT).pack(side=tk.RIGHT)
 
         # Command entry
-        entry_frame = ttk.Frame(main_frame)
+        entry_frame = ttk.Frame(main_frame, style="App.TFrame")
         entry_frame.pack(fill=tk.X, pady=5)
         
-        ttk.Label(entry_frame, text="Command:").pack(side=tk.LEFT, padx=2)
-        self.command_entry = ttk.Entry(entry_frame, width=25)
-        self.command_entry.insert(0, self.current_command)
+        ttk.Label(entry_frame, style="App.TLabel", text="Command:").pack(side=tk.LEFT, padx=2)
+        self.command_entry = ttk.Entry(entry_frame, style="App.TEntry", width=25)
+        self.command_entry.insert(0, self.engine.current_command)
         self.command_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=2)
         
-        self.update_icon = tk.PhotoImage(file="texttyper/updated.png")  # Updated path
-        self.update_icon = self.resize_image(self.update_icon, (20, 20))  # Resize image
-        ttk.Button(entry_frame, text="Update", command=self.update_command, style=f'{self.theme.get().lower()}.TButton', width=8, image=self.update_icon, compound=tk.LEFT).pack(side=tk.LEFT, padx=2)
+        ttk.Button(entry_frame, text="Update", command=self.update_command, style="App.TButton", width=8, image=self.icons.get("update"), compound=tk.LEFT).pack(side=tk.LEFT, padx=2)
 
 
         # Control buttons
 
 
-        button_frame = ttk.Frame(main_frame)
+        button_frame = ttk.Frame(main_frame, style="App.TFrame")
         button_frame.pack(fill=tk.X, pady=5)
         
-        self.start_icon = tk.PhotoImage(file="texttyper/play.png")  # Updated path
-        self.start_icon = self.resize_image(self.start_icon, (20, 20))  # Resize image
         self.start_button = ttk.Button(
             button_frame, 
             text="Start", 
             command=self.start_typing,
-            style=f'{self.theme.get().lower()}.TButton',
+            style="App.TButton",
             width=10,
-            image=self.start_icon,
+            image=self.icons.get("start"),
             compound=tk.LEFT
         )
         self.start_button.pack(side=tk.LEFT, expand=True, padx=2)
         
-        self.stop_icon = tk.PhotoImage(file="texttyper/stop-button.png")  # Updated path
-        self.stop_icon = self.resize_image(self.stop_icon, (20, 20))  # Resize image
         self.stop_button = ttk.Button(
             button_frame, 
             text="Stop", 
             command=self.stop_typing,
-            style=f'{self.theme.get().lower()}.TButton',
+            style="App.TButton",
             width=10,
             state=tk.DISABLED,
-            image=self.stop_icon,
+            image=self.icons.get("stop"),
             compound=tk.LEFT
         )
         self.stop_button.pack(side=tk.LEFT, expand=True, padx=2)
 
-        self.update_theme()
+        # Live counters
+        self.status_label = ttk.Label(main_frame, style="App.TLabel", text="Sent: 0")
+        self.status_label.pack(fill=tk.X, pady=2)
 
     def open_settings(self):
-        if hasattr(self, "settings_window") and self.settings_window.winfo_exists():
-            self.settings_window.lift()
-            return
+        if self.settings_window is None:
+            self.build_settings_window()
+        self.rate_label.config(text=self.engine.effective_rate_text())
+        self.settings_window.deiconify()
+        self.center_window(self.settings_window)
+        self.settings_window.lift()
 
+    def build_settings_window(self):
         self.settings_window = tk.Toplevel(self.master)
+        self.settings_window.withdraw()
         self.settings_window.attributes("-topmost", True)
+        self.settings_window.protocol("WM_DELETE_WINDOW", self.settings_window.withdraw)
 
         self.settings_window.title("Settings")
-        self.settings_window.geometry(f"{int(300 * self.scale_factor)}x{int(200 * self.scale_factor)}")
+        self.settings_window.geometry(f"{int(300 * self.scale_factor)}x{int(380 * self.scale_factor)}")
         self.settings_window.resizable(False, False)
-        self.center_window(self.settings_window)
         
-        container = ttk.Frame(self.settings_window)
-        container.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        container = ttk.Frame(self.settings_window, style="App.TFrame", padding=10)
+        container.pack(fill=tk.BOTH, expand=True)
 
         # Count Mode
-        count_frame = ttk.Frame(container)
+        count_frame = ttk.Frame(container, style="App.TFrame")
         count_frame.pack(fill=tk.X, pady=5)
-        self.count_mode = tk.BooleanVar(value=False)
         ttk.Checkbutton(
             count_frame, 
+            style="App.TCheckbutton",
             text="Enable Count Mode", 
             variable=self.count_mode,
             command=self.toggle_count_mode
         ).pack(side=tk.LEFT)
         
         # Count Entry
-        count_entry_frame = ttk.Frame(container)
+        count_entry_frame = ttk.Frame(container, style="App.TFrame")
         count_entry_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(count_entry_frame, text="Repeat Count:").pack(side=tk.LEFT)
-        self.count_entry = ttk.Entry(count_entry_frame, textvariable=self.type_count, width=8)
+        ttk.Label(count_entry_frame, style="App.TLabel", text="Repeat Count:").pack(side=tk.LEFT)
+        self.count_entry = ttk.Entry(count_entry_frame, style="App.TEntry", textvariable=self.type_count, width=8)
         self.count_entry.pack(side=tk.RIGHT)
         self.count_entry.state(['disabled'])
 
         # Delay Settings
-        delay_frame = ttk.Frame(container)
+        delay_frame = ttk.Frame(container, style="App.TFrame")
         delay_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(delay_frame, text="Delay (seconds):").pack(side=tk.LEFT)
-        ttk.Spinbox(delay_frame, from_=1, to=60, textvariable=self.delay, width=8).pack(side=tk.RIGHT)
+        ttk.Label(delay_frame, style="App.TLabel", text="Delay (seconds):").pack(side=tk.LEFT)
+        ttk.Spinbox(delay_frame, style="App.TSpinbox", from_=1, to=60, textvariable=self.delay, width=8).pack(side=tk.RIGHT)
+
+        # Schedule
+        schedule_frame = ttk.Frame(container, style="App.TFrame")
+        schedule_frame.pack(fill=tk.X, pady=5)
+        ttk.Checkbutton(
+            schedule_frame,
+            style="App.TCheckbutton",
+            text="Catch up missed sends",
+            variable=self.catch_up
+        ).pack(side=tk.LEFT)
+        ttk.Button(
+            schedule_frame,
+            style="App.TButton",
+            text="Timing Stats",
+            command=self.show_timing_stats
+        ).pack(side=tk.RIGHT)
+
+        abort_frame = ttk.Frame(container, style="App.TFrame")
+        abort_frame.pack(fill=tk.X, pady=5)
+        ttk.Checkbutton(
+            abort_frame,
+            style="App.TCheckbutton",
+            text="Stop mid-word",
+            variable=self.hard_abort
+        ).pack(side=tk.LEFT)
+
+        # Rate limit, blank is off
+        rate_frame = ttk.Frame(container, style="App.TFrame")
+        rate_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(rate_frame, style="App.TLabel", text="Rate (per min):").pack(side=tk.LEFT)
+        ttk.Entry(rate_frame, style="App.TEntry", textvariable=self.rate_per_minute, width=6).pack(side=tk.RIGHT)
+        ttk.Label(rate_frame, style="App.TLabel", text="Burst:").pack(side=tk.LEFT, padx=(10, 0))
+        ttk.Entry(rate_frame, style="App.TEntry", textvariable=self.rate_burst, width=4).pack(side=tk.LEFT)
+
+        hour_frame = ttk.Frame(container, style="App.TFrame")
+        hour_frame.pack(fill=tk.X, pady=5)
+        ttk.Label(hour_frame, style="App.TLabel", text="Max per hour:").pack(side=tk.LEFT)
+        ttk.Entry(hour_frame, style="App.TEntry", textvariable=self.rate_per_hour, width=6).pack(side=tk.RIGHT)
+
+        self.rate_label = ttk.Label(container, style="App.TLabel")
+        self.rate_label.pack(fill=tk.X, pady=5)
 
         # Theme Selector
-        theme_frame = ttk.Frame(container)
+        theme_frame = ttk.Frame(container, style="App.TFrame")
         theme_frame.pack(fill=tk.X, pady=5)
-        ttk.Label(theme_frame, text="Theme:").pack(side=tk.LEFT)
+        ttk.Label(theme_frame, style="App.TLabel", text="Theme:").pack(side=tk.LEFT)
         theme_combo = ttk.Combobox(
             theme_frame, 
+            style="App.TCombobox",
             textvariable=self.theme, 
-            values=["Light", "Dark"],
+            values=list(THEMES),
             state="readonly",
             width=10
         )
         theme_combo.pack(side=tk.RIGHT)
         theme_combo.bind("<<ComboboxSelected>>", self.update_theme)
 
-        self.update_theme()
-
     def toggle_count_mode(self):
         if self.count_mode.get():
             self.typing_mode.set("count")
@@ -211,36 +247,27 @@ class AutoTyperApp:
             self.count_entry.state(['disabled'])
 
     def update_theme(self, event=None):
-        theme = self.theme.get().lower()
-        bg = '#FFFFFF' if theme == 'light' else '#2d2d2d'
-        fg = '#000000' if theme == 'light' else '#FFFFFF'
-        
-        # Update main window
-        for widget in self.master.winfo_children():
-            if isinstance(widget, ttk.Frame):
-                widget.configure(style=f'{theme}.TFrame')
-        
-        # Update settings window
-        if hasattr(self, 'settings_window') and self.settings_window.winfo_exists():
-            for widget in self.settings_window.winfo_children():
-                if isinstance(widget, ttk.Frame):
-                    widget.configure(style=f'{theme}.TFrame')
-
-        # Update button styles
-        self.style.configure(f'{theme}.TButton', font=('Segoe UI', int(9 * self.scale_factor)), padding=4, relief=tk.RAISED)
-        
-        # Update entry field colors
-        self.style.configure(f'{theme}.TEntry', fieldbackground='#f0f0f0' if theme == 'light' else '#404040', foreground=fg)
+        self.themes.apply(self.theme.get())
 
     def update_command(self):
-        with self.command_lock:
-            self.current_command = self.command_entry.get()
+        from tkinter import messagebox
+        try:
+            self.engine.set_command(self.command_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid command: {e}")
+            return
         messagebox.showinfo("Updated", "Command updated successfully!")
 
     def start_typing(self):
+        from tkinter import messagebox
         try:
             delay = float(self.delay.get())
             count = int(self.type_count.get())
+            limiter = RateLimiter.from_settings(
+                float(self.rate_per_minute.get() or 0),
+                int(self.rate_burst.get() or 1),
+                per_hour=int(self.rate_per_hour.get() or 0),
+            )
         except ValueError:
             messagebox.showerror("Error", "Invalid input values")
             return
@@ -249,45 +276,45 @@ class AutoTyperApp:
             messagebox.showerror("Error", "Count must be at least 1")
             return
 
-        self.current_count = 0
-        self.stop_event.clear()
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         
-        threading.Thread(
-            target=self.typing_loop,
-            args=(delay, self.typing_mode.get(), count),
-            daemon=True
-        ).start()
-
-    def typing_loop(self, delay, mode, count_limit):
-        while not self.stop_event.is_set():
-            with self.command_lock:
-                command = self.current_command
-            
-            try:
-                pyautogui.typewrite(command)
-                pyautogui.press("enter")
-            except Exception as e:
-                messagebox.showerror("Typing Error", str(e))
-                break
-            
-            self.current_count += 1
-
-            if mode == "count" and self.current_count >= count_limit:
-                self.stop_typing()
-                break
-
-            self.stop_event.wait(delay)
+        self.rate_meter.reset()
+        self.status_label.config(text="Sent: 0")
+        self.engine.set_delay(delay)
+        self.engine.set_policy(CATCH_UP if self.catch_up.get() else SKIP)
+        self.engine.hard_abort = self.hard_abort.get()
+        self.engine.set_limiter(limiter)
+        if self.settings_window is not None:
+            self.rate_label.config(text=self.engine.effective_rate_text())
+        try:
+            self.engine.start(self.typing_mode.get(), count)
+        except (ImportError, RuntimeError) as e:
+            self.stop_typing()
+            messagebox.showerror("Error", f"Cannot send keystrokes: {e}")
 
     def stop_typing(self):
-        self.stop_event.set()
+        self.engine.stop()
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
-        messagebox.showinfo("Stopped", "Auto typing has been stopped")
 
-    def resize_image(self, image, size):
-        return image.subsample(int(image.width() / size[0]), int(image.height() / size[1]))
+    def show_progress(self, count):
+        rate = self.rate_meter.update(count)
+        self.status_label.config(text=f"Sent: {count}  ({rate:.2f}/s)")
+
+    def on_finished(self, _=None):
+        from tkinter import messagebox
+        self.stop_typing()
+        messagebox.showinfo("Finished", f"Sent {self.engine.current_count} times")
+
+    def show_typing_error(self, error):
+        from tkinter import messagebox
+        self.stop_typing()
+        messagebox.showerror("Typing Error", str(error))
+
+    def show_timing_stats(self):
+        from tkinter import messagebox
+        messagebox.showinfo("Timing Stats", self.engine.timing_report())
 
 def main():
     root = tk.Tk()
@@ -1,17 +1,39 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, colorchooser, messagebox
-import threading
-import pyautogui
-import webbrowser
+from tkinter import ttk
 import os
-import ctypes
+import socket
 import sys
+import time
+from async_engine import AsyncTypingEngine
+from engine import TypingEngine
+from jobs import JobRunner
+from ratelimit import RateLimiter
+from playlist import ORDERS, SEQUENTIAL, Playlist
+from scheduler import CATCH_UP, SKIP
+from ui_pump import RateMeter, UIPump
+
+# Long imports are fine now that they are pasted rather than typed
+MAX_IMPORT_CHARS = 65536
+# The window turns half transparent after this long without input
+IDLE_TIMEOUT_S = 120
+
+def button_style(font, bg, active_bg):
+    return dict(
+        font=font,
+        bg=bg,
+        fg="white",
+        activebackground=active_bg,
+        activeforeground="white",
+        relief=tk.RAISED,
+        borderwidth=2
+    )
 
 if sys.platform.startswith('linux'):
     os.environ["GDK_SCALE"] = "1"
     os.environ["QT_AUTO_SCREEN_SCALE_FACTOR"] = "1"
 
 if sys.platform == 'win32':
+    import ctypes
     ctypes.windll.shcore.SetProcessDpiAwareness(1)
 
 class AutoTyperApp:
@@ -19,7 +41,7 @@ class AutoTyperApp:
         self.master = master
         master.title("Auto Typer")
         self.base_width = 300
-        self.base_height = 140
+        self.base_height = 165
         self.scale_factor = self.get_system_scaling()
         
         # Configure main window
@@ -28,152 +50,49 @@ class AutoTyperApp:
         master.attributes("-topmost", True)
         self.center_window(master)
 
-        # Create frames first
-        control_frame = tk.Frame(master)
-        mode_frame = tk.Frame(master)
-        button_frame = tk.Frame(master)
-        control_frame.pack(pady=5)
-        mode_frame.pack(pady=5)
-        button_frame.pack(pady=5)
-
         # Initialize variables
         self.transparent = False
         self.inactivity_timer = None
-        self.current_command = "owo hunt"
-        self.stop_event = threading.Event()
-        self.command_lock = threading.Lock()
-        self.delay = 12
+        self.last_activity = time.monotonic()
+        # The keystroke backend (and pyautogui with it) loads on the first
+        # Start; runs are tasks on one shared event loop thread
+        self.engine = AsyncTypingEngine(command="owo hunt", delay=12)
+        self.rate_meter = RateMeter()
+        self.pump = UIPump(master, coalesce=("progress", "jobs"))
+        self.pump.subscribe("progress", self.show_progress)
+        self.pump.subscribe("finished", lambda _: self.stop_typing())
+        self.pump.subscribe("error", self.show_typing_error)
+        self.connect_engine()
+        # Extra commands with their own delays, typed by one shared thread
+        # through the same injector lock as the main command
+        self.job_runner = JobRunner(TypingEngine(command=""))
+        self.job_runner.engine.inject_lock = self.engine.inject_lock
+        self.job_runner.on_sent = lambda job: self.pump.post("jobs")
+        self.job_runner.on_job_finished = lambda job: self.pump.post("jobs")
+        self.job_runner.on_error = lambda job, e: self.pump.post("error", e)
+        self.pump.subscribe("jobs", lambda _: self.refresh_jobs())
+        # Dialogs are built on first open, then hidden and shown again
+        self.timer_dialog = None
+        self.jobs_dialog = None
         self.typing_mode = tk.StringVar(value="infinite")
         self.type_count = tk.IntVar(value=10)
-        self.current_count = 0
+        self.catch_up = tk.BooleanVar(value=False)
+        self.hard_abort = tk.BooleanVar(value=False)
+        self.repeats = tk.IntVar(value=1)
+        self.playlist_order = tk.StringVar(value=SEQUENTIAL)
+        self.isolated = tk.BooleanVar(value=False)
+        # profiling.Instrumentation, imported and created on first use
+        self.instrumentation = None
+        self.profiling_mode = tk.StringVar(value="off")
+        self.rate_settings = {
+            name: tk.StringVar() for name in ("rate", "burst", "per_minute", "per_hour")
+        }
 
         # Define font scaling
         self.default_font = ("Tahoma", int(9 * self.scale_factor))
 
-        # Control elements
-        self.command_label = tk.Label(
-            control_frame, 
-            text="TEXT:", 
-            font=self.default_font
-        )
-        self.command_entry = tk.Entry(
-            control_frame,
-            width=20,
-            font=self.default_font,
-            bg="#F0F0F0",
-            fg="#333333",
-            relief=tk.GROOVE,
-            borderwidth=2
-        )
-        self.command_entry.insert(0, self.current_command)
-        
-        self.update_button = tk.Button(
-            control_frame,
-            text="OK",
-            command=self.update_command,
-            width=4,
-            font=self.default_font,
-            bg="#2196F3",
-            fg="white",
-            activebackground="#1976D2",
-            activeforeground="white",
-            relief=tk.RAISED,
-            borderwidth=2
-        )
-
-        # Mode selection
-        self.mode_selector = ttk.Combobox(
-            mode_frame,
-            textvariable=self.typing_mode,
-            values=["infinite", "count"],
-            state="readonly",
-            width=8,
-            font=self.default_font
-        )
-        self.count_entry = tk.Entry(
-            mode_frame,
-            textvariable=self.type_count,
-            width=5,
-            font=self.default_font,
-            bg="#F0F0F0",
-            relief=tk.GROOVE,
-            borderwidth=2
-        )
-        self.count_label = tk.Label(
-            mode_frame,
-            text="Times:",
-            font=self.default_font
-        )
-
-        # Buttons
-        self.start_button = tk.Button(
-            button_frame,
-            text="Start",
-            command=self.start_typing,
-            width=8,
-            font=self.default_font,
-            bg="#4CAF50",
-            fg="white",
-            activebackground="#45A049",
-            activeforeground="white",
-            relief=tk.RAISED,
-            borderwidth=2
-        )
-        self.stop_button = tk.Button(
-            button_frame,
-            text="Stop",
-            command=self.stop_typing,
-            state=tk.DISABLED,
-            width=8,
-            font=self.default_font,
-            bg="#F44336",
-            fg="white",
-            activebackground="#D32F2F",
-            activeforeground="white",
-            relief=tk.RAISED,
-            borderwidth=2
-        )
-
-        # Grid layout
-        self.command_label.grid(row=0, column=0, padx=2)
-        self.command_entry.grid(row=0, column=1, padx=2)
-        self.update_button.grid(row=0, column=2, padx=2)
-        
-        self.mode_selector.grid(row=0, column=0, padx=2)
-        self.count_label.grid(row=0, column=1, padx=2)
-        self.count_entry.grid(row=0, column=2, padx=2)
-        
-        self.start_button.grid(row=0, column=0, padx=5)
-        self.stop_button.grid(row=0, column=1, padx=5)
-
-        # Hover effects
-        def on_enter(e):
-            e.widget['relief'] = tk.SUNKEN
-            e.widget['bg'] = e.widget.cget('activebackground')
-            
-        def on_leave(e):
-            e.widget['relief'] = tk.RAISED
-            e.widget['bg'] = e.widget.cget('bg')
-
-        for btn in [self.update_button, self.start_button, self.stop_button]:
-            btn.bind("<Enter>", on_enter)
-            btn.bind("<Leave>", on_leave)
-            btn.config(cursor="hand2")
-
-        # Menu system
-        self.menu_bar = tk.Menu(master)
-        file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        file_menu.add_command(label="Import", command=self.open_file)
-        file_menu.add_command(label="Export", command=self.export_content)
-        file_menu.add_command(label="Save", command=self.open_youtube)
-        
-        settings_menu = tk.Menu(self.menu_bar, tearoff=0)
-        settings_menu.add_command(label="Timer", command=self.set_timer)
-        settings_menu.add_command(label="Color", command=self.change_color)
-        
-        self.menu_bar.add_cascade(label="File", menu=file_menu)
-        self.menu_bar.add_cascade(label="Settings", menu=settings_menu)
-        master.config(menu=self.menu_bar)
+        self.build_ui()
+        self.build_menu()
 
         # Transparency controls
         self.start_inactivity_timer()
@@ -182,69 +101,70 @@ class AutoTyperApp:
         master.bind("<KeyPress>", self.reset_inactivity_timer)
         master.bind("<ButtonPress>", self.reset_inactivity_timer)
 
-
-        # Create widgets
-        # Top row elements
-        self.command_label = tk.Label( 
-            text="TEXT:", 
-            font=self.default_font
-        )
-        self.command_entry = tk.Entry(
-            width=15,
-            font=self.default_font,
-            bg="#F0F0F0",
-            fg="#333333",
-            relief=tk.GROOVE,
-            borderwidth=2
-        )
-        self.command_entry.insert(0, self.current_command)
-        
-        self.update_button = tk.Button(
-            text="OK",
-            command=self.update_command,
-            width=4,
-            font=self.default_font,
-            bg="#2196F3",
-            fg="white",
-            activebackground="#1976D2",
-            activeforeground="white",
-            relief=tk.RAISED,
-            borderwidth=2
-        )
-
-        # Bottom row elements
-        self.start_button = tk.Button(
-            text="Start",
-            command=self.start_typing,
-            width=6,
-            font=self.default_font,
-            bg="#4CAF50",
-            fg="white",
-            activebackground="#45A049",
-            activeforeground="white",
-            relief=tk.RAISED,
-            borderwidth=2
-        )
-        self.stop_button = tk.Button(
-            text="Stop",
-            command=self.stop_typing,
-            state=tk.DISABLED,
-            width=6,
-            font=self.default_font,
-            bg="#F44336",
-            fg="white",
-            activebackground="#D32F2F",
-            activeforeground="white",
-            relief=tk.RAISED,
-            borderwidth=2
-        )
-
-        # Grid layout
-        self.command_label.grid(row=0, column=0, padx=2)
-        self.command_entry.grid(row=0, column=1, padx=2)
-        self.update_button.grid(row=0, column=2, padx=2)
-        self.start_button.grid(row=0, column=0, padx=5)
-        self.stop_button.grid(row=0, column=1, padx=5)
+        # Scripts can drive the typer over a local socket when
+        # TEXTTYPER_CONTROL names one (see control.py)
+        self.control = None
+        control_path = os.environ.get("TEXTTYPER_CONTROL")
+        if control_path and hasattr(socket, "AF_UNIX"):
+            from control import ControlServer
+            try:
+                self.control = ControlServer(self.engine, control_path)
+            except (OSError, ValueError) as e:
+                from tkinter import messagebox
+                messagebox.showerror("Error", f"Cannot open the control socket: {e}")
+            else:
+                self.control.on_change = lambda: self.pump.post("control")
+                self.pump.subscribe("control", lambda _: self.sync_control())
+                self.control.start()
+
+        # Worker -> GUI events
+        self.pump.start()
+
+    def build_ui(self):
+        # The whole main window as data: one frame per row, packed top to
+        # bottom, with its widgets gridded left to right and kept as
+        # self.<name>
+        font = self.default_font
+        entry = dict(font=font, bg="#F0F0F0", relief=tk.GROOVE, borderwidth=2)
+        rows = [
+            (5, 2, [
+                ("command_label", tk.Label, dict(text="TEXT:", font=font)),
+                ("command_entry", tk.Entry, dict(entry, width=20, fg="#333333")),
+                ("update_button", tk.Button, dict(
+                    button_style(font, "#2196F3", "#1976D2"), text="OK", command=self.update_command, width=4
+                )),
+            ]),
+            (5, 2, [
+                ("mode_selector", ttk.Combobox, dict(
+                    textvariable=self.typing_mode, values=["infinite", "count"],
+                    state="readonly", width=8, font=font
+                )),
+                ("count_label", tk.Label, dict(text="Times:", font=font)),
+                ("count_entry", tk.Entry, dict(entry, textvariable=self.type_count, width=5)),
+            ]),
+            (5, 5, [
+                ("start_button", tk.Button, dict(
+                    button_style(font, "#4CAF50", "#45A049"), text="Start", command=self.start_typing, width=8
+                )),
+                ("stop_button", tk.Button, dict(
+                    button_style(font, "#F44336", "#D32F2F"), text="Stop", command=self.stop_typing,
+                    state=tk.DISABLED, width=8
+                )),
+            ]),
+            (0, 0, [
+                ("status_label", tk.Label, dict(text="Sent: 0", font=font)),
+            ]),
+        ]
+        self.frames = []
+        for pady, padx, widgets in rows:
+            frame = tk.Frame(self.master)
+            frame.pack(pady=pady)
+            self.frames.append(frame)
+            for column, (name, widget_class, options) in enumerate(widgets):
+                widget = widget_class(frame, **options)
+                widget.grid(row=0, column=column, padx=padx)
+                setattr(self, name, widget)
+        self.command_entry.insert(0, self.engine.current_command)
 
         # Hover effects
         def on_enter(e):
@@ -260,30 +180,54 @@ class AutoTyperApp:
             btn.bind("<Leave>", on_leave)
             btn.config(cursor="hand2")
 
-        # Menu system
-        self.menu_bar = tk.Menu(master)
+    def build_menu(self):
+        self.menu_bar = tk.Menu(self.master)
         file_menu = tk.Menu(self.menu_bar, tearoff=0)
         file_menu.add_command(label="Import", command=self.open_file)
+        file_menu.add_command(label="Import Playlist", command=self.open_playlist)
         file_menu.add_command(label="Export", command=self.export_content)
         file_menu.add_command(label="Save", command=self.open_youtube)
         
-        settings_menu = tk.Menu(self.menu_bar, tearoff=0)
+        settings_menu = self.settings_menu = tk.Menu(self.menu_bar, tearoff=0)
         settings_menu.add_command(label="Timer", command=self.set_timer)
         settings_menu.add_command(label="Color", command=self.change_color)
+        settings_menu.add_command(label="Timing Stats", command=self.show_timing_stats)
+        settings_menu.add_command(label="Jobs", command=self.open_jobs)
+        settings_menu.add_checkbutton(
+            label="Type in Separate Process",
+            variable=self.isolated,
+            command=self.toggle_isolation
+        )
+        order_menu = tk.Menu(settings_menu, tearoff=0)
+        for order in ORDERS:
+            order_menu.add_radiobutton(
+                label=order.capitalize(),
+                variable=self.playlist_order,
+                value=order,
+                command=self.change_playlist_order
+            )
+        settings_menu.add_cascade(label="Playlist Order", menu=order_menu)
+        profiling_menu = tk.Menu(settings_menu, tearoff=0)
+        # The modes of profiling.MODES
+        for mode, label in (("off", "Off"), ("stages", "Stage Timings"),
+                            ("cprofile", "cProfile"), ("tracemalloc", "tracemalloc")):
+            profiling_menu.add_radiobutton(
+                label=label,
+                variable=self.profiling_mode,
+                value=mode,
+                command=self.change_profiling
+            )
+        profiling_menu.add_separator()
+        profiling_menu.add_command(label="Dump Profile...", command=self.dump_profile)
+        settings_menu.add_cascade(label="Profiling", menu=profiling_menu)
         
         self.menu_bar.add_cascade(label="File", menu=file_menu)
         self.menu_bar.add_cascade(label="Settings", menu=settings_menu)
-        master.config(menu=self.menu_bar)
-
-        # Transparency controls
-        self.start_inactivity_timer()
-        master.bind("<Button-1>", self.restore_opacity)
-        master.bind("<Motion>", self.reset_inactivity_timer)
-        master.bind("<KeyPress>", self.reset_inactivity_timer)
-        master.bind("<ButtonPress>", self.reset_inactivity_timer)
+        self.master.config(menu=self.menu_bar)
 
     def get_system_scaling(self):
         if sys.platform == 'win32':
+            import ctypes
             user32 = ctypes.windll.user32
             user32.SetProcessDPIAware()
             return user32.GetDpiForSystem() / 96
@@ -300,123 +244,207 @@ class AutoTyperApp:
         window.geometry(f"+{x}+{y}")
 
     def start_inactivity_timer(self):
-        self.inactivity_timer = self.master.after(120000, self.make_transparent)
-
-    def reset_inactivity_timer(self, event=None):
         if self.inactivity_timer:
             self.master.after_cancel(self.inactivity_timer)
+        self.last_activity = time.monotonic()
+        self.inactivity_timer = self.master.after(IDLE_TIMEOUT_S * 1000, self.check_inactivity)
+
+    def reset_inactivity_timer(self, event=None):
+        # Runs on every motion, key and button event, so it only records the
+        # time; check_inactivity compares against it when its timer comes due
+        self.last_activity = time.monotonic()
         if self.transparent:
             self.restore_opacity()
-        self.start_inactivity_timer()
+
+    def check_inactivity(self):
+        remaining = IDLE_TIMEOUT_S - (time.monotonic() - self.last_activity)
+        if remaining <= 0:
+            if not self.transparent:
+                self.make_transparent()
+            remaining = IDLE_TIMEOUT_S
+        self.inactivity_timer = self.master.after(int(remaining * 1000) + 1, self.check_inactivity)
 
     def make_transparent(self):
         self.transparent = True
         self.master.attributes("-alpha", 0.5)
 
     def restore_opacity(self, event=None):
-        self.transparent = False
-        self.master.attributes("-alpha", 1.0)
-        self.reset_inactivity_timer()
+        self.last_activity = time.monotonic()
+        if self.transparent:
+            self.transparent = False
+            self.master.attributes("-alpha", 1.0)
 
     def update_command(self):
-        new_command = self.command_entry.get()
-        with self.command_lock:
-            self.current_command = new_command
+        try:
+            self.engine.set_command(self.command_entry.get())
+        except ValueError as e:
+            from tkinter import messagebox
+            messagebox.showerror("Error", f"Invalid command: {e}")
 
     def start_typing(self):
+        from tkinter import messagebox
         try:
-            if self.typing_mode.get() == "count":
-                if self.type_count.get() < 1:
+            mode = self.typing_mode.get()
+            max_count = None
+            if mode == "count":
+                max_count = self.type_count.get()
+                if max_count < 1:
                     messagebox.showerror("Error", "Count must be at least 1")
                     return
-                self.current_count = 0
                 
-            self.stop_event.clear()
             self.start_button.config(state=tk.DISABLED)
             self.stop_button.config(state=tk.NORMAL)
             self.mode_selector.config(state="disabled")
             self.count_entry.config(state="disabled")
             
-            self.typing_thread = threading.Thread(target=self.typing_loop)
-            self.typing_thread.start()
+            self.rate_meter.reset()
+            self.status_label.config(text="Sent: 0")
+            self.engine.start(mode, max_count)
         except tk.TclError:
             messagebox.showerror("Error", "Invalid count value")
+        except (ImportError, RuntimeError) as e:
+            self.stop_typing()
+            messagebox.showerror("Error", f"Cannot send keystrokes: {e}")
 
     def stop_typing(self):
-        self.stop_event.set()
+        self.engine.stop()
         self.start_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         self.mode_selector.config(state="readonly")
         self.count_entry.config(state="normal")
 
-    def typing_loop(self):
-        mode = self.typing_mode.get()
-        max_count = self.type_count.get() if mode == "count" else None
-        
-        while not self.stop_event.is_set():
-            if self.stop_event.wait(self.delay):
-                break
-            
-            with self.command_lock:
-                command = self.current_command
-                
-            pyautogui.typewrite(command)
-            pyautogui.hotkey('enter')
-            
-            if mode == "count":
-                self.current_count += 1
-                if self.current_count >= max_count:
-                    self.stop_typing()
-                    break
+    def sync_control(self):
+        # Shows what a control socket request changed
+        self.command_entry.delete(0, tk.END)
+        self.command_entry.insert(0, self.engine.current_command)
+        running = self.engine.is_running()
+        self.start_button.config(state=tk.DISABLED if running else tk.NORMAL)
+        self.stop_button.config(state=tk.NORMAL if running else tk.DISABLED)
+        self.mode_selector.config(state="disabled" if running else "readonly")
+        self.count_entry.config(state="disabled" if running else "normal")
+
+    def show_progress(self, count):
+        rate = self.rate_meter.update(count)
+        self.status_label.config(text=f"Sent: {count}  ({rate:.2f}/s)")
+
+    def show_typing_error(self, error):
+        from tkinter import messagebox
+        self.stop_typing()
+        messagebox.showerror("Typing Error", str(error))
 
     def open_file(self):
+        from tkinter import filedialog, messagebox
         file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
         if file_path:
             try:
-                with open(file_path, "r") as file:
-                    content = file.read(100)
+                with open(file_path, "r", encoding="utf-8") as file:
+                    content = file.read(MAX_IMPORT_CHARS)
                     self.command_entry.delete(0, tk.END)
                     self.command_entry.insert(0, content)
                     self.update_command()
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to open file: {e}")
 
+    def open_playlist(self, file_path=None):
+        from tkinter import filedialog, messagebox
+        if file_path is None:
+            file_path = filedialog.askopenfilename(filetypes=[("Text Files", "*.txt")])
+        if file_path:
+            try:
+                playlist = Playlist(file_path, order=self.playlist_order.get())
+            except (OSError, ValueError) as e:
+                messagebox.showerror("Error", f"Failed to open playlist: {e}")
+                return
+            self.engine.set_playlist(playlist)
+            self.status_label.config(
+                text=f"Playlist: {os.path.basename(file_path)} ({len(playlist)} lines)"
+            )
+
+    def change_playlist_order(self):
+        # Reopening is instant thanks to the saved line index
+        if self.engine.playlist is not None:
+            self.open_playlist(self.engine.playlist.path)
+
     def export_content(self):
+        from tkinter import filedialog, messagebox
         file_path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text Files", "*.txt")])
         if file_path:
             try:
-                with open(file_path, "w") as file:
-                    file.write(self.current_command)
+                with open(file_path, "w", encoding="utf-8") as file:
+                    file.write(self.engine.current_command)
                 messagebox.showinfo("Success", "Content exported successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to export content: {e}")
 
     def open_youtube(self):
+        import webbrowser
         webbrowser.open("https://www.youtube.com/@zarusw")
 
     def set_timer(self):
+        if self.timer_dialog is None:
+            self.build_timer_dialog()
+        self.delay_entry.delete(0, tk.END)
+        self.delay_entry.insert(0, f"{self.engine.delay:g}")
+        self.rate_label.config(text=self.engine.effective_rate_text())
+        self.timer_dialog.deiconify()
+        self.center_child_window(self.timer_dialog)
+        self.timer_dialog.lift()
+        if sys.platform.startswith('linux') or sys.platform == 'darwin':
+            self.timer_dialog.grab_set()
+
+    def hide_timer_dialog(self):
+        self.timer_dialog.grab_release()
+        self.timer_dialog.withdraw()
+
+    def build_timer_dialog(self):
         self.timer_dialog = tk.Toplevel(self.master)
+        self.timer_dialog.withdraw()
         self.timer_dialog.title("Set Timer")
         self.timer_dialog.attributes("-topmost", True)
         self.timer_dialog.resizable(False, False)
+        self.timer_dialog.protocol("WM_DELETE_WINDOW", self.hide_timer_dialog)
         
         if sys.platform == 'win32':
             self.timer_dialog.attributes("-toolwindow", 1)
         if sys.platform.startswith('linux') or sys.platform == 'darwin':
             self.timer_dialog.transient(self.master)
-            self.timer_dialog.grab_set()
-
-        self.center_child_window(self.timer_dialog)
         
         tk.Label(self.timer_dialog, text="Delay (1-60s):").pack(pady=5)
         self.delay_entry = tk.Entry(self.timer_dialog, width=10)
         self.delay_entry.pack(pady=5)
-        self.delay_entry.insert(0, str(self.delay))
+        tk.Checkbutton(
+            self.timer_dialog,
+            text="Catch up missed sends",
+            variable=self.catch_up
+        ).pack(pady=2)
+        tk.Checkbutton(
+            self.timer_dialog,
+            text="Stop mid-word",
+            variable=self.hard_abort
+        ).pack(pady=2)
+        repeat_frame = tk.Frame(self.timer_dialog)
+        repeat_frame.pack(pady=2)
+        tk.Label(repeat_frame, text="Sends per tick:").pack(side=tk.LEFT)
+        tk.Spinbox(repeat_frame, from_=1, to=100, textvariable=self.repeats, width=5).pack(side=tk.LEFT, padx=2)
+
+        # Rate limiting, blank fields are off
+        rate_frame = tk.Frame(self.timer_dialog)
+        rate_frame.pack(pady=5, padx=5)
+        for row, (name, label) in enumerate([
+            ("rate", "Rate (per min):"),
+            ("burst", "Burst:"),
+            ("per_minute", "Max per minute:"),
+            ("per_hour", "Max per hour:"),
+        ]):
+            tk.Label(rate_frame, text=label).grid(row=row, column=0, sticky="w")
+            tk.Entry(rate_frame, textvariable=self.rate_settings[name], width=8).grid(row=row, column=1, padx=2)
+        self.rate_label = tk.Label(self.timer_dialog)
+        self.rate_label.pack(pady=2)
         
         btn_frame = tk.Frame(self.timer_dialog)
         btn_frame.pack(pady=5)
         tk.Button(btn_frame, text="OK", command=self.update_delay).pack(side=tk.LEFT, padx=5)
-        tk.Button(btn_frame, text="Cancel", command=self.timer_dialog.destroy).pack(side=tk.RIGHT, padx=5)
+        tk.Button(btn_frame, text="Cancel", command=self.hide_timer_dialog).pack(side=tk.RIGHT, padx=5)
 
     def center_child_window(self, child_window):
         self.master.update_idletasks()
@@ -434,24 +462,212 @@ class AutoTyperApp:
         child_window.geometry(f"+{x}+{y}")
 
     def update_delay(self):
+        from tkinter import messagebox
         try:
             new_delay = int(self.delay_entry.get())
             if 1 <= new_delay <= 60:
-                self.delay = new_delay
-                messagebox.showinfo("Timer Updated", f"Delay set to {self.delay}s")
-                self.timer_dialog.destroy()
+                self.engine.set_delay(new_delay)
+                self.engine.set_policy(CATCH_UP if self.catch_up.get() else SKIP)
+                self.engine.hard_abort = self.hard_abort.get()
+                self.engine.repeats = max(self.repeats.get(), 1)
+                self.engine.set_limiter(RateLimiter.from_settings(
+                    *(self.read_rate_setting(name) for name in ("rate", "burst", "per_minute", "per_hour"))
+                ))
+                messagebox.showinfo(
+                    "Timer Updated",
+                    f"Delay set to {new_delay}s\n{self.engine.effective_rate_text()}"
+                )
+                self.hide_timer_dialog()
             else:
                 messagebox.showerror("Error", "Please enter a value between 1 and 60")
-        except ValueError:
+        except (ValueError, tk.TclError):
             messagebox.showerror("Error", "Invalid input. Please enter a number")
 
+    def read_rate_setting(self, name):
+        text = self.rate_settings[name].get().strip()
+        if not text:
+            return None
+        return float(text)
+
+    def open_jobs(self):
+        if self.jobs_dialog is not None:
+            self.jobs_dialog.deiconify()
+            self.jobs_dialog.lift()
+            self.refresh_jobs()
+            return
+
+        self.jobs_dialog = tk.Toplevel(self.master)
+        self.jobs_dialog.title("Jobs")
+        self.jobs_dialog.attributes("-topmost", True)
+        self.jobs_dialog.protocol("WM_DELETE_WINDOW", self.jobs_dialog.withdraw)
+
+        list_frame = tk.Frame(self.jobs_dialog)
+        list_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        scrollbar = tk.Scrollbar(list_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.jobs_list = tk.Listbox(
+            list_frame,
+            width=50,
+            height=8,
+            font=self.default_font,
+            yscrollcommand=scrollbar.set
+        )
+        self.jobs_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.config(command=self.jobs_list.yview)
+
+        add_frame = tk.Frame(self.jobs_dialog)
+        add_frame.pack(pady=5)
+        tk.Label(add_frame, text="Text:").grid(row=0, column=0, padx=2)
+        self.job_command_entry = tk.Entry(add_frame, width=16)
+        self.job_command_entry.grid(row=0, column=1, padx=2)
+        tk.Label(add_frame, text="Delay:").grid(row=0, column=2, padx=2)
+        self.job_delay_entry = tk.Entry(add_frame, width=5)
+        self.job_delay_entry.insert(0, "12")
+        self.job_delay_entry.grid(row=0, column=3, padx=2)
+        tk.Label(add_frame, text="Times:").grid(row=0, column=4, padx=2)
+        self.job_count_entry = tk.Entry(add_frame, width=5)
+        self.job_count_entry.grid(row=0, column=5, padx=2)
+        tk.Button(add_frame, text="Add", command=self.add_job).grid(row=0, column=6, padx=2)
+
+        btn_frame = tk.Frame(self.jobs_dialog)
+        btn_frame.pack(pady=5)
+        tk.Button(btn_frame, text="Pause", command=lambda: self.change_job(self.job_runner.pause)).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Resume", command=lambda: self.change_job(self.job_runner.resume)).pack(side=tk.LEFT, padx=5)
+        tk.Button(btn_frame, text="Remove", command=lambda: self.change_job(self.job_runner.remove)).pack(side=tk.LEFT, padx=5)
+
+        self.center_child_window(self.jobs_dialog)
+        self.refresh_jobs()
+
+    def add_job(self):
+        from tkinter import messagebox
+        command = self.job_command_entry.get()
+        try:
+            delay = float(self.job_delay_entry.get())
+            count_text = self.job_count_entry.get().strip()
+            count = int(count_text) if count_text else None
+        except ValueError:
+            messagebox.showerror("Error", "Delay and times must be numbers")
+            return
+        if not command or delay <= 0 or (count is not None and count < 1):
+            messagebox.showerror("Error", "Enter a text, a positive delay and at least 1 time")
+            return
+        try:
+            self.job_runner.add(command, delay, count)
+        except ValueError as e:
+            messagebox.showerror("Error", f"Invalid command: {e}")
+            return
+        except (ImportError, RuntimeError) as e:
+            messagebox.showerror("Error", f"Cannot send keystrokes: {e}")
+            return
+        self.refresh_jobs()
+
+    def change_job(self, action):
+        selection = self.jobs_list.curselection()
+        if selection:
+            job_id = int(self.jobs_list.get(selection[0]).split(".", 1)[0])
+            try:
+                action(job_id)
+            except KeyError:
+                pass
+            self.refresh_jobs()
+
+    def refresh_jobs(self):
+        if self.jobs_dialog is None or self.jobs_dialog.state() == "withdrawn":
+            return
+        selection = self.jobs_list.curselection()
+        self.jobs_list.delete(0, tk.END)
+        for job_id, command, delay, count, sent, state in self.job_runner.snapshot():
+            total = "inf" if count is None else count
+            self.jobs_list.insert(tk.END, f"{job_id}. {command}  every {delay:g}s  {sent}/{total}  {state}")
+        if selection and selection[0] < self.jobs_list.size():
+            self.jobs_list.selection_set(selection[0])
+
+    def connect_engine(self):
+        self.engine.on_sent = lambda count: self.pump.post("progress", count)
+        self.engine.on_finished = lambda: self.pump.post("finished")
+        self.engine.on_error = lambda e: self.pump.post("error", e)
+
+    def toggle_isolation(self):
+        # Swaps the in-process engine for one running in a child process (or
+        # back), carrying over the command and timer settings
+        from tkinter import messagebox
+        if self.engine.is_running():
+            self.isolated.set(not self.isolated.get())
+            messagebox.showerror("Error", "Stop typing first")
+            return
+        old = self.engine
+        if self.isolated.get():
+            from isolated import IsolatedEngine
+            new = IsolatedEngine(command=old.current_command, delay=old.delay, policy=old.policy)
+        else:
+            new = AsyncTypingEngine(command=old.current_command, delay=old.delay, policy=old.policy)
+        new.hard_abort = old.hard_abort
+        new.repeats = old.repeats
+        new.set_limiter(old.limiter)
+        if old.playlist is not None:
+            new.set_playlist(Playlist(old.playlist.path, order=old.playlist.order))
+        # Profiling instruments the typing worker, which the separate process
+        # keeps out of reach, so it is switched off and greyed out there
+        if self.isolated.get():
+            if self.profiling_mode.get() != "off":
+                self.profiling_mode.set("off")
+                self.change_profiling()
+            self.settings_menu.entryconfig("Profiling", state=tk.DISABLED)
+        else:
+            new.instrumentation = self.instrumentation
+            self.settings_menu.entryconfig("Profiling", state=tk.NORMAL)
+        self.engine = new
+        self.connect_engine()
+        if self.control is not None:
+            self.control.attach(new)
+        self.job_runner.engine.inject_lock = new.inject_lock
+        old.close()
+
+    def show_timing_stats(self):
+        from tkinter import messagebox
+        report = self.engine.timing_report()
+        if self.instrumentation is not None and self.instrumentation.mode != "off":
+            report += "\n\n" + self.instrumentation.report()
+        messagebox.showinfo("Timing Stats", report)
+
+    def change_profiling(self):
+        # The worker picks the new mode up at its next send
+        mode = self.profiling_mode.get()
+        if self.instrumentation is None:
+            from profiling import Instrumentation
+            self.instrumentation = Instrumentation()
+        self.instrumentation.set_mode(mode)
+        if isinstance(self.engine, TypingEngine):
+            self.engine.instrumentation = self.instrumentation
+        self.pump.timer = self.instrumentation.pump if mode != "off" else None
+
+    def dump_profile(self):
+        from tkinter import filedialog, messagebox
+        if self.instrumentation is None:
+            messagebox.showerror("Error", "Turn profiling on and type for a while first")
+            return
+        directory = filedialog.askdirectory()
+        if directory:
+            try:
+                paths = self.instrumentation.dump(directory)
+            except (OSError, RuntimeError) as e:
+                messagebox.showerror("Error", f"Failed to dump profile: {e}")
+                return
+            messagebox.showinfo("Success", "\n".join(paths) or "Nothing was recorded yet")
+
     def change_color(self):
+        from tkinter import colorchooser
         color = colorchooser.askcolor()[1]
         if color:
             self.master.config(bg=color)
+            for frame in self.frames:
+                frame.config(bg=color)
             self.command_label.config(bg=color)
 
 if __name__ == "__main__":
+    import multiprocessing
+    # The separate typing process re-runs this file in a frozen build
+    multiprocessing.freeze_support()
     root = tk.Tk()
     root.iconbitmap("D:\\code\\texttyper\\text_typer_GUI.ico")
     app = AutoTyperApp(root)
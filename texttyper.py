@@ -0,0 +1,317 @@
+import time
+
+_STARTED = time.perf_counter()
+
+import argparse
+import importlib
+import os
+import signal
+import sys
+import threading
+
+from backends import RecordingBackend, get_backend
+from engine import TypingEngine
+from paste import DEFAULT_PASTE_THRESHOLD
+from playlist import ORDERS, SEQUENTIAL, Playlist
+from ratelimit import RateLimiter
+from scheduler import CATCH_UP, SKIP, VirtualClock
+
+# Headless entry point. Nothing here imports tkinter, so on Xvfb runners with
+# the xtest or uinput backend no GUI toolkit is loaded at all (the pyautogui
+# backend still pulls it in through pymsgbox).
+#
+#   python texttyper.py run --text "owo hunt" --delay 12 --count 10
+#   python texttyper.py daemon --file command.txt --delay 12 --pidfile typer.pid
+#   python texttyper.py run --playlist corpus.txt --order shuffle --once
+#   python texttyper.py run --text "hunt {n} at {time:%H:%M}" --count 5
+#   python texttyper.py daemon --text "owo hunt" --delay 1 --rate 30 --per-hour 1000
+#   python texttyper.py daemon --text "owo hunt" --control /tmp/texttyper.sock --idle
+#   python texttyper.py run --text "owo hunt" --window "Discord" --window-strategy focus
+#   python texttyper.py simulate --text "owo hunt" --delay 12 --per-hour 250 --hours 24
+
+
+def read_text(args):
+    if args.playlist:
+        return ""
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as file:
+            return file.read().rstrip("\n")
+    return args.text
+
+
+def load_detector(spec):
+    # "module:function", called with each sent command; True means throttled
+    module_name, _, function_name = spec.partition(":")
+    if not function_name:
+        raise ValueError(f"--throttle-detector needs module:function, got {spec!r}")
+    try:
+        return getattr(importlib.import_module(module_name), function_name)
+    except (ImportError, AttributeError) as e:
+        raise ValueError(f"Cannot load throttle detector {spec!r}: {e}")
+
+
+def build_limiter(args, clock=time.monotonic_ns):
+    if not (args.rate or args.per_minute or args.per_hour or args.throttle_detector):
+        return None
+    return RateLimiter(
+        clock=clock,
+        rate=args.rate / 60 if args.rate else None,
+        burst=args.burst,
+        per_minute=args.per_minute,
+        per_hour=args.per_hour,
+        throttle_detector=load_detector(args.throttle_detector) if args.throttle_detector else None,
+        backoff_s=args.backoff,
+    )
+
+
+def build_backend(args):
+    if not (args.window or args.backend == "xwindow"):
+        return get_backend(args.backend)
+    # Without --window the xwindow backend waits for a click on the target
+    backend = get_backend("xwindow", window=args.window, strategy=args.window_strategy)
+    ids = ",".join(f"0x{window.id:x}" for window in backend.windows)
+    log(args, f"typing into window {ids} (pass --window {ids} to skip picking)")
+    return backend
+
+
+def build_engine(args, backend=None, clock=time.monotonic_ns):
+    engine = TypingEngine(
+        backend=backend or build_backend(args),
+        command=read_text(args),
+        delay=args.delay,
+        policy=CATCH_UP if args.catch_up else SKIP,
+        start_immediately=args.now,
+        hard_abort=args.hard_abort,
+        paste_threshold=None if args.no_paste else args.paste_threshold,
+        clock=clock,
+    )
+    engine.repeats = args.repeat
+    if args.playlist:
+        engine.set_playlist(Playlist(args.playlist, order=args.order, loop=not args.once))
+    engine.set_limiter(build_limiter(args, clock))
+    return engine
+
+
+def log(args, message):
+    if args.verbose:
+        print(message, file=sys.stderr, flush=True)
+
+
+def wait_for(engine):
+    # Join in short slices so Ctrl+C and signal handlers get to run on every
+    # platform
+    try:
+        while engine.is_running():
+            engine.thread.join(0.25)
+    except KeyboardInterrupt:
+        engine.stop()
+        engine.thread.join()
+
+
+def run(args):
+    engine = build_engine(args)
+    errors = []
+    engine.on_error = errors.append
+    if args.verbose:
+        engine.on_sent = lambda count: log(args, f"sent {count}")
+
+    mode, count = ("count", args.count) if args.count else ("infinite", None)
+    engine.start(mode, count)
+    log(args, f"started in {(time.perf_counter() - _STARTED) * 1000:.1f} ms")
+    wait_for(engine)
+
+    if args.stats:
+        print(engine.timing_report(), file=sys.stderr)
+    if errors:
+        print(f"texttyper: {errors[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def simulate(args):
+    # The schedule run against a virtual clock and a recording backend:
+    # prints when every send would go out, in seconds from the start,
+    # without waiting for any of it
+    clock = VirtualClock()
+    backend = RecordingBackend(clock=clock)
+    # Nothing reaches the screen, so nothing may touch the clipboard either
+    args.no_paste = True
+    engine = build_engine(args, backend=backend, clock=clock)
+    errors = []
+    engine.on_error = errors.append
+
+    started = time.perf_counter()
+    if args.count:
+        engine.simulate("count", args.count, until_s=args.hours * 3600 if args.hours else None)
+    else:
+        engine.simulate("infinite", until_s=(args.hours or 24) * 3600)
+    elapsed = time.perf_counter() - started
+
+    timeline = backend.timeline()
+    if not args.quiet:
+        for ns, line in timeline:
+            print(f"{ns / 1e9:12.3f}  {line}")
+    print(f"{len(timeline)} sends over {clock() / 3.6e12:g} h simulated in {elapsed * 1000:.1f} ms",
+          file=sys.stderr)
+    if args.stats:
+        print(engine.timing_report(), file=sys.stderr)
+    engine.close()
+    if errors:
+        print(f"texttyper: {errors[0]}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def daemon(args):
+    engine = build_engine(args)
+    engine.on_error = lambda e: print(f"texttyper: {e}", file=sys.stderr, flush=True)
+
+    stopped = threading.Event()
+
+    def stop(signum, frame):
+        stopped.set()
+        engine.stop()
+
+    def reload(signum, frame):
+        if args.file:
+            engine.set_command(read_text(args))
+            log(args, f"reloaded {args.file}")
+
+    def report(signum, frame):
+        print(engine.timing_report(), file=sys.stderr, flush=True)
+
+    def throttled(signum, frame):
+        engine.signal_throttled()
+        log(args, "throttled, backing off")
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, reload)
+        signal.signal(signal.SIGUSR1, report)
+        signal.signal(signal.SIGUSR2, throttled)
+
+    server = None
+    if args.control:
+        from control import ControlServer
+        server = ControlServer(engine, args.control)
+        server.start()
+
+    if args.pidfile:
+        with open(args.pidfile, "w") as file:
+            file.write(str(os.getpid()))
+    try:
+        if not args.idle:
+            engine.start("infinite")
+        log(args, f"daemon ready in {(time.perf_counter() - _STARTED) * 1000:.1f} ms")
+        if server is not None:
+            # Runs come and go through the socket; only a signal ends this
+            while not stopped.wait(0.5):
+                pass
+        else:
+            wait_for(engine)
+    finally:
+        if server is not None:
+            server.close()
+        if args.pidfile and os.path.exists(args.pidfile):
+            os.remove(args.pidfile)
+    return 0
+
+
+def windows(args):
+    from Xlib import display
+    from backends import client_windows, window_name
+    connection = display.Display()
+    try:
+        for window in client_windows(connection):
+            print(f"0x{window.id:x}  {window_name(connection, window)}")
+    finally:
+        connection.close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="texttyper", description="Headless auto typer")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    source = common.add_mutually_exclusive_group(required=True)
+    source.add_argument("--text", help="command to type")
+    source.add_argument("--file", help="read the command from a UTF-8 text file")
+    source.add_argument("--playlist", help="send a text file one line at a time")
+    common.add_argument("--order", choices=ORDERS, default=SEQUENTIAL, help="playlist order (default: %(default)s)")
+    common.add_argument("--once", action="store_true", help="stop after one pass over the playlist")
+    common.add_argument("--delay", type=float, default=12, help="seconds between sends (default: 12)")
+    common.add_argument("--backend", help="keystroke backend (default: TEXTTYPER_BACKEND or auto)")
+    common.add_argument("--window", help="X11 window ids or title patterns to type into, comma separated")
+    common.add_argument("--window-strategy", choices=("send", "focus"),
+                        help="deliver with XSendEvent or by briefly moving focus (default: send)")
+    common.add_argument("--now", action="store_true", help="send once immediately instead of after one delay")
+    common.add_argument("--catch-up", action="store_true", help="fire missed ticks instead of skipping them")
+    common.add_argument("--repeat", type=int, default=1,
+                        help="sends per tick, injected together; ignored under rate limits (default: 1)")
+    common.add_argument("--hard-abort", action="store_true", help="stop mid-word on Stop")
+    common.add_argument("--paste-threshold", type=int, default=DEFAULT_PASTE_THRESHOLD,
+                        help="paste commands at least this long (default: %(default)s)")
+    common.add_argument("--no-paste", action="store_true", help="always type, never paste")
+    common.add_argument("--rate", type=float, help="at most this many sends per minute on average")
+    common.add_argument("--burst", type=int, default=1, help="sends allowed back to back under --rate (default: 1)")
+    common.add_argument("--per-minute", type=int, help="hard cap on sends in any 60 s window")
+    common.add_argument("--per-hour", type=int, help="hard cap on sends in any hour")
+    common.add_argument("--throttle-detector", metavar="MODULE:FUNCTION",
+                        help="called after every send; returning True backs off")
+    common.add_argument("--backoff", type=float, default=5.0, help="first backoff in seconds, doubling (default: 5)")
+    common.add_argument("-v", "--verbose", action="store_true")
+
+    run_parser = commands.add_parser("run", parents=[common], help="type a command, then exit")
+    run_parser.add_argument("--count", type=int, default=0, help="number of sends, 0 for infinite")
+    run_parser.add_argument("--stats", action="store_true", help="print timing stats on exit")
+    run_parser.set_defaults(handler=run)
+
+    simulate_parser = commands.add_parser(
+        "simulate", parents=[common], help="print the send timeline of a run without waiting for it",
+    )
+    simulate_parser.add_argument("--count", type=int, default=0, help="number of sends, 0 for infinite")
+    simulate_parser.add_argument("--hours", type=float, help="virtual hours to run (default: 24 when infinite)")
+    simulate_parser.add_argument("--stats", action="store_true", help="print timing stats at the end")
+    simulate_parser.add_argument("-q", "--quiet", action="store_true", help="only print the summary")
+    simulate_parser.set_defaults(handler=simulate)
+
+    daemon_parser = commands.add_parser(
+        "daemon", parents=[common],
+        help="type forever; SIGTERM stops, SIGHUP reloads --file, SIGUSR1 prints stats, SIGUSR2 backs off",
+    )
+    daemon_parser.add_argument("--pidfile")
+    daemon_parser.add_argument("--control", metavar="SOCKET",
+                               help="accept JSON commands on this Unix socket (see control.py)")
+    daemon_parser.add_argument("--idle", action="store_true", help="wait for a start command instead of typing")
+    daemon_parser.set_defaults(handler=daemon)
+
+    windows_parser = commands.add_parser("windows", help="list X11 windows for --window")
+    windows_parser.set_defaults(handler=windows)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command in ("run", "simulate") and args.count < 0:
+        print("texttyper: --count must be 0 or more", file=sys.stderr)
+        return 2
+    if getattr(args, "delay", 0) < 0:
+        print("texttyper: --delay must be 0 or more", file=sys.stderr)
+        return 2
+    if getattr(args, "repeat", 1) < 1:
+        print("texttyper: --repeat must be at least 1", file=sys.stderr)
+        return 2
+    try:
+        return args.handler(args)
+    except ValueError as e:
+        print(f"texttyper: {e}", file=sys.stderr)
+        return 2
+    except (ImportError, RuntimeError) as e:
+        print(f"texttyper: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+# Colour palettes for the V2 GUI. Every widget is created with one of the
+# role styles below and never restyled afterwards; switching theme only
+# reconfigures these style names, so it costs the same however many widgets
+# and windows are open, and windows created later pick the theme up simply
+# by using the same names.
+THEMES = {
+    "Light": {
+        "background": "#FFFFFF",
+        "foreground": "#000000",
+        "field": "#f0f0f0",
+        "accent": "#4CAF50",
+        "accent_active": "#45a049",
+        "accent_foreground": "white",
+    },
+    "Dark": {
+        "background": "#2d2d2d",
+        "foreground": "#FFFFFF",
+        "field": "#404040",
+        "accent": "#2196F3",
+        "accent_active": "#1976D2",
+        "accent_foreground": "white",
+    },
+}
+
+ROLES = (
+    "App.TFrame",
+    "App.TLabel",
+    "App.TButton",
+    "App.TCheckbutton",
+    "App.TEntry",
+    "App.TSpinbox",
+    "App.TCombobox",
+)
+
+
+class ThemeEngine:
+    def __init__(self, style, scale_factor=1.0, base="clam"):
+        self.style = style
+        self.current = None
+        style.theme_use(base)
+        style.configure(".", font=("Segoe UI", int(9 * scale_factor)))
+        style.configure("App.TButton", padding=4, relief="raised")
+
+    def apply(self, name):
+        if name == self.current:
+            return
+        palette = THEMES[name]
+        background = palette["background"]
+        foreground = palette["foreground"]
+        field = palette["field"]
+        style = self.style
+
+        style.configure("App.TFrame", background=background)
+        style.configure("App.TLabel", background=background, foreground=foreground)
+        style.configure("App.TCheckbutton", background=background, foreground=foreground)
+        style.map("App.TCheckbutton", background=[("active", background)])
+        style.configure(
+            "App.TButton",
+            background=palette["accent"],
+            foreground=palette["accent_foreground"],
+            bordercolor=palette["accent"],
+            focuscolor=palette["accent"],
+        )
+        style.map("App.TButton", background=[("active", palette["accent_active"])])
+        for role in ("App.TEntry", "App.TSpinbox", "App.TCombobox"):
+            style.configure(role, fieldbackground=field, foreground=foreground, background=background)
+        style.map("App.TCombobox", fieldbackground=[("readonly", field)])
+        # The combobox drop-down is a plain Tk listbox created on first use
+        style.master.option_add("*TCombobox*Listbox.background", field)
+        style.master.option_add("*TCombobox*Listbox.foreground", foreground)
+        self.current = name
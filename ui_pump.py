@@ -0,0 +1,96 @@
+import queue
+import threading
+import time
+
+
+class UIPump:
+    # Worker threads never touch Tk. They post events here and a single
+    # master.after loop on the Tk thread drains them. Kinds listed in
+    # `coalesce` only keep their latest payload, so a fast send rate costs
+    # one handler call per pump instead of one per send.
+    def __init__(self, master, interval_ms=100, coalesce=("progress",)):
+        self.master = master
+        self.interval_ms = interval_ms
+        self.coalesce = frozenset(coalesce)
+        self.events = queue.SimpleQueue()
+        self.latest = {}
+        self.latest_lock = threading.Lock()
+        self.handlers = {}
+        self.after_id = None
+        # Optional profiling.StageTimer recording how late each round ran
+        # and how long its handlers took
+        self.timer = None
+        self.due_ns = None
+
+    def subscribe(self, kind, handler):
+        self.handlers.setdefault(kind, []).append(handler)
+
+    def post(self, kind, payload=None):
+        if kind in self.coalesce:
+            with self.latest_lock:
+                self.latest[kind] = payload
+        else:
+            self.events.put((kind, payload))
+
+    def start(self):
+        if self.after_id is None:
+            self.schedule()
+
+    def schedule(self):
+        if self.timer is not None:
+            self.due_ns = time.perf_counter_ns() + self.interval_ms * 1000000
+        self.after_id = self.master.after(self.interval_ms, self.pump)
+
+    def stop(self):
+        if self.after_id is not None:
+            self.master.after_cancel(self.after_id)
+            self.after_id = None
+
+    def pump(self):
+        timer = self.timer
+        if timer is not None:
+            started = time.perf_counter_ns()
+            late = max(started - self.due_ns, 0) if self.due_ns is not None else 0
+        with self.latest_lock:
+            latest, self.latest = self.latest, {}
+        # Coalesced state first so a "finished" event sees the final count
+        for kind, payload in latest.items():
+            self.dispatch(kind, payload)
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            self.dispatch(kind, payload)
+        if timer is not None:
+            timer.record(started, late, time.perf_counter_ns() - started)
+        self.schedule()
+
+    def dispatch(self, kind, payload):
+        for handler in self.handlers.get(kind, ()):
+            handler(payload)
+
+
+class RateMeter:
+    # Sends per second over a sliding window of pump samples
+    def __init__(self, window_s=5.0, clock=time.monotonic):
+        self.window_s = window_s
+        self.clock = clock
+        self.samples = []
+
+    def reset(self):
+        self.samples.clear()
+
+    def update(self, count):
+        now = self.clock()
+        samples = self.samples
+        samples.append((now, count))
+        while len(samples) > 2 and now - samples[0][0] > self.window_s:
+            samples.pop(0)
+        return self.rate()
+
+    def rate(self):
+        if len(self.samples) < 2:
+            return 0.0
+        (t0, c0), (t1, c1) = self.samples[0], self.samples[-1]
+        return (c1 - c0) / (t1 - t0) if t1 > t0 else 0.0